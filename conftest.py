@@ -2,18 +2,16 @@ import logging
 
 import pytest
 
+from pycmor.core.config import _reset_default_manager
+from pycmor.core.controlled_vocabularies import _cached_from_directory
+from pycmor.core.resource_locator import ResourceLocator
+from pycmor.data_request.cmip7_interface import CMIP7Interface
 from tests.utils.constants import TEST_ROOT  # noqa: F401
 
-
-@pytest.fixture(scope="function", autouse=True)
-def suppress_third_party_logs():
-    """Suppress noisy INFO logs from distributed/dask/prefect during tests.
-
-    This runs before every test function to ensure logs are suppressed even
-    when distributed.Client creates new workers.
-    """
-    # Set WARNING level for all noisy distributed/dask/prefect loggers
-    loggers_to_suppress = [
+# Noisy distributed/dask/prefect loggers, set to WARNING level for the test run
+LOGGERS_TO_SUPPRESS = tuple(
+    logging.getLogger(logger_name)
+    for logger_name in (
         "distributed",
         "distributed.core",
         "distributed.scheduler",
@@ -23,10 +21,34 @@ def suppress_third_party_logs():
         "distributed.worker.memory",
         "distributed.comm",
         "prefect",
-    ]
+    )
+)
 
-    for logger_name in loggers_to_suppress:
-        logging.getLogger(logger_name).setLevel(logging.WARNING)
+
+@pytest.fixture(scope="session", autouse=True)
+def suppress_third_party_logs():
+    """Suppress noisy INFO logs from distributed/dask/prefect during tests.
+
+    Logger levels are process-wide, so this only needs to run once per test
+    session; loggers created later by ``distributed.Client`` workers inherit
+    the level from their (already configured) parents.
+    """
+    for third_party_logger in LOGGERS_TO_SUPPRESS:
+        third_party_logger.setLevel(logging.WARNING)
+
+
+@pytest.fixture(autouse=True)
+def clear_process_caches():
+    """Clear the caches pycmor keeps for the lifetime of the process.
+
+    Located resources, loaded metadata and the like are remembered across
+    calls, so without this, results found in one test leak into the next.
+    """
+    _reset_default_manager()
+    ResourceLocator.clear_cache()
+    CMIP7Interface.clear_cache()
+    _cached_from_directory.cache_clear()
+    yield
 
 
 pytest_plugins = [
@@ -43,10 +65,5 @@ pytest_plugins = [
     "tests.fixtures.fake_data.fesom_mesh",
     "tests.fixtures.fake_filesystem",
     "tests.fixtures.sample_rules",
-    "tests.fixtures.config_files",
-    "tests.fixtures.CV_Dir",
-    "tests.fixtures.CMIP_Tables_Dir",
-    "tests.fixtures.config_files",
-    "tests.fixtures.CV_Dir",
     "tests.fixtures.data_requests",
 ]
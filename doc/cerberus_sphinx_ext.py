@@ -1,4 +1,5 @@
 import importlib.util
+from collections.abc import Mapping
 
 from cerberus import Validator
 from docutils import nodes
@@ -94,7 +95,7 @@ class CerberusSchemaDirective(SphinxDirective):
         tgroup += tbody
 
         def add_schema_to_table(schema, tbody, parent_key="", level=0):
-            if isinstance(schema, dict):
+            if isinstance(schema, Mapping):
                 for key, value in schema.items():
                     add_field_to_table(key, value, tbody, parent_key, level)
             elif isinstance(schema, list):
@@ -177,7 +178,10 @@ class CerberusSchemaDirective(SphinxDirective):
             description = value.get("help", "")
             constraints = []
             if "allowed" in value:
-                constraints.append(f"Allowed: {', '.join(map(str, value['allowed']))}")
+                allowed = value["allowed"]
+                if isinstance(allowed, (set, frozenset)):
+                    allowed = sorted(allowed)
+                constraints.append(f"Allowed: {', '.join(map(str, allowed))}")
             if "excludes" in value:
                 constraints.append(f"Excludes: {value['excludes']}")
             if "is_qualname" in value:
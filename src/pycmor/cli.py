@@ -17,7 +17,7 @@ from .core.cmorizer import CMORizer
 from .core.filecache import fc
 from .core.logging import add_report_logger, logger
 from .core.ssh_tunnel import ssh_tunnel_cli
-from .core.validate import GENERAL_VALIDATOR, PIPELINES_VALIDATOR, RULES_VALIDATOR
+from .core.validate import get_config_validator
 from .dev import utils as dev_utils
 from .fesom_1p4.nodes_to_levels import convert
 from .scripts.update_dimensionless_mappings import update_dimensionless_mappings
@@ -205,29 +205,13 @@ def config(config_file):
     logger.info(f"Checking if a CMORizer can be built from {config_file}")
     with open(config_file, "r") as f:
         cfg = yaml.safe_load(f)
-        if "pipelines" in cfg:
-            pipelines = cfg["pipelines"]
-            PIPELINES_VALIDATOR.validate({"pipelines": pipelines})
-        if "rules" in cfg:
-            rules = cfg["rules"]
-            RULES_VALIDATOR.validate({"rules": rules})
-        if "general" in cfg:
-            general = cfg["general"]
-            GENERAL_VALIDATOR.validate({"general": general})
-        if not any(
-            [
-                PIPELINES_VALIDATOR.errors,
-                RULES_VALIDATOR.errors,
-                GENERAL_VALIDATOR.errors,
-            ]
-        ):
-            logger.success(f"Configuration {config_file} is valid for general settings, rules, and pipelines!")
-        for key, error in {
-            **GENERAL_VALIDATOR.errors,
-            **PIPELINES_VALIDATOR.errors,
-            **RULES_VALIDATOR.errors,
-        }.items():
-            logger.error(f"{key}: {error}")
+    # Check the general settings, rules and pipelines in one pass
+    config_validator = get_config_validator()
+    document = {section: cfg[section] for section in ("general", "rules", "pipelines") if section in cfg}
+    if config_validator.validate(document):
+        logger.success(f"Configuration {config_file} is valid for general settings, rules, and pipelines!")
+    for key, error in config_validator.errors.items():
+        logger.error(f"{key}: {error}")
 
 
 @validate.command()
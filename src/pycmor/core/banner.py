@@ -12,10 +12,11 @@ BANNER = r"""
        |___/
 """
 
+BANNER_FOOTER = f"PyCMOR v{__version__} - Makes CMOR Simple"
+
 
 def show_banner():
     """Display PyCMOR banner with version information"""
-    version = __version__
     logger.info(BANNER)
-    logger.info(f"PyCMOR v{version} - Makes CMOR Simple")
+    logger.info(BANNER_FOOTER)
     logger.info("")
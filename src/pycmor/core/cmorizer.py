@@ -39,7 +39,7 @@ from .pipeline import Pipeline
 # ResourceLocator classes imported locally in methods to avoid circular imports
 from .rule import Rule
 from .utils import wait_for_workers
-from .validate import GENERAL_VALIDATOR, PIPELINES_VALIDATOR, RULES_VALIDATOR
+from .validate import get_config_validator
 
 DIMENSIONLESS_MAPPING_TABLE = files("pycmor.data").joinpath("dimensionless_mappings.yaml")
 """Path: The dimenionless unit mapping table, used to recreate meaningful units from
@@ -124,6 +124,7 @@ class CMORizer:
             logger.debug("...done!")
         self._post_init_create_pipelines()
         self._post_init_create_rules()
+        self._post_init_locate_resources()
         self._post_init_create_data_request_tables()
         self._post_init_create_data_request()
         self._post_init_create_cmip7_interface()
@@ -254,6 +255,32 @@ class CMORizer:
         else:
             logger.info("No Dask extras specified...")
 
+    def _post_init_locate_resources(self):
+        """
+        Locate tables, metadata and controlled vocabularies concurrently.
+
+        Each of them may need to be downloaded first. The locations are remembered
+        by the ResourceLocator, so the following ``_post_init`` steps find them
+        without searching again.
+        """
+        from .resource_locator import CVLocator, MetadataLocator, TableLocator, locate_many
+
+        locators = [
+            self._get_versioned_class(TableLocator)(
+                version=self._general_cfg.get("CMIP_Tables_version"),
+                user_path=self._general_cfg.get("CMIP_Tables_Dir"),
+            ),
+            self._get_versioned_class(MetadataLocator)(
+                version=self._general_cfg.get("CMIP7_DReq_version"),
+                user_path=self._general_cfg.get("CMIP7_DReq_metadata"),
+            ),
+            self._get_versioned_class(CVLocator)(
+                version=self._general_cfg.get("CV_version"),
+                user_path=self._general_cfg.get("CV_Dir"),
+            ),
+        ]
+        locate_many(locators)
+
     def _post_init_create_data_request_tables(self):
         """
         Loads all the tables from table directory using ResourceLocator priority chain.
@@ -650,9 +677,26 @@ class CMORizer:
 
     @classmethod
     def from_dict(cls, data):
+        # Merge inherit values into rules before validation
+        inherit_cfg = data.get("inherit", {})
+        rules_with_inherit = []
+        for rule in data.get("rules", []):
+            # Create a new dict with inherit values, then overlay rule values
+            merged_rule = {**inherit_cfg, **rule}
+            rules_with_inherit.append(merged_rule)
+
+        # Validate all sections in a single pass, before anything is set up
+        document = {}
         if "general" in data:
-            if not GENERAL_VALIDATOR.validate({"general": data["general"]}):
-                raise ValueError(GENERAL_VALIDATOR.errors)
+            document["general"] = data["general"]
+        if rules_with_inherit:
+            document["rules"] = rules_with_inherit
+        if "pipelines" in data:
+            document["pipelines"] = data["pipelines"]
+        config_validator = get_config_validator()
+        if not config_validator.validate(document):
+            raise ValueError(config_validator.errors)
+
         # Use pycmor config if available, otherwise fall back to pymor for backward compatibility
         pycmor_cfg = data.get("pycmor", data.get("pymor", {}))
         instance = cls(
@@ -662,19 +706,8 @@ class CMORizer:
                 "distributed": data.get("distributed", {}),
                 "jobqueue": data.get("jobqueue", {}),
             },
-            inherit_cfg=data.get("inherit", {}),
+            inherit_cfg=inherit_cfg,
         )
-        # Merge inherit values into rules before validation
-        inherit_cfg = data.get("inherit", {})
-        rules_with_inherit = []
-        for rule in data.get("rules", []):
-            # Create a new dict with inherit values, then overlay rule values
-            merged_rule = {**inherit_cfg, **rule}
-            rules_with_inherit.append(merged_rule)
-
-        if rules_with_inherit:
-            if not RULES_VALIDATOR.validate({"rules": rules_with_inherit}):
-                raise ValueError(RULES_VALIDATOR.errors)
 
         # Use original rules (without inherit merged) for creation
         # The inheritance will be applied later in _post_init_inherit_rules()
@@ -683,9 +716,6 @@ class CMORizer:
             instance.add_rule(rule_obj)
             instance._post_init_attach_pymor_config_rules()
         instance._post_init_inherit_rules()
-        if "pipelines" in data:
-            if not PIPELINES_VALIDATOR.validate({"pipelines": data["pipelines"]}):
-                raise ValueError(PIPELINES_VALIDATOR.errors)
         for pipeline in data.get("pipelines", []):
             pipeline["workflow_backend"] = pipeline.get(
                 "workflow_backend",
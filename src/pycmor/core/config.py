@@ -71,20 +71,56 @@ See Also
 - `Everett Documentation <https://everett.readthedocs.io/en/latest/>`_
 """
 
+import copy
+import functools
 import os
-import pathlib
-from importlib.resources import files
+import sys
 
 from everett import InvalidKeyError
-from everett.ext.yamlfile import ConfigYamlEnv
-from everett.manager import ChoiceOf, ConfigDictEnv, ConfigManager, ConfigOSEnv, Option, _get_component_name, parse_bool
+from everett.manager import (
+    _CONFIG_OVERRIDE,
+    ChoiceOf,
+    ConfigDictEnv,
+    ConfigManager,
+    ConfigOSEnv,
+    Option,
+    _get_component_name,
+    generate_uppercase_key,
+    parse_bool,
+)
+
+# NOTE: Plain path arithmetic instead of importlib.resources.files("pycmor.data"), which would
+#       import the data package at import time. The package is installed unzipped (zip-safe = false).
+DIMENSIONLESS_MAPPING_TABLE = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "dimensionless_mappings.yaml"
+)
 
-DIMENSIONLESS_MAPPING_TABLE = files("pycmor.data").joinpath("dimensionless_mappings.yaml")
+
+# Same spellings as everett's parse_bool, resolved with a single dict lookup
+_BOOL_LOOKUP = {
+    "t": True,
+    "true": True,
+    "y": True,
+    "yes": True,
+    "on": True,
+    "1": True,
+    "f": False,
+    "false": False,
+    "n": False,
+    "no": False,
+    "off": False,
+    "0": False,
+}
 
 
 def _parse_bool(value):
-    if isinstance(value, bool):
+    if value is True or value is False:
         return value
+    if isinstance(value, str):
+        parsed = _BOOL_LOOKUP.get(value.strip().lower())
+        if parsed is not None:
+            return parsed
+    # Fall back to everett for anything unusual, so errors are reported the same way
     return parse_bool(value)
 
 
@@ -179,36 +215,46 @@ def _flatten_nested_dict(nested_dict, parent_key="", sep="_"):
     nested_dict : dict
         Nested dictionary to flatten
     parent_key : str
-        Parent key for recursion
+        Prefix for all flattened keys
     sep : str
         Separator for keys (default: '_')
 
-    Yields
-    ------
+    Returns
+    -------
     tuple
-        (flat_key, spec_dict) where flat_key is underscore-separated
-        and spec_dict contains 'default', 'doc', 'parser'
+        Tuple of (flat_key, spec_dict) pairs in depth-first order, where flat_key
+        is underscore-separated and spec_dict contains 'default', 'doc', 'parser'
     """
-    for key, value in nested_dict.items():
-        new_key = f"{parent_key}{sep}{key}" if parent_key else key
-
-        # Check if this is a leaf node (has 'default' key)
-        if isinstance(value, dict) and "default" in value:
-            # This is a leaf - it's an option spec
-            yield (new_key, value)
-        elif isinstance(value, dict):
-            # This is a branch - recurse deeper
-            yield from _flatten_nested_dict(value, new_key, sep=sep)
+    flattened = []
+    # Explicit stack of (key_prefix, iterator over a branch) instead of recursion
+    stack = [(parent_key, iter(nested_dict.items()))]
+    while stack:
+        prefix, items = stack[-1]
+        for key, value in items:
+            new_key = f"{prefix}{sep}{key}" if prefix else key
+            if not isinstance(value, dict):
+                continue
+            # Check if this is a leaf node (has 'default' key)
+            if "default" in value:
+                # This is a leaf - it's an option spec
+                flattened.append((new_key, value))
+            else:
+                # This is a branch - descend into it, resume this level afterwards
+                stack.append((new_key, iter(value.items())))
+                break
+        else:
+            stack.pop()
+    return tuple(flattened)
 
 
-def _make_xarray_option(key_path, spec):
+def _make_xarray_option(dotted_key, spec):
     """
     Factory to create xarray Option with dotted alternate key.
 
     Parameters
     ----------
-    key_path : str
-        Underscore-separated key path (e.g., "default_dataarray_attrs_missing_value")
+    dotted_key : str
+        Dotted key path for the YAML nested structure (e.g., "xarray.default.dataarray.attrs.missing.value")
     spec : dict
         Option specification with default, doc, parser
 
@@ -217,8 +263,6 @@ def _make_xarray_option(key_path, spec):
     Option
         Configured Option with alternate_keys for backward compatibility
     """
-    # Create dotted notation for YAML nested structure
-    dotted_key = f"xarray.{key_path.replace('_', '.')}"
     return Option(
         default=spec["default"],
         doc=f"{spec['doc']} (Dotted key: {dotted_key})",
@@ -227,253 +271,241 @@ def _make_xarray_option(key_path, spec):
     )
 
 
-def _generate_xarray_options(cls):
+_FLAT_XARRAY_OPTIONS = tuple(
+    # Attribute name: xarray_<flattened_path>, dotted notation for YAML nested structure
+    (sys.intern(f"xarray_{key_path}"), sys.intern(f"xarray.{key_path.replace('_', '.')}"), option_spec)
+    for key_path, option_spec in _flatten_nested_dict(XARRAY_OPTIONS)
+)
+"""tuple : (attr_name, dotted_key, spec_dict) triples of XARRAY_OPTIONS, built once at import."""
+
+
+# Definition of all non-xarray configuration options, keyed by option name
+# [FIXME] Keep the list of all options alphabetical!
+CONFIG_OPTIONS = {
+    "dask_cluster": {
+        "default": "local",
+        "doc": "Dask cluster to use. See: https://docs.dask.org/en/stable/deploying.html",
+        "parser": ChoiceOf(
+            str,
+            choices=[
+                "local",
+                "slurm",
+            ],
+        ),
+    },
+    "dask_cluster_scaling_fixed_jobs": {
+        "default": 5,
+        "doc": "Number of jobs to create for Jobqueue-backed Dask Cluster",
+        "parser": int,
+    },
+    "dask_cluster_scaling_maximum_jobs": {
+        "default": 10,
+        "doc": "Maximum number of jobs to create for Jobqueue-backed Dask Clusters (adaptive)",
+        "parser": int,
+    },
+    "dask_cluster_scaling_minimum_jobs": {
+        "default": 1,
+        "doc": "Minimum number of jobs to create for Jobqueue-backed Dask Clusters (adaptive)",
+        "parser": int,
+    },
+    "dask_cluster_scaling_mode": {
+        "default": "adapt",
+        "doc": "Flexible dask cluster scaling",
+        "parser": ChoiceOf(
+            str,
+            choices=[
+                "adapt",
+                "fixed",
+            ],
+        ),
+    },
+    "dimensionless_mapping_table": {
+        "default": DIMENSIONLESS_MAPPING_TABLE,
+        "doc": "Where the dimensionless unit mapping table is defined.",
+        "parser": str,
+    },
+    "enable_dask": {
+        "default": "yes",
+        "doc": "Whether to enable Dask-based processing",
+        "parser": _parse_bool,
+    },
+    "enable_flox": {
+        "default": "yes",
+        "doc": "Whether to enable flox for group-by operation. See: https://flox.readthedocs.io/en/latest/",
+        "parser": _parse_bool,
+    },
+    "enable_output_subdirs": {
+        "default": "no",
+        "doc": "Whether to create subdirectories under output_dir when saving data-sets.",
+        "parser": _parse_bool,
+    },
+    "file_timespan": {
+        "default": "1YS",
+        "doc": """Default timespan for grouping output files together.
+
+            Use the special flag ``'file_native'`` to use the same grouping as in the input
+            files. Otherwise, use a ``pandas``-flavoured string, see: https://tinyurl.com/38wxf8px
+            """,
+        "parser": str,
+    },
+    "parallel": {
+        "default": "yes",
+        "doc": "Whether to run in parallel.",
+        "parser": _parse_bool,
+    },
+    "parallel_backend": {
+        "default": "dask",
+        "doc": "Which parallel backend to use.",
+    },
+    "pipeline_workflow_orchestrator": {
+        "default": "prefect",
+        "doc": "Which workflow orchestrator to use for running pipelines",
+        "parser": ChoiceOf(
+            str,
+            choices=[
+                "native",
+                "prefect",
+            ],
+        ),
+    },
+    "prefect_task_runner": {
+        "default": "thread_pool",
+        "doc": "Which runner to use for Prefect flows.",
+        "parser": ChoiceOf(
+            str,
+            choices=[
+                "thread_pool",
+                "dask",
+            ],
+        ),
+    },
+    "quiet": {
+        "default": False,
+        "doc": "Whether to suppress output.",
+        "parser": _parse_bool,
+    },
+    "raise_on_no_rule": {
+        "default": "no",
+        "doc": "Whether or not to raise an error if no rule is found for every single DataRequestVariable",
+        "parser": _parse_bool,
+    },
+    "warn_on_no_rule": {
+        "default": "no",
+        "doc": "Whether or not to issue a warning if no rule is found for every single DataRequestVariable",
+        "parser": _parse_bool,
+    },
+    "xarray_default_missing_value": {
+        "default": 1.0e30,
+        "doc": "Which missing value to use for xarray. Default is 1e30.",
+        "parser": float,
+    },
+    "xarray_skip_unit_attr_from_drv": {
+        "default": "yes",
+        "doc": "Whether to skip setting the unit attribute from the DataRequestVariable, this can be handled via Pint",
+        "parser": _parse_bool,
+    },
+    "netcdf_enable_chunking": {
+        "default": "yes",
+        "doc": "Whether to enable internal NetCDF chunking for optimized I/O performance.",
+        "parser": _parse_bool,
+    },
+    "netcdf_chunk_algorithm": {
+        "default": "simple",
+        "doc": "Algorithm to use for calculating chunk sizes.",
+        "parser": ChoiceOf(
+            str,
+            choices=[
+                "simple",
+                "even_divisor",
+                "iterative",
+            ],
+        ),
+    },
+    "netcdf_chunk_size": {
+        "default": "100MB",
+        "doc": "Target chunk size for NetCDF files. Can be specified as bytes (int) or string like '100MB'.",
+        "parser": str,
+    },
+    "netcdf_chunk_tolerance": {
+        "default": 0.5,
+        "doc": "Tolerance for chunk size matching (0.0-1.0). Used by even_divisor and iterative algorithms.",
+        "parser": float,
+    },
+    "netcdf_chunk_prefer_time": {
+        "default": "yes",
+        "doc": "Whether to prefer chunking along the time dimension for better I/O performance.",
+        "parser": _parse_bool,
+    },
+    "netcdf_compression_level": {
+        "default": 4,
+        "doc": "Compression level for NetCDF files (1-9). Higher values give better compression but slower I/O.",
+        "parser": int,
+    },
+    "netcdf_enable_compression": {
+        "default": "yes",
+        "doc": "Whether to enable zlib compression for NetCDF files.",
+        "parser": _parse_bool,
+    },
+}
+
+
+def _generate_all_options(cls):
     """
-    Dynamically add xarray options to Config class.
+    Dynamically add all options to the Config class.
 
-    This decorator generates Option attributes for all xarray-related
-    configuration based on the XARRAY_OPTIONS structure, supporting
-    arbitrary nesting depth.
+    This decorator generates Option attributes from the CONFIG_OPTIONS
+    specification, and for all xarray-related configuration based on the
+    XARRAY_OPTIONS structure, supporting arbitrary nesting depth.
     """
-    for key_path, option_spec in _flatten_nested_dict(XARRAY_OPTIONS):
-        # Create attribute name: xarray_<flattened_path>
-        attr_name = f"xarray_{key_path}"
-        option = _make_xarray_option(key_path, option_spec)
+    for attr_name, option_spec in CONFIG_OPTIONS.items():
+        setattr(cls.Config, attr_name, Option(**option_spec))
+    for attr_name, dotted_key, option_spec in _FLAT_XARRAY_OPTIONS:
+        if hasattr(cls.Config, attr_name):
+            raise ValueError(f"{attr_name} is generated from XARRAY_OPTIONS, do not define it in CONFIG_OPTIONS")
+        option = _make_xarray_option(dotted_key, option_spec)
         setattr(cls.Config, attr_name, option)
     return cls
 
 
-@_generate_xarray_options
+@_generate_all_options
 class PycmorConfig:
     class Config:
-        # [FIXME] Keep the list of all options alphabetical!
-        dask_cluster = Option(
-            default="local",
-            doc="Dask cluster to use. See: https://docs.dask.org/en/stable/deploying.html",
-            parser=ChoiceOf(
-                str,
-                choices=[
-                    "local",
-                    "slurm",
-                ],
-            ),
-        )
-        dask_cluster_scaling_fixed_jobs = Option(
-            default=5,
-            doc="Number of jobs to create for Jobqueue-backed Dask Cluster",
-            parser=int,
-        )
-        dask_cluster_scaling_maximum_jobs = Option(
-            default=10,
-            doc="Maximum number of jobs to create for Jobqueue-backed Dask Clusters (adaptive)",
-            parser=int,
-        )
-        dask_cluster_scaling_minimum_jobs = Option(
-            default=1,
-            doc="Minimum number of jobs to create for Jobqueue-backed Dask Clusters (adaptive)",
-            parser=int,
-        )
-        dask_cluster_scaling_mode = Option(
-            default="adapt",
-            doc="Flexible dask cluster scaling",
-            parser=ChoiceOf(
-                str,
-                choices=[
-                    "adapt",
-                    "fixed",
-                ],
-            ),
-        )
-        dimensionless_mapping_table = Option(
-            default=DIMENSIONLESS_MAPPING_TABLE,
-            doc="Where the dimensionless unit mapping table is defined.",
-            parser=str,
-        )
-        enable_dask = Option(
-            default="yes",
-            doc="Whether to enable Dask-based processing",
-            parser=_parse_bool,
-        )
-        enable_flox = Option(
-            default="yes",
-            doc="Whether to enable flox for group-by operation. See: https://flox.readthedocs.io/en/latest/",
-            parser=_parse_bool,
-        )
-        enable_output_subdirs = Option(
-            default="no",
-            doc="Whether to create subdirectories under output_dir when saving data-sets.",
-            parser=_parse_bool,
-        )
-        file_timespan = Option(
-            default="1YS",
-            doc="""Default timespan for grouping output files together.
+        # NOTE: All options are generated by the @_generate_all_options decorator
+        # See CONFIG_OPTIONS and XARRAY_OPTIONS above for definitions
+        pass
 
-            Use the special flag ``'file_native'`` to use the same grouping as in the input
-            files. Otherwise, use a ``pandas``-flavoured string, see: https://tinyurl.com/38wxf8px
-            """,
-            parser=str,
-        )
-        parallel = Option(
-            default="yes",
-            doc="Whether to run in parallel.",
-            parser=_parse_bool,
-        )
-        parallel_backend = Option(
-            default="dask",
-            doc="Which parallel backend to use.",
-        )
-        pipeline_workflow_orchestrator = Option(
-            default="prefect",
-            doc="Which workflow orchestrator to use for running pipelines",
-            parser=ChoiceOf(
-                str,
-                choices=[
-                    "native",
-                    "prefect",
-                ],
-            ),
-        )
-        prefect_task_runner = Option(
-            default="thread_pool",
-            doc="Which runner to use for Prefect flows.",
-            parser=ChoiceOf(
-                str,
-                choices=[
-                    "thread_pool",
-                    "dask",
-                ],
-            ),
-        )
-        quiet = Option(
-            default=False,
-            doc="Whether to suppress output.",
-            parser=_parse_bool,
-        )
-        raise_on_no_rule = Option(
-            default="no",
-            doc="Whether or not to raise an error if no rule is found for every single DataRequestVariable",
-            parser=_parse_bool,
-        )
-        warn_on_no_rule = Option(
-            default="no",
-            doc="Whether or not to issue a warning if no rule is found for every single DataRequestVariable",
-            parser=_parse_bool,
-        )
-        xarray_default_missing_value = Option(
-            default=1.0e30,
-            doc="Which missing value to use for xarray. Default is 1e30.",
-            parser=float,
-        )
-        xarray_open_mfdataset_engine = Option(
-            default="netcdf4",
-            doc="Which engine to use for xarray.open_mfdataset().",
-            parser=ChoiceOf(
-                str,
-                choices=[
-                    "netcdf4",
-                    "h5netcdf",
-                    "zarr",
-                ],
-            ),
-        )
-        xarray_open_mfdataset_parallel = Option(
-            default="yes",
-            doc=(
-                "Whether to use parallel processing when opening multiple files "
-                "with xarray.open_mfdataset(). Default is True."
-            ),
-            parser=_parse_bool,
-        )
-        xarray_skip_unit_attr_from_drv = Option(
-            default="yes",
-            doc="Whether to skip setting the unit attribute from the DataRequestVariable, this can be handled via Pint",
-            parser=_parse_bool,
-        )
-        xarray_time_dtype = Option(
-            default="float64",
-            doc="The dtype to use for time axis in xarray.",
-            parser=ChoiceOf(
-                str,
-                choices=[
-                    "float64",
-                    "datetime64[ns]",
-                ],
-            ),
-        )
-        xarray_time_enable_set_axis = Option(
-            default="yes",
-            doc="Whether to enable setting the axis for the time axis in xarray.",
-            parser=_parse_bool,
-        )
-        xarray_time_remove_fill_value_attr = Option(
-            default="yes",
-            doc="Whether to remove the fill_value attribute from the time axis in xarray.",
-            parser=_parse_bool,
-        )
-        xarray_time_set_long_name = Option(
-            default="yes",
-            doc="Whether to set the long name for the time axis in xarray.",
-            parser=_parse_bool,
-        )
-        xarray_time_set_standard_name = Option(
-            default="yes",
-            doc="Whether to set the standard name for the time axis in xarray.",
-            parser=_parse_bool,
-        )
-        xarray_time_taxis_str = Option(
-            default="T",
-            doc="Which axis to set for the time axis in xarray.",
-            parser=str,
-        )
-        xarray_time_unlimited = Option(
-            default="yes",
-            doc="Whether the time axis is unlimited in xarray.",
-            parser=_parse_bool,
-        )
-        netcdf_enable_chunking = Option(
-            default="yes",
-            doc="Whether to enable internal NetCDF chunking for optimized I/O performance.",
-            parser=_parse_bool,
-        )
-        netcdf_chunk_algorithm = Option(
-            default="simple",
-            doc="Algorithm to use for calculating chunk sizes.",
-            parser=ChoiceOf(
-                str,
-                choices=[
-                    "simple",
-                    "even_divisor",
-                    "iterative",
-                ],
-            ),
-        )
-        netcdf_chunk_size = Option(
-            default="100MB",
-            doc="Target chunk size for NetCDF files. Can be specified as bytes (int) or string like '100MB'.",
-            parser=str,
-        )
-        netcdf_chunk_tolerance = Option(
-            default=0.5,
-            doc="Tolerance for chunk size matching (0.0-1.0). Used by even_divisor and iterative algorithms.",
-            parser=float,
-        )
-        netcdf_chunk_prefer_time = Option(
-            default="yes",
-            doc="Whether to prefer chunking along the time dimension for better I/O performance.",
-            parser=_parse_bool,
-        )
-        netcdf_compression_level = Option(
-            default=4,
-            doc="Compression level for NetCDF files (1-9). Higher values give better compression but slower I/O.",
-            parser=int,
-        )
-        netcdf_enable_compression = Option(
-            default="yes",
-            doc="Whether to enable zlib compression for NetCDF files.",
-            parser=_parse_bool,
-        )
-        # NOTE: xarray_* options are dynamically generated by @_generate_xarray_options decorator
-        # See XARRAY_OPTIONS structure above for definitions
+
+_PYCMOR_CONFIG_KEYS = frozenset(name for name, value in vars(PycmorConfig.Config).items() if isinstance(value, Option))
+"""frozenset : Names of all options defined on PycmorConfig, for cheap membership checks."""
+
+
+_PARSED_YAML_FILES = {}
+"""dict : Maps (path, mtime_ns, size) to the parsed configuration of a user YAML file."""
+
+
+@functools.lru_cache(maxsize=None)
+def _cached_yaml_env_class():
+    """
+    Build the YAML environment class, importing everett's YAML support (and PyYAML) on first use.
+
+    The returned ``ConfigYamlEnv`` subclass parses each user configuration file
+    only once per process. Parsed files are cached by path, modification time
+    and size, so building several managers (e.g. one per ``CMORizer``) does not
+    re-read an unchanged file, while an edited file is still picked up.
+    """
+    from everett.ext.yamlfile import ConfigYamlEnv
+
+    class _CachedConfigYamlEnv(ConfigYamlEnv):
+        def parse_yaml_file(self, path):
+            stat = os.stat(path)
+            cache_key = (path, stat.st_mtime_ns, stat.st_size)
+            try:
+                return _PARSED_YAML_FILES[cache_key]
+            except KeyError:
+                parsed = _PARSED_YAML_FILES[cache_key] = super().parse_yaml_file(path)
+                return parsed
+
+    return _CachedConfigYamlEnv
 
 
 class PycmorConfigManager(ConfigManager):
@@ -482,27 +514,47 @@ class PycmorConfigManager(ConfigManager):
     support for injecting run-specific configuration.
     """
 
-    _XDG_CONFIG_HOME = os.environ.get("XDG_CONFIG_HOME", "~/.config")
-    """str : The XDG configuration directory."""
     _NAMESPACE = "pycmor"
     """str : The namespace for all configuration keys."""
-    _CONFIG_FILES = [
-        str(f)
-        for f in [
+
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def _config_files(cls):
+        """
+        Find the user configuration files, in highest to lowest priority order.
+
+        The candidate locations are only resolved on first use (not at import
+        time), so ``XDG_CONFIG_HOME`` and ``PYCMOR_CONFIG_FILE`` are read when
+        the lookup is (re)computed, e.g. after :func:`_reset_default_manager`.
+        Paths that do not exist are dropped so that the YAML environment does
+        not have to check them again.
+
+        Returns
+        -------
+        tuple of str
+            Existing configuration files to check for user configuration.
+        """
+        xdg_config_home = os.environ.get("XDG_CONFIG_HOME") or "~/.config"
+        candidates = [
             # Prefer new env var, fall back to legacy
             os.environ.get("PYCMOR_CONFIG_FILE") or os.environ.get("PYMOR_CONFIG_FILE"),
             # Prefer new locations
-            pathlib.Path(f"{_XDG_CONFIG_HOME}/pycmor.yaml").expanduser(),
-            pathlib.Path(f"{_XDG_CONFIG_HOME}/pycmor/pycmor.yaml").expanduser(),
-            pathlib.Path("~/.pycmor.yaml").expanduser(),
+            os.path.join(xdg_config_home, "pycmor.yaml"),
+            os.path.join(xdg_config_home, "pycmor", "pycmor.yaml"),
+            "~/.pycmor.yaml",
             # Legacy fallbacks
-            pathlib.Path(f"{_XDG_CONFIG_HOME}/pymor.yaml").expanduser(),
-            pathlib.Path(f"{_XDG_CONFIG_HOME}/pymor/pymor.yaml").expanduser(),
-            pathlib.Path("~/.pymor.yaml").expanduser(),
+            os.path.join(xdg_config_home, "pymor.yaml"),
+            os.path.join(xdg_config_home, "pymor", "pymor.yaml"),
+            "~/.pymor.yaml",
         ]
-        if f
-    ]
-    """List[str] : The list of configuration files to check for user configuration."""
+        config_files = []
+        for candidate in candidates:
+            if not candidate:
+                continue
+            path = os.path.expanduser(candidate)
+            if os.path.isfile(path):
+                config_files.append(path)
+        return tuple(config_files)
 
     @classmethod
     def _create_environments(cls, run_specific_cfg=None):
@@ -516,14 +568,14 @@ class PycmorConfigManager(ConfigManager):
 
         Returns
         -------
-        list
-            List of environment objects in priority order (first has highest priority).
+        tuple
+            Environment objects in priority order (first has highest priority).
         """
-        return [
+        return (
             ConfigOSEnv(),  # Highest: Environment variables
             ConfigDictEnv(run_specific_cfg or {}),  # Run-specific configuration
-            ConfigYamlEnv(cls._CONFIG_FILES),  # Lowest: User config file
-        ]
+            _cached_yaml_env_class()(cls._config_files()),  # Lowest: User config file
+        )
 
     @classmethod
     def _configure_manager(cls, manager):
@@ -558,27 +610,83 @@ class PycmorConfigManager(ConfigManager):
             Fully configured manager instance.
         """
         environments = cls._create_environments(run_specific_cfg)
-        manager = cls(environments=environments)
+        # everett may prepend its override environment, so it gets a list it owns
+        manager = cls(environments=list(environments))
         return cls._configure_manager(manager)
 
-    # NOTE(PG): Need to override this method, the original implementation in the parent class
-    # explicitly uses ConfigManager (not cls) to create the clone instance.
-    def clone(self):
-        my_clone = PycmorConfigManager(
-            environments=list(self.envs),
-            doc=self.doc,
-            msg_builder=self.msg_builder,
-            with_override=self.with_override,
-        )
-        my_clone.namespace = list(self.namespace)
-        my_clone.bound_component = self.bound_component
-        my_clone.bound_component_prefix = []
-        my_clone.bound_component_options = self.bound_component_options
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._lookup_cache = {}
+        """dict : Maps keys of plain ``manager(key)`` calls to their value, and the environment it was read from."""
+
+    def _environ_names(self, key):
+        """
+        Names of the environment variables ``ConfigOSEnv`` checks for ``key``.
 
-        my_clone.original_manager = self.original_manager
+        These are the namespaced key and its alternate keys, uppercased, e.g.
+        ``PYCMOR_PARALLEL`` for ``parallel``.
+        """
+        keys = [key]
+        if self.bound_component:
+            # Same resolution as ConfigManager.__call__ for a bound component
+            key = "_".join([*self.bound_component_prefix, key])
+            option, _ = self.bound_component_options.get(key, (None, None))
+            keys = [key, *(option.alternate_keys or ())] if option is not None else [key]
+        names = []
+        for k in keys:
+            if k.startswith("root:"):
+                names.append(generate_uppercase_key(k[len("root:") :]))
+            else:
+                names.append(generate_uppercase_key(k, self.namespace))
+        return tuple(names)
+
+    def __call__(self, key, *args, **kwargs):
+        """
+        Look up a configuration value, caching plain ``manager(key)`` lookups.
+
+        Lookups with any extra arguments (parser, default, namespace, ...) are
+        passed straight to everett. A cached value is only reused while the
+        environment variables it could have been read from are unchanged, so
+        setting e.g. ``PYCMOR_PARALLEL`` after the first lookup still takes
+        effect. Lookups inside everett's ``config_override`` bypass the cache
+        entirely. Clones (e.g. from ``with_options``) start with an empty cache,
+        so the cached values are always those of this manager's namespace and
+        options.
+        """
+        # _CONFIG_OVERRIDE is the stack of active config_override() contexts
+        if args or kwargs or _CONFIG_OVERRIDE:
+            return super().__call__(key, *args, **kwargs)
+        cached = self._lookup_cache.get(key)
+        if cached is not None:
+            value, environ_names, environ_values = cached
+            if tuple(map(os.environ.get, environ_names)) == environ_values:
+                return value
+        environ_names = self._environ_names(key)
+        environ_values = tuple(map(os.environ.get, environ_names))
+        value = super().__call__(key)
+        self._lookup_cache[key] = (value, environ_names, environ_values)
+        return value
 
+    def __copy__(self):
+        """
+        Shallow copy without re-running ``__init__``.
+
+        The environments are shared; the namespace list is copied because
+        ``with_namespace`` extends it on the copy, and the lookup cache is
+        reset since the copy usually gets a different namespace or options.
+        """
+        my_clone = self.__class__.__new__(self.__class__)
+        my_clone.__dict__.update(self.__dict__)
+        my_clone.namespace = list(self.namespace)
+        my_clone.bound_component_prefix = []
+        my_clone._lookup_cache = {}
         return my_clone
 
+    # NOTE(PG): Need to override this method, the original implementation in the parent class
+    # explicitly uses ConfigManager (not cls) to create the clone instance.
+    def clone(self):
+        return copy.copy(self)
+
     def __repr__(self) -> str:
         if self.bound_component:
             name = _get_component_name(self.bound_component)
@@ -604,6 +712,10 @@ class PycmorConfigManager(ConfigManager):
         Any
             The configuration value.
         """
+        # Unknown keys of a manager bound to PycmorConfig would only raise InvalidKeyError,
+        # so answer them without the (comparatively expensive) raise/catch round-trip
+        if self.bound_component is PycmorConfig and key not in _PYCMOR_CONFIG_KEYS:
+            return default
         try:
             return self(key, parser=parser)
         except InvalidKeyError:
@@ -614,6 +726,31 @@ class PycmorConfigManager(ConfigManager):
 # Configuration injection decorator
 # ---------------------------------------------------------------------------
 
+_DEFAULT_MANAGER = None
+"""PycmorConfigManager : Lazily built manager used when no explicit one is given."""
+
+
+def _get_default_manager():
+    """
+    Return the default ``PycmorConfigManager``, building it on first use.
+
+    Building a manager reads the environment and the user configuration
+    files, so it is done once per process rather than on every call of a
+    :func:`config_injector`-decorated function. Use
+    :func:`_reset_default_manager` to force a reload.
+    """
+    global _DEFAULT_MANAGER
+    if _DEFAULT_MANAGER is None:
+        _DEFAULT_MANAGER = PycmorConfigManager.from_pycmor_cfg()
+    return _DEFAULT_MANAGER
+
+
+def _reset_default_manager():
+    """Drop the cached default manager and config file lookup, so the next use re-reads the configuration."""
+    global _DEFAULT_MANAGER
+    _DEFAULT_MANAGER = None
+    PycmorConfigManager._config_files.cache_clear()
+
 
 def config_injector(config_manager=None, type_to_prefix_map=None):
     """
@@ -627,7 +764,8 @@ def config_injector(config_manager=None, type_to_prefix_map=None):
     Parameters
     ----------
     config_manager : PycmorConfigManager, optional
-        The config manager to use. If None, creates one with from_pycmor_cfg()
+        The config manager to use. If None, a default one is created with
+        from_pycmor_cfg() on first use and shared between calls.
     type_to_prefix_map : dict, optional
         Mapping from type objects to config key prefixes.
         Example: {xr.DataArray: "xarray_default_dataarray"}
@@ -664,60 +802,55 @@ def config_injector(config_manager=None, type_to_prefix_map=None):
     >>> result == 999
     True
     """
-    import functools
     import inspect
 
     def decorator(func):
+        # The signature is static, so inspect it once at decoration time
+        sig = inspect.signature(func)
+        param_names = list(sig.parameters.keys())
+
+        # Find which type prefix to use by looking at parameter type annotations
+        active_prefix = next(
+            (
+                type_to_prefix_map[param.annotation]
+                for param in sig.parameters.values()
+                if param.annotation in (type_to_prefix_map or {})
+            ),
+            None,
+        )
+
+        # Config key of every parameter that can be injected
+        config_keys = [
+            (param_name, sys.intern(f"{active_prefix}_{param_name}"))
+            for param_name, param in sig.parameters.items()
+            # Skip if no type annotation, or variadic (e.g., *args, **kwargs)
+            if param.annotation is not inspect.Parameter.empty
+            and param.kind not in (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD)
+        ]
+
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
+            # Without a matching type there is nothing to inject
+            if not active_prefix:
+                return func(*args, **kwargs)
+
             # Get config manager
-            cfg = config_manager or PycmorConfigManager.from_pycmor_cfg()
-
-            # Get function signature
-            sig = inspect.signature(func)
-
-            # Build a mapping of parameter names to their positions
-            param_names = list(sig.parameters.keys())
-
-            # Determine which parameters were provided
-            provided_params = set()
-            for i, arg in enumerate(args):
-                if i < len(param_names):
-                    provided_params.add(param_names[i])
-            provided_params.update(kwargs.keys())
-
-            # Find which type prefix to use by looking at parameter type annotations
-            active_prefix = None
-            if type_to_prefix_map:
-                for param in sig.parameters.values():
-                    if param.annotation in type_to_prefix_map:
-                        active_prefix = type_to_prefix_map[param.annotation]
-                        break
-
-            # Build new kwargs by injecting config values
-            new_kwargs = dict(kwargs)
+            cfg = config_manager or _get_default_manager()
 
-            # If we found a matching type, inject config for all unprovided parameters
-            if active_prefix:
-                for param_name, param in sig.parameters.items():
-                    # Skip if already provided
-                    if param_name in provided_params:
-                        continue
-
-                    # Skip if no type annotation (e.g., *args, **kwargs)
-                    if param.annotation is inspect.Parameter.empty:
-                        continue
-
-                    # Build config key
-                    config_key = f"{active_prefix}_{param_name}"
-
-                    # Try to get value from config
-                    try:
-                        value = cfg(config_key)
-                        new_kwargs[param_name] = value
-                    except InvalidKeyError:
-                        # Key doesn't exist in config, skip (let default handle it)
-                        pass
+            # Parameters provided positionally; the few names are cheaper to scan than to hash into a set
+            provided_positionally = param_names[: len(args)]
+
+            # Build new kwargs by injecting config values for all unprovided parameters
+            new_kwargs = dict(kwargs)
+            for param_name, config_key in config_keys:
+                # Skip if already provided
+                if param_name in kwargs or param_name in provided_positionally:
+                    continue
+                try:
+                    new_kwargs[param_name] = cfg(config_key)
+                except InvalidKeyError:
+                    # Key doesn't exist in config, skip (let default handle it)
+                    pass
 
             return func(*args, **new_kwargs)
 
@@ -2,16 +2,266 @@
 Controlled vocabularies for CMIP6
 """
 
-import glob
+import copy
+import functools
 import json
+import mmap
 import os
-import re
+import sys
+import tarfile
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Use orjson for parsing if available, it is considerably faster than the standard library
+try:
+    from orjson import loads as json_loads
+
+    # orjson parses any buffer, so memory-mapped files are parsed without a copy
+    json_loads_buffer = json_loads
+except ImportError:
+    from json import loads as json_loads
+
+    def json_loads_buffer(buffer):
+        return json_loads(bytes(buffer))
+
 
 from .factory import MetaFactory
-from .resource_locator import CMIP6CVLocator, CMIP7CVLocator
+from .logging import logger
+from .resource_locator import CMIP6CVLocator, CMIP7CVLocator, ResourceLocator
+
+# Upper bound on the number of threads used to read CV files concurrently
+MAX_READ_WORKERS = 32
+# Upper bound on the number of concurrent downloads when loading CVs from git
+MAX_DOWNLOAD_WORKERS = 8
+# (connect, read) timeouts in seconds for CV downloads
+DOWNLOAD_TIMEOUT = (3.05, 27)
+# Files larger than this (in bytes) are memory-mapped instead of read into memory
+MMAP_THRESHOLD = 256 * 1024
+
+
+def _read_json_file(path):
+    """Parse a json file
+
+    Large files (e.g. ``CMIP6_source_id.json``) are memory-mapped, so the
+    parser consumes the pages directly instead of a copy made by ``read()``.
+
+    Parameters
+    ----------
+    path : str or Path
+        Path to the json file
+
+    Raises
+    ------
+    ValueError
+        If the file is not valid json
+    """
+    path = Path(path)
+    try:
+        if path.stat().st_size > MMAP_THRESHOLD:
+            with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                with memoryview(mm) as buffer:
+                    return json_loads_buffer(buffer)
+        return json_loads(path.read_bytes())
+    except json.JSONDecodeError as e:
+        raise ValueError(f"file {path}: {e.msg}")
+
+
+def _threaded_map(func, items, max_workers=MAX_READ_WORKERS):
+    """Apply ``func`` to each of ``items`` on a thread pool, preserving order
+
+    Reading and parsing many small JSON files is dominated by I/O wait, so
+    overlapping the reads on a few threads speeds up directory loads.
+    """
+    items = list(items)
+    if len(items) < 2:
+        return [func(item) for item in items]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        return list(executor.map(func, items))
+
+
+# Serializes _load_cached, so concurrent first loads parse the files only once
+_LOAD_LOCK = threading.Lock()
+
+
+@functools.lru_cache(maxsize=8)
+def _cached_from_directory(cls, cv_path, version):
+    return cls.from_directory(cv_path)
+
+
+def _load_cached(cls, cv_path, version):
+    """Load the controlled vocabularies of ``cls`` from ``cv_path``, once per process
+
+    The returned object is fully loaded when it is handed out and shared
+    between all callers (and threads) asking for the same directory and
+    version, so it must not be modified in place; use ``.copy()`` to get a
+    private mapping. Call ``_cached_from_directory.cache_clear()`` to pick up
+    changes made to the files on disk.
+    """
+    with _LOAD_LOCK:
+        return _cached_from_directory(cls, cv_path, version)
+
+
+def _scan_files(directory, suffix):
+    """List the files in ``directory`` whose name ends with ``suffix``
+
+    Uses a single :func:`os.scandir` pass, which avoids the pattern matching
+    and extra ``stat`` calls of globbing. Like ``glob``, hidden files are skipped.
+
+    Parameters
+    ----------
+    directory : str or Path
+        Directory to scan
+    suffix : str
+        Required end of the file names, e.g. ``".json"``
+
+    Returns
+    -------
+    list of Path
+        The matching files
+    """
+    with os.scandir(directory) as entries:
+        return [
+            Path(entry.path)
+            for entry in entries
+            if entry.name.endswith(suffix) and not entry.name.startswith(".") and entry.is_file()
+        ]
+
+
+@functools.lru_cache(maxsize=None)
+def _download_session():
+    """The :class:`requests.Session` shared by all CV downloads
+
+    Connections are kept alive and pooled across all ``load_from_git`` calls,
+    so consecutive and concurrent downloads from the same host reuse an open
+    connection instead of paying a new TLS handshake per file. Connection
+    errors and transient server errors are retried with backoff.
+    """
+    session = requests.Session()
+    retries = Retry(total=3, backoff_factor=0.5, status_forcelist=(500, 502, 503, 504))
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=retries)
+    session.mount("https://", adapter)
+    return session
+
+
+def _download_cache_dir(resource_name, ref):
+    """Directory in the XDG cache holding files downloaded from a git ref
+
+    Parameters
+    ----------
+    resource_name : str
+        Name of the downloaded resource (e.g. ``"cmip6-cvs-raw"``)
+    ref : str
+        The git ref the files were downloaded from, relative to ``refs/``
+        (e.g. ``"tags/6.2.58.64"`` or ``"heads/main"``)
+
+    Returns
+    -------
+    Path
+        ``$XDG_CACHE_HOME/pycmor/<resource_name>/<ref>``
+    """
+    return ResourceLocator._get_cache_directory() / resource_name / ref
+
+
+def _write_cache_file(cache_file, content):
+    """Atomically write ``content`` to ``cache_file``, logging instead of raising on failure"""
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file first so concurrent readers never see a partial file
+        with tempfile.NamedTemporaryFile(dir=cache_file.parent, delete=False) as tmp:
+            tmp.write(content)
+        os.replace(tmp.name, cache_file)
+    except OSError as e:
+        logger.debug(f"Could not write cache file {cache_file}: {e}")
+
+
+def _download(url, cache_file=None, revalidate=False):
+    """Download ``url`` and return the raw response body
+
+    If ``cache_file`` is given, the downloaded file is stored there. For
+    immutable refs (git tags) an existing cache file is served without
+    touching the network. With ``revalidate``, meant for branches, the
+    cached copy is only served after the server confirms it is current via
+    its ``ETag`` (``304 Not Modified``), or when the server is unreachable.
+
+    Parameters
+    ----------
+    url : str
+        URL to download
+    cache_file : Path, optional
+        Location of the on-disk copy of the file
+    revalidate : bool, optional
+        Check an existing cache file against the server before using it
+
+    Returns
+    -------
+    bytes
+        The file contents
+    """
+    cached = cache_file is not None and cache_file.is_file()
+    if cached and not revalidate:
+        return cache_file.read_bytes()
+
+    headers = {}
+    if revalidate and cache_file is not None:
+        etag_file = cache_file.with_name(cache_file.name + ".etag")
+        if cached and etag_file.is_file():
+            headers["If-None-Match"] = etag_file.read_text()
+    try:
+        r = _download_session().get(url, headers=headers, timeout=DOWNLOAD_TIMEOUT)
+    except (requests.ConnectionError, requests.Timeout):
+        if not cached:
+            raise
+        logger.warning(f"Could not reach {url}, using the cached copy at {cache_file}")
+        return cache_file.read_bytes()
+    if cached and r.status_code == 304:
+        return cache_file.read_bytes()
+    r.raise_for_status()
+
+    if cache_file is not None:
+        _write_cache_file(cache_file, r.content)
+        etag = r.headers.get("ETag")
+        if revalidate and etag:
+            _write_cache_file(etag_file, etag.encode())
+    return r.content
+
+
+def _download_tarball_members(url, filenames):
+    """Download a gzipped tarball and return the top-level files named in ``filenames``
+
+    The archive is streamed and decompressed in a single pass, files not
+    requested are skipped without being stored.
+
+    Parameters
+    ----------
+    url : str
+        URL of the ``.tar.gz`` archive, e.g. a GitHub codeload URL
+    filenames : iterable of str
+        Names of the wanted files, relative to the archive's top-level directory
+
+    Returns
+    -------
+    dict
+        Mapping of the file names found in the archive to their contents
+    """
+    wanted = set(filenames)
+    contents = {}
+    with _download_session().get(url, stream=True, timeout=DOWNLOAD_TIMEOUT) as r:
+        r.raise_for_status()
+        with tarfile.open(fileobj=r.raw, mode="r|gz") as archive:
+            for member in archive:
+                # Members are named <repo>-<ref>/<path>
+                _, _, name = member.name.partition("/")
+                if member.isfile() and name in wanted:
+                    contents[name] = archive.extractfile(member).read()
+                    if len(contents) == len(wanted):
+                        break
+    return contents
 
 
 class ControlledVocabularies(dict, metaclass=MetaFactory):
@@ -48,8 +298,7 @@ class CMIP6ControlledVocabularies(ControlledVocabularies):
             A new ControlledVocabularies object, behaves like a dictionary.
         """
         super().__init__()
-        for f in json_files:
-            d = self.dict_from_json_file(f)
+        for d in _threaded_map(self.dict_from_json_file, json_files):
             self.update(d)
 
     @classmethod
@@ -73,7 +322,8 @@ class CMIP6ControlledVocabularies(ControlledVocabularies):
         Returns
         -------
         CMIP6ControlledVocabularies
-            Loaded controlled vocabularies
+            Loaded controlled vocabularies. The object is cached and shared
+            between calls, do not modify it in place.
         """
         locator = CMIP6CVLocator(version=version, user_path=table_dir)
         cv_path = locator.locate()
@@ -84,24 +334,35 @@ class CMIP6ControlledVocabularies(ControlledVocabularies):
                 "Check that git submodules are initialized or internet connection is available."
             )
 
-        return cls.from_directory(cv_path)
+        return _load_cached(cls, str(cv_path), version)
 
     @classmethod
-    def from_directory(cls, directory):
+    def from_directory(cls, directory, categories=None):
         """Create a new ControlledVocabularies object from a directory of json files
 
         Parameters
         ----------
         directory : str
             Path to the directory containing the json files
+        categories : iterable of str, optional
+            Only read the files providing these categories, e.g.
+            ``["experiment_id"]`` reads ``CMIP6_experiment_id.json`` and
+            nothing else. By default all files are read.
         """
-        json_files = glob.glob(os.path.join(directory, "*.json"))
+        json_files = _scan_files(directory, ".json")
+        if categories is not None:
+            wanted = set(categories)
+            json_files = [f for f in json_files if f.stem.removeprefix("CMIP6_") in wanted]
         return cls(json_files)
 
     def print_experiment_ids(self):
         """Print experiment ids with start and end years and parent experiment ids"""
-        for k, v in self["experiment_id"].items():
-            print(f"{k} {v['start_year']}-{v['end_year']} parent:{', '.join(v['parent_experiment_id'])}")
+        lines = [
+            f"{k} {v['start_year']}-{v['end_year']} parent:{', '.join(v['parent_experiment_id'])}\n"
+            for k, v in self["experiment_id"].items()
+        ]
+        # One write instead of a print call per experiment
+        sys.stdout.write("".join(lines))
 
     @staticmethod
     def dict_from_json_file(path):
@@ -117,11 +378,7 @@ class CMIP6ControlledVocabularies(ControlledVocabularies):
         ValueError
             If the file cannot be loaded
         """
-        try:
-            with open(path, "r") as file:
-                return json.load(file)
-        except json.JSONDecodeError as e:
-            raise ValueError(f"file {path}: {e.msg}")
+        return _read_json_file(path)
 
     @classmethod
     def load_from_git(cls, tag: str = "6.2.58.64"):
@@ -137,10 +394,14 @@ class CMIP6ControlledVocabularies(ControlledVocabularies):
         ControlledVocabularies
             A new ControlledVocabularies object, behaves like a dictionary.
         """
+        # Downloaded files are kept on disk. Tagged files never change, files
+        # from the main branch are revalidated against the server on each load.
+        revalidate = tag is None
         if tag is None:
             tag = "refs/heads/main"
         else:
             tag = "refs/tags/" + tag
+        cache_dir = _download_cache_dir("cmip6-cvs-raw", tag[len("refs/") :])
         url = f"https://raw.githubusercontent.com/WCRP-CMIP/CMIP6_CVs/{tag}"
         filenames = (
             "CMIP6_DRS.json",
@@ -159,16 +420,29 @@ class CMIP6ControlledVocabularies(ControlledVocabularies):
             "CMIP6_table_id.json",
             "mip_era.json",
         )
-        name_pattern = re.compile(r"^(?:CMIP6_)?(?P<name>[^\.]+)\.json$").match
-        data = {}
-        for fname in filenames:
-            name = name_pattern(fname).groupdict().get("name")
-            fpath = "/".join([url, fname])
-            r = requests.get(fpath)
-            r.raise_for_status()
-            content = r.content.decode()
-            content = json.loads(content)
-            data[name] = content.get(name)
+
+        # For a tag, fetch the whole repository as one archive instead of making a
+        # request per file. Anything not found in it is downloaded individually.
+        prefetched = {}
+        if not revalidate and not all((cache_dir / fname).is_file() for fname in filenames):
+            archive_url = f"https://codeload.github.com/WCRP-CMIP/CMIP6_CVs/tar.gz/{tag}"
+            try:
+                prefetched = _download_tarball_members(archive_url, filenames)
+            except (requests.RequestException, tarfile.TarError) as e:
+                logger.debug(f"Could not download {archive_url}, fetching files individually: {e}")
+            for fname, content in prefetched.items():
+                _write_cache_file(cache_dir / fname, content)
+
+        def fetch(fname):
+            # CMIP6_<name>.json or <name>.json
+            name = fname[6:-5] if fname.startswith("CMIP6_") else fname[:-5]
+            content = prefetched.get(fname)
+            if content is None:
+                fpath = "/".join([url, fname])
+                content = _download(fpath, cache_dir / fname, revalidate)
+            return name, json_loads(content).get(name)
+
+        data = dict(_threaded_map(fetch, filenames, MAX_DOWNLOAD_WORKERS))
         obj = cls([])
         obj.update(data)
         return obj
@@ -193,8 +467,7 @@ class CMIP7ControlledVocabularies(ControlledVocabularies):
             Dictionary containing the controlled vocabularies organized by category
             (e.g., {'experiment': {...}, 'frequency': [...], ...})
         """
-        super().__init__()
-        self.update(cv_data)
+        super().__init__(cv_data)
 
     @classmethod
     def load(cls, table_dir=None, version=None):
@@ -217,7 +490,8 @@ class CMIP7ControlledVocabularies(ControlledVocabularies):
         Returns
         -------
         CMIP7ControlledVocabularies
-            A new CMIP7ControlledVocabularies object
+            The loaded controlled vocabularies. The object is cached and
+            shared between calls, do not modify it in place.
         """
         locator = CMIP7CVLocator(version=version, user_path=table_dir)
         cv_path = locator.locate()
@@ -228,7 +502,7 @@ class CMIP7ControlledVocabularies(ControlledVocabularies):
                 "Check that git submodules are initialized or internet connection is available."
             )
 
-        return cls.from_directory(cv_path)
+        return _load_cached(cls, str(cv_path), version)
 
     @staticmethod
     def _get_vendored_cv_path():
@@ -288,7 +562,11 @@ class CMIP7ControlledVocabularies(ControlledVocabularies):
     def _load_individual_files(directory):
         """Load individual JSON files from a directory into a dictionary
 
-        Each file represents one CV entry (e.g., experiment/picontrol.json)
+        Each file represents one CV entry (e.g., experiment/picontrol.json).
+        If the directory contains the compiled ``graph.min.jsonld`` index, which
+        holds all entries of the directory in its ``@graph`` list, that single
+        file is parsed instead of every individual file. Otherwise the files are
+        read concurrently.
 
         Parameters
         ----------
@@ -300,27 +578,54 @@ class CMIP7ControlledVocabularies(ControlledVocabularies):
         dict
             Dictionary mapping entry IDs to their data
         """
-        entries = {}
-        json_files = directory.glob("*.json")
+        graph_file = directory / "graph.min.jsonld"
+        if graph_file.is_file():
+            return CMIP7ControlledVocabularies._load_graph_file(graph_file)
 
-        for json_file in json_files:
+        json_files = [
+            json_file
+            for json_file in _scan_files(directory, ".json")
             # Skip special files
-            if (
+            if not (
                 json_file.name.startswith("@")
                 or json_file.name == "graph.jsonld"
                 or json_file.name == "graph.min.jsonld"
-            ):
-                continue
+            )
+        ]
+        entries = {}
+        for json_file, data in zip(json_files, _threaded_map(_read_json_file, json_files)):
+            # Use 'id' field as the key, or filename without extension as fallback
+            entries[data.get("id", json_file.stem)] = data
+        return entries
 
-            try:
-                with open(json_file, "r") as f:
-                    data = json.load(f)
-                    # Use 'id' field as the key, or filename without extension as fallback
-                    entry_id = data.get("id", json_file.stem)
-                    entries[entry_id] = data
-            except json.JSONDecodeError as e:
-                raise ValueError(f"file {json_file}: {e.msg}")
+    @staticmethod
+    def _load_graph_file(graph_file):
+        """Load all CV entries from a compiled JSON-LD graph file
+
+        The graph nodes are the same objects as the individual entry files,
+        except that the ``@context`` is given once for the whole graph. Every
+        entry gets its own shallow copy of it, so that they look like the
+        individual files and changing one entry's context leaves the others alone.
+
+        Parameters
+        ----------
+        graph_file : Path
+            Path to the ``graph.min.jsonld`` file
 
+        Returns
+        -------
+        dict
+            Dictionary mapping entry IDs to their data
+        """
+        graph = _read_json_file(graph_file)
+        context = graph.get("@context")
+        entries = {}
+        for node in graph.get("@graph", []):
+            if "id" not in node:
+                continue
+            if context is not None and "@context" not in node:
+                node["@context"] = copy.copy(context)
+            entries[node["id"]] = node
         return entries
 
     @staticmethod
@@ -340,24 +645,20 @@ class CMIP7ControlledVocabularies(ControlledVocabularies):
             Dictionary mapping CV types to their data
         """
         cv_data = {}
-        json_files = directory.glob("*-list.json")
+        json_files = _scan_files(directory, "-list.json")
 
         for json_file in json_files:
-            try:
-                with open(json_file, "r") as f:
-                    data = json.load(f)
-                    # Extract the CV type from filename (e.g., "frequency-list" -> "frequency")
-                    cv_type = json_file.stem.replace("-list", "")
-
-                    # The actual data is usually in a field matching the cv_type
-                    # e.g., frequency-list.json has a "frequency" field with the list
-                    if cv_type in data:
-                        cv_data[cv_type] = data[cv_type]
-                    else:
-                        # Fallback: store the entire data
-                        cv_data[cv_type] = data
-            except json.JSONDecodeError as e:
-                raise ValueError(f"file {json_file}: {e.msg}")
+            data = _read_json_file(json_file)
+            # Extract the CV type from filename (e.g., "frequency-list" -> "frequency")
+            cv_type = json_file.stem[: -len("-list")]
+
+            # The actual data is usually in a field matching the cv_type
+            # e.g., frequency-list.json has a "frequency" field with the list
+            if cv_type in data:
+                cv_data[cv_type] = data[cv_type]
+            else:
+                # Fallback: store the entire data
+                cv_data[cv_type] = data
 
         return cv_data
 
@@ -378,14 +679,18 @@ class CMIP7ControlledVocabularies(ControlledVocabularies):
             A new CMIP7ControlledVocabularies object
         """
         # Use tag if provided, otherwise use branch
+        # Downloaded files are kept on disk, files from a branch are revalidated on each load
         if tag is not None:
             base_url = f"https://raw.githubusercontent.com/WCRP-CMIP/CMIP7-CVs/{tag}"
+            cache_dir = _download_cache_dir("cmip7-cvs-raw", f"tags/{tag}")
         else:
             base_url = f"https://raw.githubusercontent.com/WCRP-CMIP/CMIP7-CVs/{branch}"
+            cache_dir = _download_cache_dir("cmip7-cvs-raw", f"heads/{branch}")
+        revalidate = tag is None
 
         cv_data = {}
 
-        # Load experiments (sample key experiments)
+        # Experiments to load (sample key experiments)
         experiment_files = [
             "picontrol.json",
             "historical.json",
@@ -394,23 +699,7 @@ class CMIP7ControlledVocabularies(ControlledVocabularies):
             "amip.json",
         ]
 
-        experiments = {}
-        for fname in experiment_files:
-            url = f"{base_url}/experiment/{fname}"
-            try:
-                r = requests.get(url)
-                r.raise_for_status()
-                data = r.json()
-                entry_id = data.get("id", fname.replace(".json", ""))
-                experiments[entry_id] = data
-            except requests.RequestException:
-                # Skip files that don't exist
-                continue
-
-        if experiments:
-            cv_data["experiment"] = experiments
-
-        # Load project-level CVs
+        # Project-level CVs to load
         project_files = [
             "frequency-list.json",
             "license-list.json",
@@ -419,21 +708,39 @@ class CMIP7ControlledVocabularies(ControlledVocabularies):
             "tables-list.json",
         ]
 
-        for fname in project_files:
-            url = f"{base_url}/project/{fname}"
+        def fetch(path):
             try:
-                r = requests.get(url)
-                r.raise_for_status()
-                data = r.json()
-                cv_type = fname.replace("-list.json", "")
-
-                # Extract the actual list from the data
-                if cv_type in data:
-                    cv_data[cv_type] = data[cv_type]
-                else:
-                    cv_data[cv_type] = data
-            except requests.RequestException:
+                return json_loads(_download(f"{base_url}/{path}", cache_dir / path, revalidate))
+            except (requests.RequestException, ValueError):
+                # Skip files that don't exist
+                return None
+
+        # Download all files concurrently
+        experiment_data = _threaded_map(
+            fetch, [f"experiment/{fname}" for fname in experiment_files], MAX_DOWNLOAD_WORKERS
+        )
+        project_data = _threaded_map(fetch, [f"project/{fname}" for fname in project_files], MAX_DOWNLOAD_WORKERS)
+
+        experiments = {}
+        for fname, data in zip(experiment_files, experiment_data):
+            if data is None:
+                continue
+            entry_id = data.get("id", fname.replace(".json", ""))
+            experiments[entry_id] = data
+
+        if experiments:
+            cv_data["experiment"] = experiments
+
+        for fname, data in zip(project_files, project_data):
+            if data is None:
                 continue
+            cv_type = fname[: -len("-list.json")]
+
+            # Extract the actual list from the data
+            if cv_type in data:
+                cv_data[cv_type] = data[cv_type]
+            else:
+                cv_data[cv_type] = data
 
         return cls(cv_data)
 
@@ -443,15 +750,29 @@ class CMIP7ControlledVocabularies(ControlledVocabularies):
             print("No experiment data available")
             return
 
-        for exp_id, exp_data in self["experiment"].items():
-            start = exp_data.get("start", exp_data.get("start-year", "N/A"))
-            end = exp_data.get("end", exp_data.get("end-year", "N/A"))
-            parent = exp_data.get("parent-experiment", exp_data.get("parent_experiment_id", []))
-
-            # Handle parent experiment format
-            if isinstance(parent, list):
-                parent_str = ", ".join(parent)
-            else:
-                parent_str = str(parent)
-
-            print(f"{exp_id} {start}-{end} parent:{parent_str}")
+        experiments = self["experiment"]
+        # Entries share one schema, so pick the key names once from the first entry
+        sample = next(iter(experiments.values()), {})
+        start_key = "start" if "start" in sample else "start-year"
+        end_key = "end" if "end" in sample else "end-year"
+        parent_key = "parent-experiment" if "parent-experiment" in sample else "parent_experiment_id"
+        # Parent experiments are usually a list of ids, any other value is printed as is
+        parent_formatters = {list: ", ".join}
+
+        lines = []
+        for exp_id, exp_data in experiments.items():
+            try:
+                start = exp_data[start_key]
+                end = exp_data[end_key]
+                parent = exp_data[parent_key]
+            except KeyError:
+                # Entry deviates from the sampled schema, look up each alternative
+                start = exp_data.get("start", exp_data.get("start-year", "N/A"))
+                end = exp_data.get("end", exp_data.get("end-year", "N/A"))
+                parent = exp_data.get("parent-experiment", exp_data.get("parent_experiment_id", []))
+
+            parent_str = parent_formatters.get(type(parent), str)(parent)
+            lines.append(f"{exp_id} {start}-{end} parent:{parent_str}\n")
+
+        # One write instead of a print call per experiment
+        sys.stdout.write("".join(lines))
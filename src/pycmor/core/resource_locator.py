@@ -7,26 +7,241 @@ Resource locator with priority-based resource location:
 5. Vendored git submodules
 """
 
-import json
+import functools
 import os
-import shutil
-import subprocess
+import re
+import stat
 import sys
-import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Union
-
-# Use importlib.resources for Python 3.9+, fallback to importlib_resources
-if sys.version_info >= (3, 9):
-    from importlib import resources
-    from importlib.resources import files
-else:
-    import importlib_resources as resources  # noqa: F401
-    from importlib_resources import files
+from typing import ClassVar, Optional, Union
 
 from pycmor.core.factory import MetaFactory
 from pycmor.core.logging import logger
 
+# NOTE: subprocess, shutil, tempfile and importlib.resources are imported where
+# they are needed, they are only used when a resource is not cached yet.
+
+# Paths found by ResourceLocator.locate, see ResourceLocator.clear_cache
+_LOCATE_CACHE = {}
+
+# One lock per cache path, so that only one thread downloads a resource, see _cache_path_lock
+_CACHE_PATH_LOCKS = {}
+_CACHE_PATH_LOCKS_LOCK = threading.Lock()
+
+# Top-level keys of CMIP7 metadata files, they appear within the first bytes of the file
+_METADATA_KEY_PATTERN = re.compile(rb'"(?:Compound Name|Header)"\s*:')
+METADATA_SCAN_BYTES = 64 * 1024
+
+# Oldest git which reliably supports partial clones combined with sparse checkouts
+MIN_SPARSE_CHECKOUT_GIT_VERSION = (2, 27)
+
+
+@functools.lru_cache(maxsize=1)
+def _git_version() -> tuple:
+    """
+    Get the version of the installed git as a tuple of ints, e.g. ``(2, 39, 5)``.
+
+    Returns an empty tuple if git is not available or its version can not be parsed.
+    """
+    import subprocess
+
+    try:
+        result = subprocess.run(["git", "--version"], check=True, capture_output=True, text=True)
+    except (OSError, subprocess.CalledProcessError):
+        return ()
+    match = re.search(r"(\d+)\.(\d+)(?:\.(\d+))?", result.stdout)
+    if match is None:
+        return ()
+    return tuple(int(part) for part in match.groups() if part is not None)
+
+
+def _run_git(*args: str) -> None:
+    """Run a git command, raising ``subprocess.CalledProcessError`` on failure."""
+    import subprocess
+
+    # Only stderr is needed, for error messages. Fail instead of prompting for
+    # credentials, e.g. for a mistyped repository URL, nobody would answer.
+    subprocess.run(
+        ["git", *args],
+        check=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        env={**os.environ, "GIT_TERMINAL_PROMPT": "0"},
+    )
+
+
+def _git_clone(url: str, version: str, target: Path, sparse_paths=()) -> None:
+    """
+    Shallow-clone a git repository at a tag or branch, including submodules.
+
+    If ``sparse_paths`` are given and git is recent enough, a partial clone
+    (``--filter=blob:none``) with a sparse checkout of only these paths is
+    made, so that file contents outside of them are never transferred.
+    Otherwise the full tree is cloned.
+
+    Parameters
+    ----------
+    url : str
+        URL of the repository
+    version : str
+        Tag or branch to check out
+    target : Path
+        Directory to clone into
+    sparse_paths : sequence of str, optional
+        Paths within the repository which are actually needed
+    """
+    if sparse_paths and _git_version() >= MIN_SPARSE_CHECKOUT_GIT_VERSION:
+        _run_git(
+            "clone",
+            "--filter=blob:none",
+            "--depth",
+            "1",
+            "--single-branch",
+            "--no-tags",
+            "--branch",
+            version,
+            "--no-checkout",
+            "--sparse",
+            url,
+            str(target),
+        )
+        _run_git("-C", str(target), "sparse-checkout", "set", *sparse_paths)
+        _run_git("-C", str(target), "checkout", version)
+        # Only submodules within the sparse paths are needed
+        _run_git(
+            "-C",
+            str(target),
+            "submodule",
+            "update",
+            "--init",
+            "--depth",
+            "1",
+            "--recommend-shallow",
+            "--",
+            *sparse_paths,
+        )
+    else:
+        _run_git(
+            "clone",
+            "--depth",
+            "1",
+            "--single-branch",
+            "--no-tags",
+            "--branch",
+            version,
+            "--recurse-submodules",
+            "--shallow-submodules",
+            url,
+            str(target),
+        )
+
+
+def _git_update(target: Path, version: str, sparse_paths=()) -> None:
+    """
+    Update an existing shallow clone in place to the current state of a tag or branch.
+
+    Only the new commit is fetched, a sparse checkout keeps its sparse paths.
+
+    Parameters
+    ----------
+    target : Path
+        Directory of the clone
+    version : str
+        Tag or branch to check out
+    sparse_paths : sequence of str, optional
+        Paths within the repository which are actually needed
+    """
+    _run_git("-C", str(target), "fetch", "--depth", "1", "--no-tags", "origin", version)
+    _run_git("-C", str(target), "reset", "--hard", "FETCH_HEAD")
+    _run_git(
+        "-C",
+        str(target),
+        "submodule",
+        "update",
+        "--init",
+        "--recursive",
+        "--depth",
+        "1",
+        "--",
+        *sparse_paths,
+    )
+
+
+def _git_clone_to_cache(url: str, version: str, cache_path: Path, sparse_paths=()) -> None:
+    """
+    Clone a git repository into ``cache_path``, see :func:`_git_clone`.
+
+    If ``cache_path`` already holds a clone, it is updated in place with
+    :func:`_git_update` instead, falling back to a fresh clone if that fails.
+
+    The clone is made in a staging directory next to ``cache_path`` and then
+    renamed into place, so the cache never holds a partial clone and no files
+    need to be copied. The ``.git`` directory is kept, which allows updating
+    the cache in place later on.
+    """
+    import shutil
+    import subprocess
+    import tempfile
+
+    if (cache_path / ".git").is_dir():
+        try:
+            _git_update(cache_path, version, sparse_paths)
+            return
+        except subprocess.CalledProcessError as e:
+            logger.warning(f"Could not update {cache_path} in place, cloning again: {e.stderr.decode().strip()}")
+
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    staging = Path(tempfile.mkdtemp(prefix=f"{cache_path.name}.partial-", dir=cache_path.parent))
+    try:
+        _git_clone(url, version, staging, sparse_paths)
+        if cache_path.exists():
+            # Move the outdated clone out of the way, a directory can only be replaced if empty
+            outdated = Path(tempfile.mkdtemp(prefix=f"{cache_path.name}.outdated-", dir=cache_path.parent))
+            os.replace(cache_path, outdated / cache_path.name)
+            shutil.rmtree(outdated, ignore_errors=True)
+        os.replace(staging, cache_path)
+    except BaseException:
+        shutil.rmtree(staging, ignore_errors=True)
+        raise
+
+
+def _cache_path_lock(cache_path: Path) -> threading.Lock:
+    """Get the lock guarding downloads into ``cache_path``."""
+    with _CACHE_PATH_LOCKS_LOCK:
+        return _CACHE_PATH_LOCKS.setdefault(cache_path, threading.Lock())
+
+
+@functools.lru_cache(maxsize=None)
+def _cache_directory(xdg_cache_home: Optional[str]) -> Path:
+    """Create (once) and return the pycmor cache directory below ``xdg_cache_home``."""
+    if xdg_cache_home:
+        cache_base = Path(xdg_cache_home)
+    else:
+        cache_base = Path.home() / ".cache"
+
+    pycmor_cache = cache_base / "pycmor"
+    pycmor_cache.mkdir(parents=True, exist_ok=True)
+    return pycmor_cache
+
+
+@functools.lru_cache(maxsize=None)
+def _packaged_files(package: str):
+    """
+    Get the location of the data files packaged with pycmor in ``package``.
+
+    The result only changes on reinstall, so it is looked up once per process.
+    """
+    # Use importlib.resources for Python 3.9+, fallback to importlib_resources
+    if sys.version_info >= (3, 9):
+        from importlib.resources import files
+    else:
+        from importlib_resources import files
+
+    return files(package)
+
 
 class ResourceLocator:
     """
@@ -49,6 +264,19 @@ class ResourceLocator:
         User-specified path to resource
     """
 
+    # Paths within a git repository which are needed, only these are checked out.
+    # Empty means the whole repository; defaults to REPO_SUBDIR if a subclass defines it.
+    SPARSE_PATHS: tuple = ()
+
+    # Branches which move, cached clones of these are updated once REFRESH_INTERVAL (seconds) has passed
+    REFRESH_BRANCHES: set = {"main", "master", "src-data"}
+    REFRESH_INTERVAL: float = 24 * 60 * 60
+
+    # Root of the source checkout, where vendored submodules live (we are in src/pycmor/core/)
+    _REPO_ROOT: ClassVar[Path] = Path(__file__).resolve().parents[3]
+    # Vendored submodule lookups by subdirectory, None if the submodule is missing
+    _vendored_cache: ClassVar[dict] = {}
+
     def __init__(
         self,
         resource_name: str,
@@ -59,6 +287,7 @@ class ResourceLocator:
         self.version = version
         self.user_path = Path(user_path) if user_path else None
         self._cache_base = self._get_cache_directory()
+        self._located = None
 
     @staticmethod
     def _get_cache_directory() -> Path:
@@ -70,15 +299,19 @@ class ResourceLocator:
         Path
             Path to cache directory (~/.cache/pycmor or $XDG_CACHE_HOME/pycmor)
         """
-        xdg_cache = os.environ.get("XDG_CACHE_HOME")
-        if xdg_cache:
-            cache_base = Path(xdg_cache)
-        else:
-            cache_base = Path.home() / ".cache"
+        return _cache_directory(os.environ.get("XDG_CACHE_HOME"))
 
-        pycmor_cache = cache_base / "pycmor"
-        pycmor_cache.mkdir(parents=True, exist_ok=True)
-        return pycmor_cache
+    @classmethod
+    def clear_cache(cls) -> None:
+        """
+        Forget all resource locations found so far in this process.
+
+        Locators created afterwards search the priority chain again, e.g. after
+        the cache directory was cleaned up or a submodule was initialized.
+        """
+        _LOCATE_CACHE.clear()
+        _cache_directory.cache_clear()
+        ResourceLocator._vendored_cache.clear()
 
     def _get_cache_path(self) -> Path:
         """
@@ -123,6 +356,49 @@ class ResourceLocator:
         """
         raise NotImplementedError("Subclasses must implement _get_vendored_path")
 
+    def _find_vendored_path(self, subdir: str) -> Optional[Path]:
+        """
+        Look up a vendored submodule below the repository root.
+
+        The result, including a missing submodule, is remembered per subdirectory,
+        so repeated lookups do not touch the filesystem again.
+
+        Parameters
+        ----------
+        subdir : str
+            Path of the submodule data relative to the repository root
+
+        Returns
+        -------
+        Path or None
+            Path to vendored data, or None if the submodule is not there
+        """
+        try:
+            return self._vendored_cache[subdir]
+        except KeyError:
+            pass
+
+        path = self._REPO_ROOT / subdir
+        if not path.exists():
+            logger.warning(f"{self.__class__.__name__} submodule not found at {path}. Run: git submodule update --init")
+            path = None
+        self._vendored_cache[subdir] = path
+        return path
+
+    def _get_sparse_paths(self) -> tuple:
+        """
+        Get the paths within the git repository which need to be checked out.
+
+        Returns
+        -------
+        tuple of str
+            SPARSE_PATHS, or REPO_SUBDIR if only that is defined. Empty for the whole repository.
+        """
+        if self.SPARSE_PATHS:
+            return tuple(self.SPARSE_PATHS)
+        repo_subdir = getattr(self, "REPO_SUBDIR", None)
+        return (repo_subdir,) if repo_subdir else ()
+
     def _download_from_git(self, cache_path: Path) -> bool:
         """
         Download resource from git repository to cache.
@@ -146,11 +422,28 @@ class ResourceLocator:
         """
         Locate resource following 5-level priority chain.
 
+        Found locations are remembered on the locator and for the whole process,
+        so repeated lookups of the same resource skip the priority chain. Failed
+        lookups are not remembered, a later call tries all sources again.
+
         Returns
         -------
         Path or None
             Path to the resource, or None if not found
         """
+        if self._located is not None:
+            return self._located
+        key = (type(self), self.resource_name, self.version, self.user_path, self._cache_base)
+        located = _LOCATE_CACHE.get(key)
+        if located is None:
+            located = self._locate()
+            if located is not None:
+                _LOCATE_CACHE[key] = located
+        self._located = located
+        return located
+
+    def _locate(self) -> Optional[Path]:
+        """Search the priority chain for the resource, see :meth:`locate`."""
         # Priority 1: User-specified path
         if self.user_path:
             if self.user_path.exists():
@@ -164,24 +457,32 @@ class ResourceLocator:
 
         # Priority 2: XDG cache
         cache_path = self._get_cache_path()
-        if cache_path.exists() and self._validate_cache(cache_path):
-            logger.debug(f"Using cached {self.resource_name}: {cache_path}")
-            # Append REPO_SUBDIR if defined (for repos with subdirectories)
-            if hasattr(self, "REPO_SUBDIR") and self.REPO_SUBDIR:
-                cache_path = cache_path / self.REPO_SUBDIR
-            return cache_path
-
-        # Priority 3: Remote git (download to cache)
-        logger.info(f"Attempting to download {self.resource_name} from git...")
-        cache_path.parent.mkdir(parents=True, exist_ok=True)
-        if self._download_from_git(cache_path):
-            logger.info(f"Downloaded {self.resource_name} to cache: {cache_path}")
-            # Append REPO_SUBDIR if defined (for repos with subdirectories)
-            if hasattr(self, "REPO_SUBDIR") and self.REPO_SUBDIR:
-                cache_path = cache_path / self.REPO_SUBDIR
-            return cache_path
-        else:
-            logger.warning(f"Failed to download {self.resource_name} from git")
+        # Another thread may be downloading the same resource, it is then waited for
+        with _cache_path_lock(cache_path):
+            if self._validate_cache(cache_path):
+                if self._needs_refresh(cache_path):
+                    logger.info(f"Updating cached {self.resource_name} {self.version} from git...")
+                    if not self._download_from_git(cache_path):
+                        logger.warning(f"Failed to update {self.resource_name}, using the cached version")
+                logger.debug(f"Using cached {self.resource_name}: {cache_path}")
+                # Append REPO_SUBDIR if defined (for repos with subdirectories)
+                if hasattr(self, "REPO_SUBDIR") and self.REPO_SUBDIR:
+                    cache_path = cache_path / self.REPO_SUBDIR
+                return cache_path
+
+            # Priority 3: Remote git (download to cache)
+            logger.info(f"Attempting to download {self.resource_name} from git...")
+            # The cache base itself was created in __init__, only a version level may be missing
+            if cache_path.parent != self._cache_base:
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+            if self._download_from_git(cache_path):
+                logger.info(f"Downloaded {self.resource_name} to cache: {cache_path}")
+                # Append REPO_SUBDIR if defined (for repos with subdirectories)
+                if hasattr(self, "REPO_SUBDIR") and self.REPO_SUBDIR:
+                    cache_path = cache_path / self.REPO_SUBDIR
+                return cache_path
+            else:
+                logger.warning(f"Failed to download {self.resource_name} from git")
 
         # Priority 4: Packaged resources (importlib.resources)
         packaged_path = self._get_packaged_path()
@@ -201,6 +502,35 @@ class ResourceLocator:
         )
         return None
 
+    def _needs_refresh(self, cache_path: Path) -> bool:
+        """
+        Check whether a cached clone of a moving branch should be updated.
+
+        Parameters
+        ----------
+        cache_path : Path
+            Path to cached resource
+
+        Returns
+        -------
+        bool
+            True if the version is one of REFRESH_BRANCHES and the clone in
+            ``cache_path`` was not fetched within the last REFRESH_INTERVAL
+        """
+        if self.version not in self.REFRESH_BRANCHES:
+            return False
+        git_dir = cache_path / ".git"
+        # FETCH_HEAD is written by every update, a fresh clone only has HEAD
+        for marker in ("FETCH_HEAD", "HEAD"):
+            try:
+                fetched = os.stat(git_dir / marker).st_mtime
+                break
+            except (FileNotFoundError, NotADirectoryError):
+                continue
+        else:
+            return False
+        return time.time() - fetched > self.REFRESH_INTERVAL
+
     def _validate_cache(self, cache_path: Path) -> bool:
         """
         Validate that cached resource is valid.
@@ -218,15 +548,48 @@ class ResourceLocator:
             True if cache is valid, False otherwise
         """
         # Basic validation: just check if path exists and is not empty
-        if not cache_path.exists():
+        try:
+            st = os.stat(cache_path)
+        except (FileNotFoundError, NotADirectoryError):
             return False
 
-        # Check if directory has content
-        if cache_path.is_dir():
-            return any(cache_path.iterdir())
+        # Check if directory has content, stopping at the first entry
+        if stat.S_ISDIR(st.st_mode):
+            with os.scandir(cache_path) as entries:
+                return next(entries, None) is not None
 
         # Check if file is not empty
-        return cache_path.stat().st_size > 0
+        return st.st_size > 0
+
+
+def locate_many(locators: list, max_workers: int = 4) -> list:
+    """
+    Locate several resources concurrently.
+
+    Each resource may need a download, which mostly waits on git and the
+    network, so independent locators are run in a thread pool.
+
+    Parameters
+    ----------
+    locators : list of ResourceLocator
+        Locators to run
+    max_workers : int, optional
+        Maximum number of resources located at the same time
+
+    Returns
+    -------
+    list of Path or None
+        Result of :meth:`ResourceLocator.locate` for each locator, in the same order
+    """
+
+    def _locate(locator):
+        logger.debug(f"Locating {locator.resource_name} {locator.version or ''}")
+        return locator.locate()
+
+    if len(locators) <= 1:
+        return [locator.locate() for locator in locators]
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="locate") as executor:
+        return list(executor.map(_locate, locators))
 
 
 class CVLocator(ResourceLocator, metaclass=MetaFactory):
@@ -263,51 +626,15 @@ class CVLocator(ResourceLocator, metaclass=MetaFactory):
 
     def _get_vendored_path(self) -> Optional[Path]:
         """Get path to vendored CV submodule."""
-        # Get repo root (assuming we're in src/pycmor/core/)
-        current_file = Path(__file__)
-        repo_root = current_file.parent.parent.parent.parent
-
-        cv_path = repo_root / self.VENDORED_SUBDIR
-
-        if not cv_path.exists():
-            logger.warning(
-                f"{self.__class__.__name__} submodule not found at {cv_path}. " "Run: git submodule update --init"
-            )
-            return None
-
-        return cv_path
+        return self._find_vendored_path(self.VENDORED_SUBDIR)
 
     def _download_from_git(self, cache_path: Path) -> bool:
         """Download CVs from GitHub."""
+        import subprocess
+
         try:
             # Clone with depth 1 for speed, checkout specific tag/branch
-            with tempfile.TemporaryDirectory() as tmpdir:
-                tmpdir_path = Path(tmpdir)
-
-                # Clone with submodules
-                subprocess.run(
-                    [
-                        "git",
-                        "clone",
-                        "--depth",
-                        "1",
-                        "--branch",
-                        self.version,
-                        "--recurse-submodules",
-                        self.GIT_REPO_URL,
-                        str(tmpdir_path),
-                    ],
-                    check=True,
-                    capture_output=True,
-                )
-
-                # Copy to cache (exclude .git directory)
-                shutil.copytree(
-                    tmpdir_path,
-                    cache_path,
-                    ignore=shutil.ignore_patterns(".git"),
-                )
-
+            _git_clone_to_cache(self.GIT_REPO_URL, self.version, cache_path, self._get_sparse_paths())
             return True
         except subprocess.CalledProcessError as e:
             logger.error(f"Failed to clone {self.__class__.__name__}: {e.stderr.decode()}")
@@ -371,20 +698,7 @@ class TableLocator(ResourceLocator, metaclass=MetaFactory):
         """Get path to vendored table submodule."""
         if self.VENDORED_SUBDIR is None:
             return None
-
-        # Get repo root (assuming we're in src/pycmor/core/)
-        current_file = Path(__file__)
-        repo_root = current_file.parent.parent.parent.parent
-
-        table_path = repo_root / self.VENDORED_SUBDIR
-
-        if not table_path.exists():
-            logger.warning(
-                f"{self.__class__.__name__} submodule not found at {table_path}. " "Run: git submodule update --init"
-            )
-            return None
-
-        return table_path
+        return self._find_vendored_path(self.VENDORED_SUBDIR)
 
     def _download_from_git(self, cache_path: Path) -> bool:
         """Download tables from GitHub."""
@@ -392,35 +706,11 @@ class TableLocator(ResourceLocator, metaclass=MetaFactory):
             # No remote repository (e.g., CMIP7 uses packaged data)
             return False
 
+        import subprocess
+
         try:
             # Clone with depth 1 for speed, checkout specific tag/branch
-            with tempfile.TemporaryDirectory() as tmpdir:
-                tmpdir_path = Path(tmpdir)
-
-                # Clone with submodules
-                subprocess.run(
-                    [
-                        "git",
-                        "clone",
-                        "--depth",
-                        "1",
-                        "--branch",
-                        self.version,
-                        "--recurse-submodules",
-                        self.GIT_REPO_URL,
-                        str(tmpdir_path),
-                    ],
-                    check=True,
-                    capture_output=True,
-                )
-
-                # Copy to cache (exclude .git directory)
-                shutil.copytree(
-                    tmpdir_path,
-                    cache_path,
-                    ignore=shutil.ignore_patterns(".git"),
-                )
-
+            _git_clone_to_cache(self.GIT_REPO_URL, self.version, cache_path, self._get_sparse_paths())
             return True
         except subprocess.CalledProcessError as e:
             logger.error(f"Failed to clone {self.__class__.__name__}: {e.stderr.decode()}")
@@ -450,7 +740,7 @@ class CMIP7TableLocator(TableLocator):
 
     def _get_packaged_path(self) -> Optional[Path]:
         """CMIP7 tables are packaged in src/pycmor/data/cmip7/."""
-        return files("pycmor.data.cmip7")
+        return _packaged_files("pycmor.data.cmip7")
 
     def _get_vendored_path(self) -> Optional[Path]:
         """CMIP7 has no vendored tables."""
@@ -537,6 +827,8 @@ class CMIP7MetadataLocator(MetadataLocator):
         This isn't really "downloading from git" but rather generating
         the metadata file using the installed command-line tool.
         """
+        import subprocess
+
         try:
             # Ensure parent directory exists
             cache_path.parent.mkdir(parents=True, exist_ok=True)
@@ -556,7 +848,8 @@ class CMIP7MetadataLocator(MetadataLocator):
                     str(metadata_file),
                 ],
                 check=True,
-                capture_output=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 text=True,
             )
 
@@ -580,16 +873,22 @@ class CMIP7MetadataLocator(MetadataLocator):
             return False
 
     def _validate_cache(self, cache_path: Path) -> bool:
-        """Validate that cached metadata file is valid JSON."""
+        """Validate that cached metadata file is a complete JSON object with the expected keys."""
         if not super()._validate_cache(cache_path):
             return False
 
-        # Additional validation: check it's valid JSON with expected structure
+        # Additional validation: check it looks like a complete JSON object with the
+        # expected structure. The file is tens of MB, so only its head and tail are read
+        # instead of parsing all of it.
         try:
-            with open(cache_path, "r") as f:
-                data = json.load(f)
-                # Check for expected structure
-                return "Compound Name" in data or "Header" in data
-        except (json.JSONDecodeError, KeyError):
+            with open(cache_path, "rb") as f:
+                head = f.read(METADATA_SCAN_BYTES)
+                f.seek(max(f.seek(0, os.SEEK_END) - 64, 0))
+                tail = f.read()
+        except OSError as e:
+            logger.warning(f"Could not read cached metadata file {cache_path}: {e}")
+            return False
+        if not (head.lstrip().startswith(b"{") and tail.rstrip().endswith(b"}")):
             logger.warning(f"Cached metadata file is corrupted: {cache_path}")
             return False
+        return _METADATA_KEY_PATTERN.search(head) is not None
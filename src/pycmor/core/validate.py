@@ -2,87 +2,192 @@
 Provides validation of user configuration files by checking against a schema.
 """
 
+import functools
 import glob
 import importlib
 import pathlib
+import re
+import sys
+from types import MappingProxyType
 
-from cerberus import Validator
+# NOTE: cerberus is only imported once a validator is needed, see _validator_classes
 
 
-class DirectoryAwareValidator(Validator):
+@functools.lru_cache(maxsize=None)
+def _is_qualname(value):
     """
-    A Validator that can check if a field is a directory.
+    Check if a string names an attribute of an importable module, e.g. ``os.path.join``.
+
+    Results, also failed imports, are remembered, as pipelines tend to use many
+    steps from the same few modules.
     """
+    module_name, _, attr_name = value.rpartition(".")
+    if not module_name:
+        return False
+    module = sys.modules.get(module_name)
+    if module is None:
+        try:
+            module = importlib.import_module(module_name)
+        except (ImportError, ModuleNotFoundError):
+            return False
+    return hasattr(module, attr_name)
 
-    def _validate_is_directory(self, is_directory, field, value):
-        """
-        Checks if a string can be a pathlib.Path object.
 
-        The rule's arguments are validated against this schema:
-        {'type': 'boolean'}
-        """
-        if is_directory:
-            try:
-                if glob.has_magic(value):
-                    self._error(field, "Must not contain glob characters")
-            except TypeError as e:
-                self._error(field, f"{e.args[0]}. Must be a string")
-            else:
-                try:
-                    pathlib.Path(value).expanduser().resolve()
-                except TypeError as e:
-                    self._error(field, f"{e.args[0]}. Must be a string")
+SCRIPT_PREFIX = "script://"
+"""str : Prefix of pipeline steps given as ``script://<path>:<function>``."""
+
+VARIANT_LABEL_PATTERN = re.compile(r"^r\d+i\d+p\d+f\d+$")
+"""re.Pattern : Format of variant labels, e.g. ``r1i1p1f1``."""
+
+TIME_UNITS_PATTERN = re.compile(
+    r"^\s*(days|hours|minutes|seconds|milliseconds|microseconds|nanoseconds)"
+    r"\s+since\s+\d{4}-\d{2}-\d{2}(\s+\d{2}:\d{2}:\d{2}(.\d+)?)?\s*$"
+)
+"""re.Pattern : Format of CF time units, e.g. ``days since 1850-01-01``."""
+
+
+@functools.lru_cache(maxsize=1024)
+def _check_directory(value):
+    """
+    Check if a string can be a directory path.
+
+    Returns
+    -------
+    str or None
+        The error message, or None if the value is fine. Many rules share
+        the same directories, so results are remembered.
+    """
+    if glob.has_magic(value):
+        return "Must not contain glob characters"
+    path = pathlib.Path(value)
+    # Absolute paths, the usual case, have nothing to expand or resolve
+    if not path.is_absolute():
+        path.expanduser().resolve()
+    return None
 
 
-class GeneralSectionValidator(DirectoryAwareValidator):
-    """A Validator for the general section of the configuration file"""
+_VALIDATOR_CLASS_NAMES = (
+    "ConfigValidator",
+    "DirectoryAwareValidator",
+    "GeneralSectionValidator",
+    "PipelineSectionValidator",
+    "RuleSectionValidator",
+    "ConfigFileValidator",
+)
 
 
-class PipelineSectionValidator(Validator):
+@functools.lru_cache(maxsize=None)
+def _validator_classes():
     """
-    Validator for pipeline configuration.
+    Define the Cerberus based validator classes.
+
+    Importing Cerberus takes a noticeable part of the start up time, so it only
+    happens once a validator class is used, see the module ``__getattr__``.
 
-    See Also
-    --------
-    * https://cerberus-sanhe.readthedocs.io/customize.html#class-based-custom-validators
+    Returns
+    -------
+    dict
+        The classes, by name
     """
+    from cerberus import Validator
 
-    def _validate_is_qualname_or_script(self, is_qualname, field, value):
-        """Test if a string is a Python qualname.
+    class ConfigValidator(Validator):
+        """
+        Base class for the validators of the configuration file sections.
 
-        The rule's arguments are validated against this schema:
-        {'type': 'boolean'}
+        The schemas below have no normalization rules (``default``, ``coerce``,
+        ``rename``, ...), so the normalization pass Cerberus would run over the
+        whole document before validating it is skipped by default.
         """
-        if is_qualname and not isinstance(value, str):
-            self._error(field, "Must be a string")
-        if is_qualname:
-            if value.startswith("script://"):
-                script_path = value.replace("script://", "")
-                script_path = script_path.rsplit(":", 1)[0]
-                try:
-                    pathlib.Path(script_path).expanduser().resolve()
-                except TypeError as e:
-                    self._error(field, f"{e.args[0]}. Must be a string")
-                if not pathlib.Path(script_path).expanduser().resolve().is_file():
-                    self._error(field, "Must be a valid file path")
-            else:
-                parts = value.split(".")
-                module_name, attr_name = ".".join(parts[:-1]), parts[-1]
-                try:
-                    module = importlib.import_module(module_name)
-                    if not hasattr(module, attr_name):
-                        self._error(field, "Must be a valid Python qualname")
-                except (ImportError, ModuleNotFoundError):
+
+        def validate(self, document, schema=None, update=False, normalize=False):
+            return super().validate(document, schema=schema, update=update, normalize=normalize)
+
+    class DirectoryAwareValidator(ConfigValidator):
+        """
+        A Validator that can check if a field is a directory.
+        """
+
+        def _validate_is_directory(self, is_directory, field, value):
+            """
+            Checks if a string can be a pathlib.Path object.
+
+            The rule's arguments are validated against this schema:
+            {'type': 'boolean'}
+            """
+            if is_directory:
+                error = _check_directory(value) if isinstance(value, str) else "Must be a string"
+                if error:
+                    self._error(field, error)
+
+        def _check_pattern(self, pattern, field, value):
+            # Like the regex rule, but with a pattern compiled once instead of on every check
+            if isinstance(value, str) and not pattern.match(value):
+                self._error(field, f"value does not match regex '{pattern.pattern}'")
+
+        def _check_with_variant_label(self, field, value):
+            self._check_pattern(VARIANT_LABEL_PATTERN, field, value)
+
+        def _check_with_time_units(self, field, value):
+            self._check_pattern(TIME_UNITS_PATTERN, field, value)
+
+    class GeneralSectionValidator(DirectoryAwareValidator):
+        """A Validator for the general section of the configuration file"""
+
+    class PipelineSectionValidator(ConfigValidator):
+        """
+        Validator for pipeline configuration.
+
+        See Also
+        --------
+        * https://cerberus-sanhe.readthedocs.io/customize.html#class-based-custom-validators
+        """
+
+        def _validate_is_qualname_or_script(self, is_qualname, field, value):
+            """Test if a string is a Python qualname.
+
+            The rule's arguments are validated against this schema:
+            {'type': 'boolean'}
+            """
+            if is_qualname and not isinstance(value, str):
+                self._error(field, "Must be a string")
+            if is_qualname:
+                if value.startswith(SCRIPT_PREFIX):
+                    script_path = value[len(SCRIPT_PREFIX) :].rsplit(":", 1)[0]
+                    try:
+                        path = pathlib.Path(script_path).expanduser()
+                    except TypeError as e:
+                        self._error(field, f"{e.args[0]}. Must be a string")
+                    else:
+                        # is_file follows symlinks itself, the path does not need to be resolved first
+                        if not path.is_file():
+                            self._error(field, "Must be a valid file path")
+                elif not _is_qualname(value):
                     self._error(field, "Must be a valid Python qualname")
 
-    def _validate(self, document):
-        super()._validate(document)
-        if "steps" not in document and "uses" not in document:
-            self._error("document", 'At least one of "steps" or "uses" must be specified')
+        def _validate(self, document):
+            super()._validate(document)
+            if "steps" not in document and "uses" not in document:
+                self._error("document", 'At least one of "steps" or "uses" must be specified')
+
+    class RuleSectionValidator(DirectoryAwareValidator):
+        """Validator for rules configuration."""
 
+    class ConfigFileValidator(RuleSectionValidator, PipelineSectionValidator):
+        """Validator for the general, rules and pipelines sections of a configuration file at once."""
 
-class RuleSectionValidator(DirectoryAwareValidator):
-    """Validator for rules configuration."""
+    classes = {}
+    for cls in (
+        ConfigValidator,
+        DirectoryAwareValidator,
+        GeneralSectionValidator,
+        PipelineSectionValidator,
+        RuleSectionValidator,
+        ConfigFileValidator,
+    ):
+        cls.__qualname__ = cls.__name__
+        classes[cls.__name__] = cls
+    return classes
 
 
 GENERAL_SCHEMA = {
@@ -93,10 +198,12 @@ GENERAL_SCHEMA = {
             "cmor_version": {
                 "type": "string",
                 "required": True,
-                "allowed": [
-                    "CMIP6",
-                    "CMIP7",
-                ],
+                "allowed": frozenset(
+                    {
+                        "CMIP6",
+                        "CMIP7",
+                    }
+                ),
             },
             "CV_Dir": {
                 "type": "string",
@@ -128,10 +235,14 @@ GENERAL_SCHEMA = {
         },
     },
 }
-"""dict : Schema for validating general configuration."""
+GENERAL_SCHEMA = MappingProxyType(GENERAL_SCHEMA)
+"""MappingProxyType : Schema for validating general configuration, read-only as the validators share it."""
 
-GENERAL_VALIDATOR = GeneralSectionValidator(GENERAL_SCHEMA)
-"""Validator : Validator for general configuration."""
+
+@functools.lru_cache(maxsize=None)
+def get_general_validator():
+    """Get the validator for general configuration, it is built once and then reused."""
+    return _validator_classes()["GeneralSectionValidator"](GENERAL_SCHEMA)
 
 
 PIPELINES_SCHEMA = {
@@ -151,10 +262,15 @@ PIPELINES_SCHEMA = {
         },
     },
 }
-"""dict : Schema for validating pipelines configuration."""
+PIPELINES_SCHEMA = MappingProxyType(PIPELINES_SCHEMA)
+"""MappingProxyType : Schema for validating pipelines configuration, read-only as the validators share it."""
+
+
+@functools.lru_cache(maxsize=None)
+def get_pipelines_validator():
+    """Get the validator for pipelines configuration, it is built once and then reused."""
+    return _validator_classes()["PipelineSectionValidator"](PIPELINES_SCHEMA)
 
-PIPELINES_VALIDATOR = PipelineSectionValidator(PIPELINES_SCHEMA)
-"""Validator : Validator for pipelines configuration."""
 
 RULES_SCHEMA = {
     "rules": {
@@ -176,17 +292,21 @@ RULES_SCHEMA = {
                 "input_type": {
                     "type": "string",
                     "required": False,
-                    "allowed": [
-                        "xr.DataArray",
-                        "xr.Dataset",
-                    ],
+                    "allowed": frozenset(
+                        {
+                            "xr.DataArray",
+                            "xr.Dataset",
+                        }
+                    ),
                 },
                 "input_source": {
                     "type": "string",
                     "required": False,
-                    "allowed": [
-                        "xr_tutorial",
-                    ],
+                    "allowed": frozenset(
+                        {
+                            "xr_tutorial",
+                        }
+                    ),
                 },
                 "inputs": {
                     "type": "list",
@@ -213,7 +333,7 @@ RULES_SCHEMA = {
                 "variant_label": {
                     "type": "string",
                     "required": True,
-                    "regex": r"^r\d+i\d+p\d+f\d+$",
+                    "check_with": "variant_label",
                 },
                 "source_id": {"type": "string", "required": True},
                 "output_directory": {
@@ -262,30 +382,73 @@ RULES_SCHEMA = {
                 "time_units": {
                     "type": "string",
                     "required": False,
-                    "regex": (
-                        r"^\s*(days|hours|minutes|seconds|milliseconds|microseconds|nanoseconds)"
-                        r"\s+since\s+\d{4}-\d{2}-\d{2}(\s+\d{2}:\d{2}:\d{2}(.\d+)?)?\s*$"
-                    ),
+                    "check_with": "time_units",
                 },
                 "time_calendar": {
                     "type": "string",
                     "required": False,
-                    "allowed": [
-                        "standard",
-                        "gregorian",
-                        "proleptic_gregorian",
-                        "noleap",
-                        "365_day",
-                        "all_leap",
-                        "366_day",
-                        "360_day",
-                        "julian",
-                        "none",
-                    ],
+                    "allowed": frozenset(
+                        {
+                            "standard",
+                            "gregorian",
+                            "proleptic_gregorian",
+                            "noleap",
+                            "365_day",
+                            "all_leap",
+                            "366_day",
+                            "360_day",
+                            "julian",
+                            "none",
+                        }
+                    ),
                 },
             },
         },
     },
 }
-"""dict : Schema for validating rules configuration."""
-RULES_VALIDATOR = RuleSectionValidator(RULES_SCHEMA)
+RULES_SCHEMA = MappingProxyType(RULES_SCHEMA)
+"""MappingProxyType : Schema for validating rules configuration, read-only as the validators share it."""
+
+
+@functools.lru_cache(maxsize=None)
+def get_rules_validator():
+    """Get the validator for rules configuration, it is built once and then reused."""
+    return _validator_classes()["RuleSectionValidator"](RULES_SCHEMA)
+
+
+CONFIG_SCHEMA = MappingProxyType({**GENERAL_SCHEMA, **PIPELINES_SCHEMA, **RULES_SCHEMA})
+"""MappingProxyType : Schema for validating the general, pipelines and rules configuration together."""
+
+
+@functools.lru_cache(maxsize=None)
+def get_config_validator():
+    """
+    Get the validator for a whole configuration, it is built once and then reused.
+
+    Checking all sections in one document takes a single pass instead of
+    one per section. Other top-level sections are not allowed, only pass
+    ``general``, ``pipelines`` and ``rules``.
+    """
+    return _validator_classes()["ConfigFileValidator"](CONFIG_SCHEMA)
+
+
+_LAZY_VALIDATORS = {
+    "GENERAL_VALIDATOR": get_general_validator,
+    "PIPELINES_VALIDATOR": get_pipelines_validator,
+    "RULES_VALIDATOR": get_rules_validator,
+}
+
+
+def __getattr__(name):
+    """
+    Provide the validator classes and the validators, building them on first use.
+
+    ``GENERAL_VALIDATOR``, ``PIPELINES_VALIDATOR`` and ``RULES_VALIDATOR`` are
+    the validators for the general, pipelines and rules configuration, the same
+    instances the ``get_*_validator`` functions return.
+    """
+    if name in _LAZY_VALIDATORS:
+        return _LAZY_VALIDATORS[name]()
+    if name in _VALIDATOR_CLASS_NAMES:
+        return _validator_classes()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
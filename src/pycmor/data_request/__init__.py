@@ -1,28 +1,40 @@
 """Data Request module for pycmor.
 
 This module provides interfaces to CMIP6 and CMIP7 data requests.
+
+The classes are imported from their submodules on first access, so that e.g.
+CMIP6 users do not pay for importing the CMIP7 interface.
 """
 
-from .collection import CMIP6DataRequest, CMIP7DataRequest, DataRequest
-from .table import (
-    CMIP6DataRequestTable,
-    CMIP6DataRequestTableHeader,
-    CMIP7DataRequestTable,
-    CMIP7DataRequestTableHeader,
-    DataRequestTable,
-    DataRequestTableHeader,
-)
-from .variable import CMIP6DataRequestVariable, CMIP7DataRequestVariable, DataRequestVariable
+import importlib
 
-# Import CMIP7 interface if available
-try:
-    from .cmip7_interface import CMIP7_API_AVAILABLE, CMIP7Interface, get_cmip7_interface
-except ImportError:
-    CMIP7Interface = None
-    get_cmip7_interface = None
-    CMIP7_API_AVAILABLE = False
+# Submodule providing each of the names below, see __getattr__
+_LAZY = {
+    "DataRequest": "collection",
+    "CMIP6DataRequest": "collection",
+    "CMIP7DataRequest": "collection",
+    "DataRequestTable": "table",
+    "DataRequestTableHeader": "table",
+    "CMIP6DataRequestTable": "table",
+    "CMIP6DataRequestTableHeader": "table",
+    "CMIP7DataRequestTable": "table",
+    "CMIP7DataRequestTableHeader": "table",
+    "DataRequestVariable": "variable",
+    "CMIP6DataRequestVariable": "variable",
+    "CMIP7DataRequestVariable": "variable",
+    "CMIP7Interface": "cmip7_interface",
+    "get_cmip7_interface": "cmip7_interface",
+    "CMIP7_API_AVAILABLE": "cmip7_interface",
+}
 
-__all__ = [
+# Used if the CMIP7 interface can not be imported
+_CMIP7_INTERFACE_FALLBACKS = {
+    "CMIP7Interface": None,
+    "get_cmip7_interface": None,
+    "CMIP7_API_AVAILABLE": False,
+}
+
+__all__ = (
     # Base classes
     "DataRequest",
     "DataRequestTable",
@@ -42,4 +54,25 @@ __all__ = [
     "CMIP7Interface",
     "get_cmip7_interface",
     "CMIP7_API_AVAILABLE",
-]
+)
+
+
+def __getattr__(name):
+    """Import the classes listed in ``_LAZY`` from their submodule on first access."""
+    try:
+        submodule = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    try:
+        value = getattr(importlib.import_module(f".{submodule}", __name__), name)
+    except ImportError:
+        if name not in _CMIP7_INTERFACE_FALLBACKS:
+            raise
+        value = _CMIP7_INTERFACE_FALLBACKS[name]
+    # Remember it, later lookups do not get here anymore
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(globals().keys() | _LAZY.keys())
@@ -39,24 +39,301 @@ True
 True
 """
 
-import json
+import functools
+import hashlib
+import importlib.util
+import os
+import pickle
+import shutil
+import stat
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import ClassVar, Dict, List, Optional, Tuple, Union
 
 from ..core.logging import logger
 
-# Try to import the official CMIP7 Data Request API
+# Use orjson for parsing if available, it is considerably faster than the standard library
 try:
-    from data_request_api.command_line import export_dreq_lists_json
-    from data_request_api.content import dreq_content
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
 
-    CMIP7_API_AVAILABLE = True
-    logger.debug("CMIP7 Data Request API loaded successfully")
-except ImportError as e:
-    CMIP7_API_AVAILABLE = False
-    logger.warning(f"CMIP7 Data Request API not available: {e}. " "Install with: pip install CMIP7-data-request-api")
-    dreq_content = None
-    export_dreq_lists_json = None
+# ijson allows reading single variables from a metadata file without parsing all of it
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Import the official CMIP7 Data Request API, if it is installed. Checking for it
+# first avoids raising (and handling) an ImportError in the common case that it is not.
+CMIP7_API_AVAILABLE = False
+dreq_content = None
+export_dreq_lists_json = None
+if importlib.util.find_spec("data_request_api") is not None:
+    try:
+        # Not used here, the tool is run as a command; kept importable from this module for existing callers
+        from data_request_api.command_line import export_dreq_lists_json  # noqa: F401
+        from data_request_api.content import dreq_content
+
+        CMIP7_API_AVAILABLE = True
+        logger.debug("CMIP7 Data Request API loaded successfully")
+    except ImportError as e:
+        logger.warning(f"CMIP7 Data Request API could not be imported: {e}")
+else:
+    logger.warning("CMIP7 Data Request API not available. Install with: pip install CMIP7-data-request-api")
+
+# Bump to invalidate pickled metadata written by older versions, see _load_cached_json
+_PICKLE_VERSION = 4
+# Metadata strings up to this length are shared between variables, see _pool_strings
+MAX_POOLED_STRING_LENGTH = 64
+# Cached metadata files found by _find_cached_metadata, by (version, PYCMOR_CMIP7_METADATA_DIR, user cache dir)
+_CACHED_METADATA_FILES: Dict[Tuple[str, Optional[str], Path], Path] = {}
+
+
+def _pool_strings(data: Union[Dict, List], pool: Optional[Dict[str, str]] = None) -> Union[Dict, List]:
+    """
+    Replace equal strings in parsed JSON with a single shared object, in place.
+
+    Values like realms, frequencies, units or cell methods repeat for thousands of
+    variables, but the parser creates a new string for each of them. A plain dict
+    is used as pool rather than :func:`sys.intern`, so the strings are freed again
+    together with the metadata.
+
+    Parameters
+    ----------
+    data : dict or list
+        Parsed JSON.
+    pool : dict, optional
+        Strings seen so far, used for the recursion.
+
+    Returns
+    -------
+    dict or list
+        The same ``data``.
+    """
+    if pool is None:
+        pool = {}
+    items = data.items() if isinstance(data, dict) else enumerate(data)
+    for key, value in items:
+        if isinstance(value, str):
+            if len(value) <= MAX_POOLED_STRING_LENGTH:
+                data[key] = pool.setdefault(value, value)
+        elif isinstance(value, (dict, list)):
+            _pool_strings(value, pool)
+    return data
+
+
+def _user_cache_dir() -> Path:
+    """Get the user's CMIP7 metadata cache, below ``$XDG_CACHE_HOME`` like the other pycmor caches."""
+    return Path(os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache") / "pycmor" / "cmip7_metadata"
+
+
+def _find_cached_metadata(version: str) -> Optional[Path]:
+    """
+    Find the cached metadata JSON file of a data request version.
+
+    Priority: ``PYCMOR_CMIP7_METADATA_DIR`` > user cache (see :func:`_user_cache_dir`) > system cache.
+
+    Parameters
+    ----------
+    version : str
+        The data request version.
+
+    Returns
+    -------
+    Optional[Path]
+        The cached file, or None if the version is not cached.
+    """
+    cache_key = (version, os.getenv("PYCMOR_CMIP7_METADATA_DIR"), _user_cache_dir())
+    cached_file = _CACHED_METADATA_FILES.get(cache_key)
+    if cached_file is None:
+        cached_file = _resolve_cached_metadata(*cache_key)
+        # Only files that were found are remembered, a file added later (e.g. by
+        # another process) is still found by the next search
+        if cached_file is not None:
+            _CACHED_METADATA_FILES[cache_key] = cached_file
+    return cached_file
+
+
+def _resolve_cached_metadata(version: str, env_metadata_dir: Optional[str], user_cache_dir: Path) -> Optional[Path]:
+    """
+    Search the cache directories for :func:`_find_cached_metadata`.
+
+    Found files are remembered in ``_CACHED_METADATA_FILES``, so repeated loads
+    do not touch the filesystem. Clear it when cache files are removed.
+    """
+    logger.debug(f"PYCMOR_CMIP7_METADATA_DIR={env_metadata_dir}")
+    cache_dirs = [Path(env_metadata_dir)] if env_metadata_dir else []
+    cache_dirs += [
+        user_cache_dir,
+        Path("/home/mambauser") / ".cache" / "pycmor" / "cmip7_metadata",
+    ]
+    for cache_dir in cache_dirs:
+        cache_path = cache_dir / f"{version}.json"
+        # A single stat per candidate, the result is reused for the log message
+        exists = cache_path.exists()
+        logger.debug(f"Checking cache path: {cache_path} (exists={exists})")
+        if exists:
+            return cache_path
+    return None
+
+
+def _metadata_cache_dir() -> Optional[Path]:
+    """
+    Get the directory metadata exported with the API is cached in.
+
+    This is ``PYCMOR_CMIP7_METADATA_DIR`` if set, otherwise the user cache.
+
+    Returns
+    -------
+    Optional[Path]
+        The cache directory, or None if it can not be written to.
+    """
+    env_metadata_dir = os.getenv("PYCMOR_CMIP7_METADATA_DIR")
+    cache_dir = Path(env_metadata_dir) if env_metadata_dir else _user_cache_dir()
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+    except OSError as e:
+        logger.warning(f"Could not cache CMIP7 metadata in {cache_dir}: {e}")
+        return None
+    if not os.access(cache_dir, os.W_OK):
+        logger.warning(f"Could not cache CMIP7 metadata in {cache_dir}: directory is not writable")
+        return None
+    return cache_dir
+
+
+def _cache_exported_file(cached_name: str, exported_file: Path) -> Optional[Path]:
+    """
+    Move a file exported with the API into the cache, so later loads do not export it again.
+
+    A file that was exported into the cache directory is just renamed, any other
+    file is copied.
+
+    Parameters
+    ----------
+    cached_name : str
+        Name of the file in the cache, e.g. ``v1.2.2.2.json``.
+    exported_file : Path
+        The exported file.
+
+    Returns
+    -------
+    Optional[Path]
+        The cached file, or None if it could not be cached.
+    """
+    cache_dir = _metadata_cache_dir()
+    if cache_dir is None:
+        return None
+    cached_file = cache_dir / cached_name
+    # Copy to a temporary file first, so other processes never read a partial file
+    tmp_file = cached_file.with_name(f"{cached_file.name}.{os.getpid()}")
+    try:
+        if exported_file.parent == cache_dir:
+            os.replace(exported_file, cached_file)
+        else:
+            shutil.copyfile(exported_file, tmp_file)
+            os.replace(tmp_file, cached_file)
+    except OSError as e:
+        logger.warning(f"Could not cache {cached_name} in {cache_dir}: {e}")
+        tmp_file.unlink(missing_ok=True)
+        return None
+    logger.info(f"Cached {cached_name} in {cache_dir}")
+    _CACHED_METADATA_FILES.clear()
+    return cached_file
+
+
+def _pickle_cache_file(json_file: Path) -> Path:
+    """
+    Get the location of the pickled copy of a cached metadata JSON file, see :func:`_load_cached_json`.
+
+    Pickles are only ever kept in the user's own cache, never next to the JSON
+    file: unpickling runs code, so a pickle in a shared directory such as
+    ``PYCMOR_CMIP7_METADATA_DIR`` would let anyone who can write there run code
+    in every pycmor process reading it. The name includes a hash of the JSON
+    file's real path, so copies from different directories do not collide.
+    """
+    digest = hashlib.sha256(os.fsencode(os.path.realpath(json_file))).hexdigest()[:16]
+    return _user_cache_dir() / "pickled" / f"{json_file.stem}.{digest}.pkl"
+
+
+def _is_private_file(file_stat: os.stat_result) -> bool:
+    """Check that a file is owned by the current user and can not be written by anyone else."""
+    if not hasattr(os, "getuid"):
+        return True
+    return file_stat.st_uid == os.getuid() and not file_stat.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
+
+
+def _load_cached_json(json_file: Path, header_only: bool = False) -> Dict:
+    """
+    Load a cached metadata JSON file, using a pickled copy of it if possible.
+
+    Unpickling the metadata is several times faster than parsing the JSON. The
+    pickle lives in the user's own cache (see :func:`_pickle_cache_file`) and is
+    only read if it belongs to the current user and nobody else can write it.
+    It records the modification time (in nanoseconds) and size of the JSON file
+    it was made from, and is (re)written whenever it is missing, does not match
+    the current JSON file exactly or was written with a different
+    ``_PICKLE_VERSION``. Comparing against the recorded values rather than the
+    pickle's own modification time also catches a JSON file replaced by one
+    with an older timestamp (e.g. by ``cp -p`` or ``rsync -a``). It holds two
+    records, first the small ``Header`` block and then the full metadata, so
+    the header can be read without loading the rest.
+
+    Parameters
+    ----------
+    json_file : Path
+        The cached JSON file.
+    header_only : bool, optional
+        If True, only return the ``Header`` block. Default is False.
+
+    Returns
+    -------
+    Dict
+        The parsed metadata, or only its header.
+    """
+    pickle_file = _pickle_cache_file(json_file)
+    try:
+        with open(pickle_file, "rb") as f:
+            if _is_private_file(os.fstat(f.fileno())):
+                pickle_version, source, header = pickle.load(f)
+                json_stat = json_file.stat()
+                if pickle_version == _PICKLE_VERSION and source == (json_stat.st_mtime_ns, json_stat.st_size):
+                    return header if header_only else pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError, TypeError, ValueError):
+        pass
+
+    # The recorded stat is taken from the file that is actually parsed
+    with open(json_file, "rb") as f:
+        json_stat = os.fstat(f.fileno())
+        raw = f.read()
+    source = (json_stat.st_mtime_ns, json_stat.st_size)
+    # Pooling before pickling also stores each shared string only once in the pickle
+    data = _pool_strings(json_loads(raw))
+    header = data.get("Header", {})
+    # Write to a temporary file first, so other processes never read a partial pickle
+    tmp_file = pickle_file.with_name(f"{pickle_file.name}.{os.getpid()}")
+    try:
+        pickle_file.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        with open(os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), "wb") as f:
+            pickle.dump((_PICKLE_VERSION, source, header), f, protocol=5)
+            pickle.dump(data, f, protocol=5)
+        os.replace(tmp_file, pickle_file)
+    except OSError as e:
+        logger.debug(f"Could not write pickled metadata cache {pickle_file}: {e}")
+        tmp_file.unlink(missing_ok=True)
+    return header if header_only else data
+
+
+@functools.lru_cache(maxsize=8192)
+def _parse_compound_name(cmip7_compound_name: str) -> Tuple[str, str, str, str, str]:
+    """Split a CMIP7 compound name into its parts, see :meth:`CMIP7Interface.parse_compound_name`."""
+    try:
+        realm, variable, branding, frequency, region = cmip7_compound_name.split(".")
+    except ValueError:
+        raise ValueError(
+            f"Invalid CMIP7 compound name: {cmip7_compound_name}. "
+            "Expected format: realm.variable.branding.frequency.region"
+        ) from None
+    return realm, variable, branding, frequency, region
 
 
 class CMIP7Interface:
@@ -86,6 +363,25 @@ class CMIP7Interface:
     air_temperature
     """
 
+    # Metadata and indices loaded from files, shared by all instances. Keyed by
+    # (version, real path) of the file they were loaded from, the value holds the
+    # file's modification time and the shared attributes. Only the newest load of
+    # each file is kept, so re-exported files do not keep older copies alive.
+    _GLOBAL_METADATA_CACHE: ClassVar[Dict[Tuple[str, str], Tuple[int, Dict]]] = {}
+    # Instance attributes stored in _GLOBAL_METADATA_CACHE
+    _SHARED_ATTRIBUTES = (
+        "_metadata",
+        "_version",
+        "_compound_names",
+        "_cmip6_index",
+        "_names",
+        "_parts",
+        "_metas",
+        "_by_variable",
+        "_by_realm_variable",
+        "_by_variable_frequency",
+    )
+
     def __init__(self):
         """Initialize the CMIP7 interface."""
         if not CMIP7_API_AVAILABLE:
@@ -96,6 +392,18 @@ class CMIP7Interface:
         self._metadata = None
         self._version = None
         self._experiments_data = None
+        # File to load the experiments data from on first access, see the experiments_data property
+        self._experiments_file = None
+        self._experiment_priorities = {}
+        self._compound_names = {}
+        self._cmip6_index = {}
+        # Compound names split into their parts once, see _build_indices
+        self._names = []
+        self._parts = []
+        self._metas = []
+        self._by_variable = {}
+        self._by_realm_variable = {}
+        self._by_variable_frequency = {}
 
     def get_available_versions(self, offline: bool = False) -> List[str]:
         """
@@ -134,89 +442,212 @@ class CMIP7Interface:
             instead of using the API.
         force_reload : bool, optional
             If True, force reload even if already loaded. Default is False.
+
+        Notes
+        -----
+        The experiments data exported together with the metadata is cached next
+        to it. Unless experiments data was loaded already, it is then available
+        through :attr:`experiments_data` without calling :meth:`load_experiments_data`.
         """
         if not force_reload and self._metadata is not None and self._version == version:
             return
+        if force_reload:
+            _CACHED_METADATA_FILES.clear()
 
         if metadata_file is not None:
-            # Load from local file
             metadata_file = Path(metadata_file)
+            source_file = metadata_file
+        else:
+            # Check for cached metadata file first
+            source_file = _find_cached_metadata(version)
+            if source_file is not None and self._experiments_data is None:
+                experiments_file = source_file.with_name(f"{version}.experiments.json")
+                self._experiments_file = experiments_file if experiments_file.exists() else None
+
+        cache_key = None
+        if source_file is not None:
+            try:
+                mtime = source_file.stat().st_mtime_ns
+            except FileNotFoundError:
+                if metadata_file is not None:
+                    raise
+                # The cached file was removed after it was found, search again
+                _CACHED_METADATA_FILES.clear()
+                return self.load_metadata(version, force_reload=force_reload)
+            cache_key = (version, os.path.realpath(source_file))
+            cached = self._GLOBAL_METADATA_CACHE.get(cache_key)
+            if not force_reload and cached is not None and cached[0] == mtime:
+                logger.debug(f"Reusing CMIP7 metadata loaded from {source_file}")
+                self.__dict__.update(cached[1])
+                return
+
+        if metadata_file is not None:
+            # Load from local file
             logger.info(f"Loading CMIP7 metadata from file: {metadata_file}")
-            with open(metadata_file, "r") as f:
-                self._metadata = json.load(f)
+            self._metadata = _pool_strings(json_loads(metadata_file.read_bytes()))
             self._version = self._metadata.get("Header", {}).get("dreq content version", version)
+        elif source_file is not None:
+            logger.info(f"Loading CMIP7 metadata from cache: {source_file}")
+            self._metadata = _load_cached_json(source_file)
+            self._version = version
         else:
-            # Check for cached metadata file first
-            # Priority: env var > user cache > system cache
-            import os
-
-            cached_file = None
-
-            # 1. Check environment variable
-            env_metadata_dir = os.getenv("PYCMOR_CMIP7_METADATA_DIR")
-            logger.debug(f"PYCMOR_CMIP7_METADATA_DIR={env_metadata_dir}")
-            if env_metadata_dir:
-                env_cache_path = Path(env_metadata_dir) / f"{version}.json"
-                logger.debug(f"Checking env var path: {env_cache_path} (exists={env_cache_path.exists()})")
-                if env_cache_path.exists():
-                    cached_file = env_cache_path
-
-            # 2. Check standard cache locations
-            if not cached_file:
-                logger.debug(f"Path.home() = {Path.home()}")
-                cache_locations = [
-                    Path.home() / ".cache" / "pycmor" / "cmip7_metadata" / f"{version}.json",
-                    Path("/home/mambauser") / ".cache" / "pycmor" / "cmip7_metadata" / f"{version}.json",
-                ]
-                for cache_path in cache_locations:
-                    logger.debug(f"Checking cache path: {cache_path} (exists={cache_path.exists()})")
-                    if cache_path.exists():
-                        cached_file = cache_path
-                        break
-
-            if cached_file:
-                logger.info(f"Loading CMIP7 metadata from cache: {cached_file}")
-                with open(cached_file, "r") as f:
-                    self._metadata = json.load(f)
-                self._version = version
-            else:
-                # Use the API to export metadata directly
-                import subprocess
-                import tempfile
-
-                logger.info(f"Loading CMIP7 metadata for version: {version} using API")
-                with tempfile.TemporaryDirectory() as tmpdir:
-                    tmpdir_path = Path(tmpdir)
-                    output_file = tmpdir_path / "metadata.json"
-                    # Export metadata using the command-line tool
-                    # Uses -a (all opportunities) and -m (variables metadata output)
-                    # We need both the main output and the metadata output
-                    logger.debug(f"Exporting CMIP7 data request to: {output_file}")
-                    experiments_file = tmpdir_path / "experiments.json"
-                    result = subprocess.run(
-                        ["export_dreq_lists_json", "-a", version, str(experiments_file), "-m", str(output_file)],
-                        capture_output=True,
-                        text=True,
+            self._metadata = self._export_with_api(version)
+            self._version = version
+
+        self._build_indices()
+        if cache_key is not None:
+            # Replaces the metadata of an older version of the file, if any
+            shared = {name: getattr(self, name) for name in self._SHARED_ATTRIBUTES}
+            self._GLOBAL_METADATA_CACHE[cache_key] = (mtime, shared)
+        logger.info(f"Loaded metadata for {len(self._metadata.get('Compound Name', {}))} variables")
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Forget the metadata shared between instances and the cached files found, e.g. after they changed."""
+        cls._GLOBAL_METADATA_CACHE.clear()
+        _CACHED_METADATA_FILES.clear()
+
+    def load_all(self, version: str = "v1.2.2.2", force_reload: bool = False) -> None:
+        """
+        Load the metadata and the experiments data for a specific version.
+
+        Both are produced by a single export with the API, which is run at most once.
+
+        Parameters
+        ----------
+        version : str, optional
+            Version to load. Default is "v1.2.2.2".
+        force_reload : bool, optional
+            If True, force reload even if already loaded. Default is False.
+        """
+        if force_reload:
+            self._set_experiments_data(None)
+        self.load_metadata(version, force_reload=force_reload)
+        if self.experiments_data is None:
+            # The metadata was already loaded, or came from a cache without experiments data
+            self._metadata = self._export_with_api(version)
+            self._version = version
+            self._build_indices()
+
+    def _export_with_api(self, version: str) -> Dict:
+        """
+        Export the metadata and experiments data of a version with ``export_dreq_lists_json``.
+
+        Both files are cached if possible. The experiments data replaces any loaded
+        experiments data, it is read on first access of :attr:`experiments_data`.
+
+        Parameters
+        ----------
+        version : str
+            Version to export.
+
+        Returns
+        -------
+        Dict
+            The metadata.
+        """
+        import subprocess
+        import tempfile
+
+        logger.info(f"Loading CMIP7 metadata for version: {version} using API")
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmpdir_path = Path(tmpdir)
+            # Export straight into the cache if possible, so it does not have to be copied there afterwards
+            cache_dir = _metadata_cache_dir()
+            export_dir = cache_dir if cache_dir is not None else tmpdir_path
+            output_file = export_dir / f".{version}.json.{os.getpid()}"
+            experiments_file = export_dir / f".{version}.experiments.json.{os.getpid()}"
+            # Export metadata using the command-line tool
+            # Uses -a (all opportunities) and -m (variables metadata output)
+            # We need both the main output and the metadata output
+            logger.debug(f"Exporting CMIP7 data request to: {output_file}")
+            try:
+                result = subprocess.run(
+                    ["export_dreq_lists_json", "-a", version, str(experiments_file), "-m", str(output_file)],
+                    capture_output=True,
+                    text=True,
+                )
+                if result.returncode != 0:
+                    raise RuntimeError(
+                        f"Failed to export CMIP7 metadata: {result.stderr}\n"
+                        f"You may need to run: export_dreq_lists_json -a {version} "
+                        f"<experiments_file> -m <metadata_file>"
+                    )
+                # Load the generated metadata file
+                metadata_file = output_file
+                if not metadata_file.exists():
+                    raise FileNotFoundError(
+                        f"Metadata file not found after export: {metadata_file}. "
+                        f"Expected files in {export_dir}: {list(export_dir.glob('*'))}"
                     )
-                    if result.returncode != 0:
-                        raise RuntimeError(
-                            f"Failed to export CMIP7 metadata: {result.stderr}\n"
-                            f"You may need to run: export_dreq_lists_json -a {version} "
-                            f"<experiments_file> -m <metadata_file>"
-                        )
-                    # Load the generated metadata file
-                    metadata_file = output_file
-                    if not metadata_file.exists():
-                        raise FileNotFoundError(
-                            f"Metadata file not found after export: {metadata_file}. "
-                            f"Expected files in {tmpdir_path}: {list(tmpdir_path.glob('*'))}"
-                        )
-                    logger.debug(f"Reading metadata from: {metadata_file}")
-                    with open(metadata_file, "r") as f:
-                        self._metadata = json.load(f)
-                    self._version = version
+                logger.debug(f"Reading metadata from: {metadata_file}")
+                metadata = _pool_strings(json_loads(metadata_file.read_bytes()))
+                _cache_exported_file(f"{version}.json", metadata_file)
+                if experiments_file.exists():
+                    cached_experiments_file = _cache_exported_file(f"{version}.experiments.json", experiments_file)
+                    if cached_experiments_file is not None:
+                        self._set_experiments_data(None, experiments_file=cached_experiments_file)
+                    else:
+                        # The file is removed below, so it can not be read later
+                        self._set_experiments_data(json_loads(experiments_file.read_bytes()))
+            finally:
+                # Only left over if the export or caching failed
+                output_file.unlink(missing_ok=True)
+                experiments_file.unlink(missing_ok=True)
+        return metadata
+
+    def load_metadata_header(self, version: str = "v1.2.2.2") -> Optional[Dict]:
+        """
+        Get the ``Header`` block of the metadata for a specific version.
 
-        logger.info(f"Loaded metadata for {len(self._metadata.get('Compound Name', {}))} variables")
+        Unlike :meth:`load_metadata`, this does not load the variables, so it is
+        cheap to e.g. check which content version a cached file holds.
+
+        Parameters
+        ----------
+        version : str, optional
+            Version to look up. Default is "v1.2.2.2".
+
+        Returns
+        -------
+        Optional[Dict]
+            The header, or None if the version is neither loaded nor cached.
+        """
+        if self._metadata is not None and self._version == version:
+            return self._metadata.get("Header", {})
+        cached_file = _find_cached_metadata(version)
+        if cached_file is None:
+            return None
+        return _load_cached_json(cached_file, header_only=True)
+
+    def _build_indices(self) -> None:
+        """Build the lookup tables used by the query methods from the loaded metadata."""
+        self._compound_names = self._metadata.get("Compound Name", {})
+        self._cmip6_index = {}
+        self._names = []
+        self._parts = []
+        self._metas = []
+        self._by_variable = {}
+        self._by_realm_variable = {}
+        self._by_variable_frequency = {}
+        for cmip7_name, metadata in self._compound_names.items():
+            cmip6_compound_name = metadata.get("cmip6_compound_name")
+            if cmip6_compound_name:
+                # Several CMIP7 variants may map to the same CMIP6 name, keep the first one
+                self._cmip6_index.setdefault(cmip6_compound_name, metadata)
+
+            # Parse compound name: realm.variable.branding.frequency.region
+            parts = tuple(cmip7_name.split("."))
+            if len(parts) != 5:
+                continue
+            realm, variable, _, frequency, _ = parts
+            index = len(self._names)
+            self._by_variable.setdefault(variable, []).append(index)
+            self._by_realm_variable.setdefault((realm, variable), []).append(index)
+            self._by_variable_frequency.setdefault((variable, frequency), []).append(index)
+            self._names.append(cmip7_name)
+            self._parts.append(parts)
+            self._metas.append(metadata)
 
     def load_experiments_data(self, experiments_file: Union[str, Path]) -> Dict:
         """
@@ -234,10 +665,24 @@ class CMIP7Interface:
         """
         experiments_file = Path(experiments_file)
         logger.info(f"Loading experiments data from: {experiments_file}")
-        with open(experiments_file, "r") as f:
-            self._experiments_data = json.load(f)
+        self._set_experiments_data(json_loads(experiments_file.read_bytes()))
         return self._experiments_data
 
+    def _set_experiments_data(self, experiments_data: Optional[Dict], experiments_file: Optional[Path] = None) -> None:
+        """
+        Store the experiments data and index its variable lists by (experiment, priority).
+
+        Alternatively, ``experiments_file`` is stored to load the data from on first access.
+        """
+        self._experiments_data = experiments_data
+        self._experiments_file = experiments_file
+        self._experiment_priorities = {}
+        if experiments_data is None:
+            return
+        for experiment, exp_data in experiments_data.get("experiment", {}).items():
+            for priority, variables in exp_data.items():
+                self._experiment_priorities[(experiment, priority)] = variables
+
     def get_variable_metadata(self, cmip7_compound_name: str) -> Optional[Dict]:
         """
         Get metadata for a variable by its CMIP7 compound name.
@@ -261,8 +706,38 @@ class CMIP7Interface:
         if self._metadata is None:
             raise ValueError("Metadata not loaded. Call load_metadata() first.")
 
-        compound_names = self._metadata.get("Compound Name", {})
-        return compound_names.get(cmip7_compound_name)
+        return self._compound_names.get(cmip7_compound_name)
+
+    def get_variable_metadata_lazy(self, cmip7_compound_name: str, metadata_file: Union[str, Path]) -> Optional[Dict]:
+        """
+        Get metadata for a single variable from a metadata file, without loading the file.
+
+        If ``ijson`` is installed, the file is stream-parsed and only the requested
+        variable is kept in memory. This is useful for one-off lookups, for repeated
+        queries use :meth:`load_metadata` and :meth:`get_variable_metadata` instead.
+
+        Parameters
+        ----------
+        cmip7_compound_name : str
+            CMIP7 compound name in format: realm.variable.branding.frequency.region
+            Example: 'atmos.tas.tavg-h2m-hxy-u.mon.GLB'
+        metadata_file : str or Path
+            Path to a metadata JSON file.
+
+        Returns
+        -------
+        Optional[Dict]
+            Variable metadata dictionary, or None if not found.
+        """
+        metadata_file = Path(metadata_file)
+        if ijson is None:
+            metadata = json_loads(metadata_file.read_bytes())
+            return metadata.get("Compound Name", {}).get(cmip7_compound_name)
+        with open(metadata_file, "rb") as f:
+            for name, metadata in ijson.kvitems(f, "Compound Name", use_float=True):
+                if name == cmip7_compound_name:
+                    return metadata
+        return None
 
     def get_variable_by_cmip6_name(self, cmip6_compound_name: str) -> Optional[Dict]:
         """
@@ -288,12 +763,7 @@ class CMIP7Interface:
         if self._metadata is None:
             raise ValueError("Metadata not loaded. Call load_metadata() first.")
 
-        compound_names = self._metadata.get("Compound Name", {})
-        for cmip7_name, metadata in compound_names.items():
-            if metadata.get("cmip6_compound_name") == cmip6_compound_name:
-                return metadata
-
-        return None
+        return self._cmip6_index.get(cmip6_compound_name)
 
     def find_variable_variants(
         self,
@@ -330,20 +800,18 @@ class CMIP7Interface:
         if self._metadata is None:
             raise ValueError("Metadata not loaded. Call load_metadata() first.")
 
-        variants = []
-        compound_names = self._metadata.get("Compound Name", {})
-
-        for cmip7_name, metadata in compound_names.items():
-            # Parse compound name: realm.variable.branding.frequency.region
-            parts = cmip7_name.split(".")
-            if len(parts) != 5:
-                continue
+        # Start from the smallest index that applies to the given filters
+        candidates = [self._by_variable.get(variable_name, ())]
+        if realm is not None:
+            candidates.append(self._by_realm_variable.get((realm, variable_name), ()))
+        if frequency is not None:
+            candidates.append(self._by_variable_frequency.get((variable_name, frequency), ()))
 
-            var_realm, var_name, var_branding, var_freq, var_region = parts
+        variants = []
+        for index in min(candidates, key=len):
+            var_realm, var_name, var_branding, var_freq, var_region = self._parts[index]
 
             # Check if this matches our criteria
-            if var_name != variable_name:
-                continue
             if realm is not None and var_realm != realm:
                 continue
             if frequency is not None and var_freq != frequency:
@@ -351,10 +819,8 @@ class CMIP7Interface:
             if region is not None and var_region != region:
                 continue
 
-            # Add compound name to metadata for reference
-            variant_meta = metadata.copy()
-            variant_meta["cmip7_compound_name"] = cmip7_name
-            variants.append(variant_meta)
+            # Add compound name to a copy of the metadata for reference
+            variants.append({**self._metas[index], "cmip7_compound_name": self._names[index]})
 
         return variants
 
@@ -383,9 +849,14 @@ class CMIP7Interface:
         ValueError
             If experiments data not loaded or experiment not found.
         """
-        if self._experiments_data is None:
+        if self.experiments_data is None:
             raise ValueError("Experiments data not loaded. Call load_experiments_data() first.")
 
+        if priority is not None:
+            variables = self._experiment_priorities.get((experiment, priority))
+            if variables is not None:
+                return variables
+
         experiments = self._experiments_data.get("experiment", {})
         if experiment not in experiments:
             available = list(experiments.keys())
@@ -417,7 +888,7 @@ class CMIP7Interface:
         ValueError
             If experiments data not loaded.
         """
-        if self._experiments_data is None:
+        if self.experiments_data is None:
             raise ValueError("Experiments data not loaded. Call load_experiments_data() first.")
 
         return list(self._experiments_data.get("experiment", {}).keys())
@@ -460,19 +931,13 @@ class CMIP7Interface:
         ValueError
             If compound name format is invalid.
         """
-        parts = cmip7_compound_name.split(".")
-        if len(parts) != 5:
-            raise ValueError(
-                f"Invalid CMIP7 compound name: {cmip7_compound_name}. "
-                "Expected format: realm.variable.branding.frequency.region"
-            )
-
+        realm, variable, branding, frequency, region = _parse_compound_name(cmip7_compound_name)
         return {
-            "realm": parts[0],
-            "variable": parts[1],
-            "branding": parts[2],
-            "frequency": parts[3],
-            "region": parts[4],
+            "realm": realm,
+            "variable": variable,
+            "branding": branding,
+            "frequency": frequency,
+            "region": region,
         }
 
     def build_compound_name(self, realm: str, variable: str, branding: str, frequency: str, region: str) -> str:
@@ -511,7 +976,9 @@ class CMIP7Interface:
 
     @property
     def experiments_data(self) -> Optional[Dict]:
-        """Get the currently loaded experiments data."""
+        """Get the currently loaded experiments data, reading the exported file on first access."""
+        if self._experiments_data is None and self._experiments_file is not None:
+            self.load_experiments_data(self._experiments_file)
         return self._experiments_data
 
 
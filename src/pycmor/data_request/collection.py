@@ -2,14 +2,13 @@ import json
 import pathlib
 from abc import abstractmethod
 from enum import Enum
-from importlib.resources import files
 from typing import Dict
 
 import deprecation
 
 from ..core.factory import MetaFactory
 from ..core.utils import download_json_tables_from_url, list_files_in_directory
-from .table import CMIP6DataRequestTable, CMIP7DataRequestTable, DataRequestTable
+from .table import CMIP6DataRequestTable, CMIP7DataRequestTable, DataRequestTable, _load_cmip7_all_var_info
 from .variable import CMIP7DataRequestVariable
 
 
@@ -62,9 +61,7 @@ class CMIP7DataRequest(DataRequest):
 
     @classmethod
     def from_vendored_json(cls):
-        _all_var_info = files("pycmor.data.cmip7").joinpath("all_var_info.json")
-        all_var_info = json.load(open(_all_var_info, "r"))
-        return cls.from_all_var_info(all_var_info)
+        return cls.from_all_var_info(_load_cmip7_all_var_info())
 
     @classmethod
     def from_all_var_info(cls, data):
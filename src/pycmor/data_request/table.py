@@ -1,9 +1,9 @@
-import json
+import functools
 import pathlib
 from abc import abstractmethod
 from dataclasses import dataclass
 from importlib.resources import files
-from typing import List
+from typing import Dict, List
 
 import pendulum
 from semver.version import Version
@@ -11,6 +11,37 @@ from semver.version import Version
 from ..core.factory import MetaFactory
 from .variable import CMIP6DataRequestVariable, CMIP7DataRequestVariable, DataRequestVariable
 
+# Use orjson for parsing if available, it is considerably faster than the standard library
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+# Approximate interval in days for each CMIP7 frequency
+_FREQ_TO_INTERVAL = {
+    "1hr": 1.0 / 24.0,
+    "3hr": 0.125,
+    "6hr": 0.25,
+    "day": 1.0,
+    "dec": 365.0 * 10.0,
+    "fx": None,  # Maybe this should be 0.0?
+    "mon": 30.0,
+    "subhr": 1.0 / 60.0,  # Not sure about this one...
+    "yr": 365.0,
+}
+
+
+@functools.lru_cache(maxsize=1)
+def _load_cmip7_all_var_info() -> dict:
+    """
+    Load the ``all_var_info.json`` packaged with pycmor.
+
+    The file does not change at runtime, so it is only parsed once. The returned
+    dict is shared between all callers and must not be modified.
+    """
+    return json_loads(files("pycmor.data.cmip7").joinpath("all_var_info.json").read_bytes())
+
+
 ################################################################################
 # BLUEPRINTS: Abstract classes for the data request tables
 ################################################################################
@@ -285,8 +316,7 @@ class CMIP7DataRequestTableHeader(DataRequestTableHeader):
             Table header instance.
         """
         if all_var_info is None:
-            _all_var_info = files("pycmor.data.cmip7").joinpath("all_var_info.json")
-            all_var_info = json.load(open(_all_var_info, "r"))
+            all_var_info = _load_cmip7_all_var_info()
 
         # Filter by CMIP6 table name for backward compatibility
         all_vars_for_table = {
@@ -330,25 +360,10 @@ class CMIP7DataRequestTableHeader(DataRequestTableHeader):
 
     @staticmethod
     def _approx_interval_from_frequency(frequency: str) -> float:
-        if frequency == "1hr":
-            return 1.0 / 24.0
-        if frequency == "3hr":
-            return 0.125
-        if frequency == "6hr":
-            return 0.25
-        if frequency == "day":
-            return 1.0
-        if frequency == "dec":
-            return 365.0 * 10.0
-        if frequency == "fx":
-            return None  # Maybe this should be 0.0?
-        if frequency == "mon":
-            return 30.0
-        if frequency == "subhr":
-            return 1.0 / 60.0  # Not sure about this one...
-        if frequency == "yr":
-            return 365.0
-        raise ValueError(f"Frequency {frequency} not recognized.")
+        try:
+            return _FREQ_TO_INTERVAL[frequency]
+        except KeyError:
+            raise ValueError(f"Frequency {frequency} not recognized.")
 
 
 @dataclass
@@ -486,10 +501,8 @@ class CMIP6DataRequestTableHeader(DataRequestTableHeader):
 class CMIP6JSONDataRequestTableHeader(CMIP6DataRequestTableHeader):
     @classmethod
     def from_json_file(cls, jfile) -> "CMIP6JSONDataRequestTableHeader":
-        with open(jfile, "r") as f:
-            data = json.load(f)
-            header = data["Header"]
-            return cls.from_dict(header)
+        data = json_loads(pathlib.Path(jfile).read_bytes())
+        return cls.from_dict(data["Header"])
 
 
 ################################################################################
@@ -506,6 +519,9 @@ class CMIP6DataRequestTable(DataRequestTable):
     ):
         self._header = header
         self._variables = variables
+        # Lookup tables for get_variable, one per ``find_by`` attribute. The
+        # variable list is not modified after construction, so these never go stale.
+        self._index_cache: Dict[str, Dict[str, DataRequestVariable]] = {}
 
     @property
     def variables(self) -> List[str]:
@@ -530,10 +546,16 @@ class CMIP6DataRequestTable(DataRequestTable):
         -------
         DataRequestVariable
         """
-        for v in self._variables:
-            if getattr(v, find_by) == name:
-                return v
-        raise ValueError(f"A Variable with the attribute {find_by}={name} not found in the table.")
+        index = self._index_cache.get(find_by)
+        if index is None:
+            index = {}
+            for v in self._variables:
+                index.setdefault(getattr(v, find_by), v)
+            self._index_cache[find_by] = index
+        try:
+            return index[name]
+        except KeyError:
+            raise ValueError(f"A Variable with the attribute {find_by}={name} not found in the table.")
 
     @classmethod
     def from_dict(cls, data: dict) -> "CMIP6DataRequestTable":
@@ -601,8 +623,7 @@ class CMIP6DataRequestTable(DataRequestTable):
 
     @classmethod
     def from_json_file(cls, jfile) -> "CMIP6DataRequestTable":
-        with open(jfile, "r") as f:
-            data = json.load(f)
+        data = json_loads(pathlib.Path(jfile).read_bytes())
         return cls.from_dict(data)
 
 
@@ -621,6 +642,9 @@ class CMIP7DataRequestTable(DataRequestTable):
     ):
         self._header = header
         self._variables = variables
+        # Lookup tables for get_variable, one per ``find_by`` attribute. The
+        # variable list is not modified after construction, so these never go stale.
+        self._index_cache: Dict[str, Dict[str, DataRequestVariable]] = {}
 
     @property
     def variables(self) -> List[str]:
@@ -645,10 +669,16 @@ class CMIP7DataRequestTable(DataRequestTable):
         -------
         DataRequestVariable
         """
-        for v in self._variables:
-            if getattr(v, find_by) == name:
-                return v
-        raise ValueError(f"A Variable with the attribute {find_by}={name} not found in the table.")
+        index = self._index_cache.get(find_by)
+        if index is None:
+            index = {}
+            for v in self._variables:
+                index.setdefault(getattr(v, find_by), v)
+            self._index_cache[find_by] = index
+        try:
+            return index[name]
+        except KeyError:
+            raise ValueError(f"A Variable with the attribute {find_by}={name} not found in the table.")
 
     @classmethod
     def from_dict(cls, data: dict) -> "CMIP7DataRequestTable":
@@ -663,15 +693,12 @@ class CMIP7DataRequestTable(DataRequestTable):
 
     @classmethod
     def from_all_var_info_json(cls, table_name: str) -> "CMIP7DataRequestTable":
-        _all_var_info = files("pycmor.data.cmip7").joinpath("all_var_info.json")
-        all_var_info = json.load(open(_all_var_info, "r"))
-        return cls.from_all_var_info(table_name, all_var_info)
+        return cls.from_all_var_info(table_name, _load_cmip7_all_var_info())
 
     @classmethod
     def from_all_var_info(cls, table_name: str, all_var_info: dict = None):
         if all_var_info is None:
-            _all_var_info = files("pycmor.data.cmip7").joinpath("all_var_info.json")
-            all_var_info = json.load(open(_all_var_info, "r"))
+            all_var_info = _load_cmip7_all_var_info()
         header = CMIP7DataRequestTableHeader.from_all_var_info(table_name, all_var_info)
         variables = []
         for var_name, var_dict in all_var_info["Compound Name"].items():
@@ -698,9 +725,7 @@ class CMIP7DataRequestTable(DataRequestTable):
             Table instances created from packaged data
         """
         # Use packaged data for CMIP7
-        _all_var_info = files("pycmor.data.cmip7").joinpath("all_var_info.json")
-        with open(_all_var_info, "r") as f:
-            all_var_info = json.load(f)
+        all_var_info = _load_cmip7_all_var_info()
 
         table_ids = set(
             v.get("cmip6_cmor_table") for v in all_var_info["Compound Name"].values() if v.get("cmip6_cmor_table")
@@ -732,8 +757,7 @@ class CMIP7DataRequestTable(DataRequestTable):
 
     @classmethod
     def from_json_file(cls, jfile) -> "CMIP7DataRequestTable":
-        with open(jfile, "r") as f:
-            data = json.load(f)
+        data = json_loads(pathlib.Path(jfile).read_bytes())
         return cls.from_dict(data)
 
     @property
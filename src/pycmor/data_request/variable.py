@@ -23,7 +23,6 @@ import copy
 import json
 from abc import abstractmethod
 from dataclasses import dataclass
-from importlib.resources import files
 from typing import Optional
 
 from ..core.factory import MetaFactory
@@ -504,8 +503,10 @@ class CMIP7DataRequestVariable(DataRequestVariable):
         CMIP7DataRequestVariable
             Variable instance.
         """
-        _all_var_info = files("pycmor.data.cmip7").joinpath("all_var_info.json")
-        all_var_info = json.load(open(_all_var_info, "r"))
+        # Imported here, the table module imports this one
+        from .table import _load_cmip7_all_var_info
+
+        all_var_info = _load_cmip7_all_var_info()
 
         if use_cmip6_name:
             # Search for CMIP6 compound name
@@ -10,12 +10,66 @@ The main function is :func:`add_bounds_from_coords` which uses cf_xarray to
 infer bounds from coordinate values.
 """
 
+from typing import Optional
+
 import cf_xarray as cfxr  # noqa: F401
 import numpy as np
 import xarray as xr
 
 from ..core.logging import logger
 
+# Common vertical coordinate (and dimension) names in climate data
+VERTICAL_COORD_NAMES = [
+    "plev",
+    "lev",
+    "level",
+    "pressure",
+    "depth",
+    "plev19",
+    "plev8",
+    "plev7",
+    "plev4",
+    "plev3",
+    "height",
+    "alt",
+    "altitude",
+]
+
+
+def _midpoint_bounds(values: np.ndarray) -> np.ndarray:
+    """
+    Compute cell bounds along the last axis of ``values``.
+
+    Interior bounds are the midpoints between adjacent values; the outermost
+    bounds are extrapolated using the spacing to the neighbouring midpoint.
+    A single point is given a cell width of 1 unit. Any leading axes are
+    treated as independent columns, so this works for N-D input.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        Coordinate values, with the axis to compute bounds for last.
+
+    Returns
+    -------
+    np.ndarray
+        Array of shape ``values.shape + (2,)`` holding the lower and upper
+        bounds.
+    """
+    values = np.asarray(values, dtype=float)
+    if values.shape[-1] == 1:
+        # Special case: single point
+        # Assume a cell width equal to 1 unit (arbitrary but reasonable)
+        return np.stack([values - 0.5, values + 0.5], axis=-1)
+
+    midpoints = 0.5 * (values[..., 1:] + values[..., :-1])
+    # Extrapolate the outermost bounds using the spacing to the nearest midpoint
+    first = 2.0 * values[..., :1] - midpoints[..., :1]
+    last = 2.0 * values[..., -1:] - midpoints[..., -1:]
+    lower = np.concatenate([first, midpoints], axis=-1)
+    upper = np.concatenate([midpoints, last], axis=-1)
+    return np.stack([lower, upper], axis=-1)
+
 
 def calculate_bounds_1d(coord: xr.DataArray) -> xr.DataArray:
     """
@@ -45,39 +99,7 @@ def calculate_bounds_1d(coord: xr.DataArray) -> xr.DataArray:
      [15. 25.]
      [25. 35.]]
     """
-    values = coord.values
-    n = len(values)
-
-    # Create bounds array
-    bounds = np.zeros((n, 2))
-
-    if n == 1:
-        # Special case: single point
-        # Assume a cell width equal to 1 unit (arbitrary but reasonable)
-        bounds[0, 0] = values[0] - 0.5
-        bounds[0, 1] = values[0] + 0.5
-    elif n == 2:
-        # Special case: two points
-        # Use the spacing between them
-        spacing = values[1] - values[0]
-        bounds[0, 0] = values[0] - spacing / 2
-        bounds[0, 1] = values[0] + spacing / 2
-        bounds[1, 0] = values[1] - spacing / 2
-        bounds[1, 1] = values[1] + spacing / 2
-    else:
-        # General case: three or more points
-        # Calculate midpoints between adjacent values
-        midpoints = (values[:-1] + values[1:]) / 2.0
-
-        # Interior points: use midpoints
-        bounds[1:, 0] = midpoints  # Lower bounds
-        bounds[:-1, 1] = midpoints  # Upper bounds
-
-        # Extrapolate for first point using spacing to next midpoint
-        bounds[0, 0] = values[0] - (midpoints[0] - values[0])
-
-        # Extrapolate for last point using spacing from previous midpoint
-        bounds[-1, 1] = values[-1] + (values[-1] - midpoints[-1])
+    bounds = _midpoint_bounds(coord.values)
 
     # Create DataArray with appropriate dimensions
     dim_name = coord.dims[0]
@@ -92,6 +114,97 @@ def calculate_bounds_1d(coord: xr.DataArray) -> xr.DataArray:
     return bounds_da
 
 
+def _find_vertical_dim(coord: xr.DataArray, vertical_coord_names: Optional[list[str]] = None) -> Optional[str]:
+    """
+    Find the dimension of a vertical coordinate to compute its bounds along.
+
+    This is the only dimension of a 1D coordinate. N-D coordinates need exactly
+    one dimension listed in ``vertical_coord_names`` or :data:`VERTICAL_COORD_NAMES`.
+
+    Returns
+    -------
+    str or None
+        The vertical dimension, or None if it cannot be determined.
+    """
+    if coord.ndim == 1:
+        return coord.dims[0]
+    names = set(VERTICAL_COORD_NAMES).union(vertical_coord_names or ())
+    candidates = [dim for dim in coord.dims if dim in names]
+    return candidates[0] if len(candidates) == 1 else None
+
+
+def calculate_vertical_bounds(
+    coord: xr.DataArray,
+    vertical_dim: Optional[str] = None,
+    bounds_dim: str = "bnds",
+    vertical_coord_names: Optional[list[str]] = None,
+) -> xr.DataArray:
+    """
+    Calculate bounds for a vertical coordinate of any dimensionality.
+
+    The bounds are computed along ``vertical_dim`` only, so vertical levels
+    that vary in time or space (e.g. ``(time, lev, ncells)``) are handled
+    column by column. Dask-backed coordinates stay lazy.
+
+    Parameters
+    ----------
+    coord : xr.DataArray
+        Vertical coordinate array
+    vertical_dim : str, optional
+        Dimension along which to compute the bounds. Defaults to the only
+        dimension of a 1D coordinate, or to the single dimension of an N-D
+        coordinate that is listed in ``vertical_coord_names`` or
+        :data:`VERTICAL_COORD_NAMES`.
+    bounds_dim : str, optional
+        Name for the bounds dimension. Default is "bnds".
+    vertical_coord_names : list of str, optional
+        Additional vertical dimension names to look for when ``vertical_dim``
+        is not given, e.g. the names passed to :func:`add_vertical_bounds`.
+
+    Returns
+    -------
+    xr.DataArray
+        Bounds array with dimensions ``(..., vertical_dim, bounds_dim)``.
+
+    Examples
+    --------
+    >>> depth = xr.DataArray([[10, 20, 30], [12, 22, 32]], dims=['ncells', 'lev'], name='depth')
+    >>> bounds = calculate_vertical_bounds(depth)
+    >>> bounds.dims
+    ('ncells', 'lev', 'bnds')
+    >>> print(bounds.values[1])
+    [[ 7. 17.]
+     [17. 27.]
+     [27. 37.]]
+    """
+    if vertical_dim is None:
+        vertical_dim = _find_vertical_dim(coord, vertical_coord_names)
+        if vertical_dim is None:
+            raise ValueError(
+                f"Cannot determine the vertical dimension of '{coord.name}' with dims {coord.dims}. "
+                "Pass vertical_dim explicitly."
+            )
+
+    # Operate on the bare Variable so the result does not carry the coordinate itself
+    bounds = xr.apply_ufunc(
+        _midpoint_bounds,
+        coord.variable,
+        input_core_dims=[[vertical_dim]],
+        output_core_dims=[[vertical_dim, bounds_dim]],
+        dask="parallelized",
+        output_dtypes=[float],
+        # The vertical dimension is a core dimension, it may have to be merged into a single chunk
+        dask_gufunc_kwargs={"output_sizes": {bounds_dim: 2}, "allow_rechunk": True},
+    )
+    bounds_da = xr.DataArray(
+        bounds,
+        attrs={
+            "long_name": f"{coord.attrs.get('long_name', coord.name)} bounds",
+        },
+    )
+    return bounds_da
+
+
 def calculate_bounds_2d(coord: xr.DataArray, vertices_dim: str = "vertices") -> xr.DataArray:
     """
     Calculate bounds for a 2D coordinate array (unstructured grids).
@@ -248,7 +361,11 @@ def add_vertical_bounds(
 
     This function automatically calculates and adds bounds for vertical coordinates
     such as pressure levels (plev, plev19, etc.) or depth levels if they don't
-    already exist. It uses the same algorithm as horizontal bounds calculation.
+    already exist. It uses the same algorithm as horizontal bounds calculation,
+    applied along the vertical dimension, so multi-dimensional vertical
+    coordinates (e.g. a ``depth`` coordinate on ``(time, lev, ncells)``) are
+    supported as long as exactly one of their dimensions is a known vertical
+    dimension name.
 
     Parameters
     ----------
@@ -307,22 +424,7 @@ def add_vertical_bounds(
     bounds for vertical coordinates in climate model output.
     """
     if vertical_coord_names is None:
-        # Common vertical coordinate names in climate data
-        vertical_coord_names = [
-            "plev",
-            "lev",
-            "level",
-            "pressure",
-            "depth",
-            "plev19",
-            "plev8",
-            "plev7",
-            "plev4",
-            "plev3",
-            "height",
-            "alt",
-            "altitude",
-        ]
+        vertical_coord_names = VERTICAL_COORD_NAMES
 
     ds_out = ds.copy()
 
@@ -339,21 +441,23 @@ def add_vertical_bounds(
             logger.debug(f"  → Vertical bounds '{bounds_name}' already exist, skipping calculation")
             continue
 
-        # Only handle 1D vertical coordinates
-        if coord.ndim == 1:
-            logger.info(f"  → Calculating vertical bounds for '{coord_name}'")
-            bounds = calculate_bounds_1d(coord)
-
-            if bounds is not None:
-                ds_out[bounds_name] = bounds
-                # Add bounds attribute to coordinate
-                ds_out[coord_name].attrs["bounds"] = bounds_name
-                logger.info(f"  → Added vertical bounds variable '{bounds_name}'")
-        else:
+        # N-D vertical coordinates need exactly one recognisable vertical dimension
+        vertical_dim = _find_vertical_dim(coord, vertical_coord_names)
+        if vertical_dim is None:
             logger.warning(
-                f"  → Vertical coordinate '{coord_name}' has {coord.ndim} dimensions. "
-                "Bounds calculation only supports 1D coordinates."
+                f"  → Vertical coordinate '{coord_name}' has {coord.ndim} dimensions {coord.dims}. "
+                "Cannot determine which one is the vertical axis, skipping."
             )
+            continue
+
+        logger.info(f"  → Calculating vertical bounds for '{coord_name}' along '{vertical_dim}'")
+        bounds = calculate_vertical_bounds(
+            coord, vertical_dim=vertical_dim, bounds_dim=bounds_dim, vertical_coord_names=vertical_coord_names
+        )
+        ds_out[bounds_name] = bounds
+        # Add bounds attribute to coordinate
+        ds_out[coord_name].attrs["bounds"] = bounds_name
+        logger.info(f"  → Added vertical bounds variable '{bounds_name}'")
 
     return ds_out
 
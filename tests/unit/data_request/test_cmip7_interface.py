@@ -10,9 +10,23 @@ This module tests the CMIP7 data request interface, including:
 - Getting variables for experiments
 """
 
+import copy
+import json
+import os
+import pickle
+import sys
+
 import pytest
 
-from pycmor.data_request.cmip7_interface import CMIP7_API_AVAILABLE, CMIP7Interface, get_cmip7_interface
+from pycmor.data_request.cmip7_interface import (
+    _PICKLE_VERSION,
+    CMIP7_API_AVAILABLE,
+    CMIP7Interface,
+    _cache_exported_file,
+    _find_cached_metadata,
+    _pickle_cache_file,
+    get_cmip7_interface,
+)
 
 
 class TestCMIP7InterfaceInit:
@@ -73,6 +87,34 @@ class TestLoadMetadata:
         interface.load_metadata(metadata_file=cmip7_metadata_file, force_reload=True)
         assert interface._metadata is not first_metadata  # Different object
 
+    def test_load_metadata_pools_strings(self, cmip7_interface_with_metadata):
+        """Test that repeated values are a single object after loading."""
+        tas = cmip7_interface_with_metadata.get_variable_metadata("atmos.tas.tavg-h2m-hxy-u.mon.GLB")
+        clt = cmip7_interface_with_metadata.get_variable_metadata("atmos.clt.tavg-u-hxy-u.mon.GLB")
+        assert tas["cell_methods"] is clt["cell_methods"]
+        assert tas["modeling_realm"] is clt["modeling_realm"]
+
+    def test_load_metadata_shared_between_instances(self, cmip7_metadata_file):
+        """Test that a second instance reuses the metadata loaded by the first."""
+        if not CMIP7_API_AVAILABLE:
+            pytest.skip("CMIP7 API not available")
+
+        first = CMIP7Interface()
+        first.load_metadata(metadata_file=cmip7_metadata_file)
+        second = CMIP7Interface()
+        second.load_metadata(metadata_file=cmip7_metadata_file)
+        assert second.metadata is first.metadata
+        assert second.get_variable_by_cmip6_name("Amon.clt") is first.get_variable_by_cmip6_name("Amon.clt")
+
+        # Changes to the file are picked up
+        mtime = cmip7_metadata_file.stat().st_mtime + 10
+        os.utime(cmip7_metadata_file, (mtime, mtime))
+        third = CMIP7Interface()
+        third.load_metadata(metadata_file=cmip7_metadata_file)
+        assert third.metadata is not first.metadata
+        # Only the newest load of the file is kept
+        assert len(CMIP7Interface._GLOBAL_METADATA_CACHE) == 1
+
     def test_load_metadata_file_not_found(self):
         """Test error handling when metadata file doesn't exist."""
         if not CMIP7_API_AVAILABLE:
@@ -83,6 +125,147 @@ class TestLoadMetadata:
             interface.load_metadata(metadata_file="nonexistent_file.json")
 
 
+class TestMetadataCache:
+    """Test loading metadata from the cache directory."""
+
+    @pytest.fixture
+    def cache_dir(self, tmp_path, monkeypatch, cmip7_sample_metadata):
+        (tmp_path / "v1.2.2.2.json").write_text(json.dumps(cmip7_sample_metadata))
+        monkeypatch.setenv("PYCMOR_CMIP7_METADATA_DIR", str(tmp_path))
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg"))
+        return tmp_path
+
+    def test_load_writes_and_reuses_pickle(self, cache_dir, cmip7_sample_metadata):
+        """Test that a pickled copy is written on the first load and used afterwards."""
+        if not CMIP7_API_AVAILABLE:
+            pytest.skip("CMIP7 API not available")
+
+        CMIP7Interface().load_metadata("v1.2.2.2")
+        # Only in the user's own cache, never in the (possibly shared) metadata directory
+        assert not list(cache_dir.glob("*.pkl"))
+        assert _pickle_cache_file(cache_dir / "v1.2.2.2.json").exists()
+
+        interface = CMIP7Interface()
+        interface.load_metadata("v1.2.2.2")
+        assert interface.metadata == cmip7_sample_metadata
+
+    def test_pickle_writable_by_others_is_ignored(self, cache_dir, cmip7_sample_metadata):
+        """Test that a pickle other users could have replaced is not unpickled."""
+        if not CMIP7_API_AVAILABLE:
+            pytest.skip("CMIP7 API not available")
+
+        pickle_file = _pickle_cache_file(cache_dir / "v1.2.2.2.json")
+        pickle_file.parent.mkdir(parents=True)
+        with open(pickle_file, "wb") as f:
+            json_stat = (cache_dir / "v1.2.2.2.json").stat()
+            pickle.dump((_PICKLE_VERSION, (json_stat.st_mtime_ns, json_stat.st_size), {}), f)
+            pickle.dump({"Compound Name": {}}, f)
+        pickle_file.chmod(0o666)
+
+        interface = CMIP7Interface()
+        interface.load_metadata("v1.2.2.2")
+        assert interface.metadata == cmip7_sample_metadata
+
+    def test_stale_pickle_is_ignored(self, cache_dir, cmip7_sample_metadata):
+        """Test that the JSON file is parsed again if it changed since it was pickled."""
+        if not CMIP7_API_AVAILABLE:
+            pytest.skip("CMIP7 API not available")
+
+        CMIP7Interface().load_metadata("v1.2.2.2")
+        updated = copy.deepcopy(cmip7_sample_metadata)
+        del updated["Compound Name"]["atmos.clt.tavg-u-hxy-u.day.GLB"]
+        json_file = cache_dir / "v1.2.2.2.json"
+        json_file.write_text(json.dumps(updated))
+        mtime = _pickle_cache_file(json_file).stat().st_mtime + 10
+        os.utime(json_file, (mtime, mtime))
+
+        interface = CMIP7Interface()
+        interface.load_metadata("v1.2.2.2")
+        assert interface.metadata == updated
+
+    def test_pickle_of_replaced_json_with_older_mtime_is_ignored(self, cache_dir, cmip7_sample_metadata):
+        """Test that a JSON file replaced by one with an older timestamp (e.g. ``cp -p``) is parsed again."""
+        if not CMIP7_API_AVAILABLE:
+            pytest.skip("CMIP7 API not available")
+
+        CMIP7Interface().load_metadata("v1.2.2.2")
+        updated = copy.deepcopy(cmip7_sample_metadata)
+        del updated["Compound Name"]["atmos.clt.tavg-u-hxy-u.day.GLB"]
+        json_file = cache_dir / "v1.2.2.2.json"
+        json_file.write_text(json.dumps(updated))
+        mtime = _pickle_cache_file(json_file).stat().st_mtime - 3600
+        os.utime(json_file, (mtime, mtime))
+
+        interface = CMIP7Interface()
+        interface.load_metadata("v1.2.2.2")
+        assert interface.metadata == updated
+
+    def test_exported_metadata_is_cached(self, tmp_path, monkeypatch, cmip7_metadata_file, cmip7_sample_metadata):
+        """Test that metadata exported with the API is loaded from the cache afterwards."""
+        if not CMIP7_API_AVAILABLE:
+            pytest.skip("CMIP7 API not available")
+
+        cache_dir = tmp_path / "cache"
+        monkeypatch.setenv("PYCMOR_CMIP7_METADATA_DIR", str(cache_dir))
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg"))
+        _cache_exported_file("v1.2.2.2.json", cmip7_metadata_file)
+
+        interface = CMIP7Interface()
+        interface.load_metadata("v1.2.2.2")
+        assert interface.metadata == cmip7_sample_metadata
+        assert sorted(p.name for p in cache_dir.iterdir()) == ["v1.2.2.2.json"]
+
+    def test_load_from_xdg_cache_home(self, tmp_path, monkeypatch, cmip7_metadata_file, cmip7_sample_metadata):
+        """Test that the user cache below XDG_CACHE_HOME is searched."""
+        if not CMIP7_API_AVAILABLE:
+            pytest.skip("CMIP7 API not available")
+
+        monkeypatch.delenv("PYCMOR_CMIP7_METADATA_DIR", raising=False)
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg"))
+        _cache_exported_file("v1.2.2.2.json", cmip7_metadata_file)
+        assert (tmp_path / "xdg" / "pycmor" / "cmip7_metadata" / "v1.2.2.2.json").exists()
+
+        interface = CMIP7Interface()
+        interface.load_metadata("v1.2.2.2")
+        assert interface.metadata == cmip7_sample_metadata
+
+    def test_removed_cache_file_is_noticed(self, cache_dir, monkeypatch):
+        """Test that a remembered cache file that was removed is searched for again."""
+        if not CMIP7_API_AVAILABLE:
+            pytest.skip("CMIP7 API not available")
+
+        CMIP7Interface().load_metadata("v1.2.2.2")
+        (cache_dir / "v1.2.2.2.json").unlink()
+        monkeypatch.setattr(CMIP7Interface, "_export_with_api", lambda self, version: {"Compound Name": {}})
+
+        interface = CMIP7Interface()
+        interface.load_metadata("v1.2.2.2")
+        assert interface.get_all_compound_names() == []
+
+    def test_cache_file_added_later_is_found(self, tmp_path, monkeypatch, cmip7_sample_metadata):
+        """Test that a version not found in the cache is searched for again on the next load."""
+        cache_dir = tmp_path / "cache"
+        cache_dir.mkdir()
+        monkeypatch.setenv("PYCMOR_CMIP7_METADATA_DIR", str(cache_dir))
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg"))
+        assert _find_cached_metadata("v1.2.2.2") is None
+
+        (cache_dir / "v1.2.2.2.json").write_text(json.dumps(cmip7_sample_metadata))
+        assert _find_cached_metadata("v1.2.2.2") == cache_dir / "v1.2.2.2.json"
+
+    def test_load_metadata_header(self, cache_dir, cmip7_sample_metadata):
+        """Test that the header is read from the cache without loading the variables."""
+        if not CMIP7_API_AVAILABLE:
+            pytest.skip("CMIP7 API not available")
+
+        interface = CMIP7Interface()
+        # First from the JSON file, then from the pickle written by the first call
+        for _ in range(2):
+            assert interface.load_metadata_header("v1.2.2.2") == cmip7_sample_metadata["Header"]
+        assert interface.metadata is None
+        assert interface.load_metadata_header("v0.0.0") is None
+
+
 class TestLoadExperimentsData:
     """Test experiments data loading functionality."""
 
@@ -98,6 +281,72 @@ class TestLoadExperimentsData:
             cmip7_interface_with_metadata.load_experiments_data("nonexistent_file.json")
 
 
+class TestLoadAll:
+    """Test loading metadata and experiments data together."""
+
+    def test_load_all_exports_once(self, tmp_path, monkeypatch, cmip7_sample_metadata, cmip7_sample_experiments_data):
+        """Test that metadata and experiments data come from a single API export."""
+        if not CMIP7_API_AVAILABLE:
+            pytest.skip("CMIP7 API not available")
+
+        monkeypatch.setenv("HOME", str(tmp_path))
+        monkeypatch.delenv("XDG_CACHE_HOME", raising=False)
+        monkeypatch.delenv("PYCMOR_CMIP7_METADATA_DIR", raising=False)
+        exports = []
+
+        def fake_export(self, version):
+            exports.append(version)
+            self._set_experiments_data(copy.deepcopy(cmip7_sample_experiments_data))
+            return copy.deepcopy(cmip7_sample_metadata)
+
+        monkeypatch.setattr(CMIP7Interface, "_export_with_api", fake_export)
+        interface = CMIP7Interface()
+        interface.load_all("v1.2.2.2")
+        assert exports == ["v1.2.2.2"]
+        assert interface.get_variable_by_cmip6_name("Amon.tas") is not None
+        assert interface.get_all_experiments() == ["historical", "piControl"]
+
+    def test_export_is_written_to_cache(
+        self, tmp_path, monkeypatch, cmip7_sample_metadata, cmip7_sample_experiments_data
+    ):
+        """Test that the export ends up in the cache directory, without leftover files."""
+        if not CMIP7_API_AVAILABLE:
+            pytest.skip("CMIP7 API not available")
+
+        # Fake export tool, called as: export_dreq_lists_json -a <version> <experiments_file> -m <metadata_file>
+        bin_dir = tmp_path / "bin"
+        bin_dir.mkdir()
+        tool = bin_dir / "export_dreq_lists_json"
+        tool.write_text(
+            f"#!{sys.executable}\n"
+            "import json, sys\n"
+            f"json.dump({cmip7_sample_experiments_data!r}, open(sys.argv[3], 'w'))\n"
+            f"json.dump({cmip7_sample_metadata!r}, open(sys.argv[5], 'w'))\n"
+        )
+        tool.chmod(0o755)
+        monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+        cache_dir = tmp_path / "cache"
+        monkeypatch.setenv("PYCMOR_CMIP7_METADATA_DIR", str(cache_dir))
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg"))
+
+        interface = CMIP7Interface()
+        interface.load_all("v0.0.1")
+        assert interface.metadata == cmip7_sample_metadata
+        assert interface.experiments_data == cmip7_sample_experiments_data
+        assert sorted(p.name for p in cache_dir.iterdir()) == ["v0.0.1.experiments.json", "v0.0.1.json"]
+
+        # Both come from the cache now, the experiments data is only read when used
+        monkeypatch.setenv("PATH", "")
+        interface = CMIP7Interface()
+        interface.load_all("v0.0.1")
+        assert interface.experiments_data == cmip7_sample_experiments_data
+
+        interface = CMIP7Interface()
+        interface.load_metadata("v0.0.1")
+        assert interface._experiments_data is None
+        assert interface.get_all_experiments() == ["historical", "piControl"]
+
+
 class TestGetVariableMetadata:
     """Test getting variable metadata by CMIP7 compound name."""
 
@@ -114,6 +363,18 @@ class TestGetVariableMetadata:
         metadata = cmip7_interface_with_metadata.get_variable_metadata("nonexistent.var.branding.freq.region")
         assert metadata is None
 
+    def test_get_variable_metadata_lazy(self, cmip7_metadata_file, cmip7_sample_metadata):
+        """Test reading a single variable from a file without loading the metadata."""
+        if not CMIP7_API_AVAILABLE:
+            pytest.skip("CMIP7 API not available")
+
+        interface = CMIP7Interface()
+        name = "atmos.tas.tavg-h2m-hxy-u.mon.GLB"
+        metadata = interface.get_variable_metadata_lazy(name, cmip7_metadata_file)
+        assert metadata == cmip7_sample_metadata["Compound Name"][name]
+        assert interface.get_variable_metadata_lazy("nonexistent.var.branding.freq.region", cmip7_metadata_file) is None
+        assert interface.metadata is None
+
     def test_get_variable_metadata_without_loading(self):
         """Test that error is raised if metadata not loaded."""
         if not CMIP7_API_AVAILABLE:
@@ -139,6 +400,21 @@ class TestGetVariableByCMIP6Name:
         metadata = cmip7_interface_with_metadata.get_variable_by_cmip6_name("Nonexistent.var")
         assert metadata is None
 
+    def test_get_variable_by_cmip6_name_returns_first_match(self, tmp_path, cmip7_sample_metadata):
+        """Test that the first CMIP7 variant is returned if several share a CMIP6 name."""
+        if not CMIP7_API_AVAILABLE:
+            pytest.skip("CMIP7 API not available")
+
+        metadata = copy.deepcopy(cmip7_sample_metadata)
+        metadata["Compound Name"]["atmos.clt.tavg-u-hxy-u.day.GLB"]["cmip6_compound_name"] = "Amon.clt"
+        metadata_file = tmp_path / "metadata.json"
+        metadata_file.write_text(json.dumps(metadata))
+
+        interface = CMIP7Interface()
+        interface.load_metadata(metadata_file=metadata_file)
+        result = interface.get_variable_by_cmip6_name("Amon.clt")
+        assert result["cmip7_compound_name"] == "atmos.clt.tavg-u-hxy-u.mon.GLB"
+
     def test_get_variable_by_cmip6_name_without_loading(self):
         """Test that error is raised if metadata not loaded."""
         if not CMIP7_API_AVAILABLE:
@@ -193,6 +469,17 @@ class TestFindVariableVariants:
         assert len(variants) == 1
         assert variants[0]["cmip7_compound_name"] == "atmos.clt.tavg-u-hxy-u.day.GLB"
 
+    def test_find_variants_does_not_modify_metadata(self, cmip7_interface_with_metadata):
+        """Test that changing a returned variant leaves the loaded metadata alone."""
+        variant = cmip7_interface_with_metadata.find_variable_variants("clt", frequency="day")[0]
+        # Plain dicts, e.g. for serializing them
+        assert isinstance(variant, dict)
+        assert json.loads(json.dumps(variant))["cmip7_compound_name"] == "atmos.clt.tavg-u-hxy-u.day.GLB"
+        variant["units"] = "%"
+        assert variant["units"] == "%"
+        metadata = cmip7_interface_with_metadata.get_variable_metadata("atmos.clt.tavg-u-hxy-u.day.GLB")
+        assert metadata["units"] == "1"
+
     def test_find_variants_not_found(self, cmip7_interface_with_metadata):
         """Test finding variants for non-existent variable."""
         variants = cmip7_interface_with_metadata.find_variable_variants("nonexistent")
@@ -300,6 +587,11 @@ class TestParseCompoundName:
         with pytest.raises(ValueError, match="Invalid CMIP7 compound name"):
             cmip7_interface_with_metadata.parse_compound_name("realm.var.branding.freq")
 
+    def test_parse_compound_name_too_many_parts(self, cmip7_interface_with_metadata):
+        """Test parsing compound name with more than five parts."""
+        with pytest.raises(ValueError, match="Invalid CMIP7 compound name"):
+            cmip7_interface_with_metadata.parse_compound_name("realm.var.branding.freq.region.extra")
+
 
 class TestBuildCompoundName:
     """Test building CMIP7 compound names."""
@@ -1,3 +1,5 @@
+import pytest
+
 from pycmor.data_request.table import CMIP7DataRequestTable
 
 
@@ -5,3 +7,13 @@ def test_cmip7_from_vendored_json():
     drt = CMIP7DataRequestTable.from_all_var_info_json("Omon")
     # For right now, just check if the object is creatable
     assert drt is not None
+
+
+def test_cmip7_get_variable():
+    drt = CMIP7DataRequestTable.from_all_var_info_json("Omon")
+    first = drt.variables[0]
+    assert drt.get_variable(first.name) is first
+    # Repeated lookups go through the cached index
+    assert drt.get_variable(first.name) is first
+    with pytest.raises(ValueError):
+        drt.get_variable("no_such_variable")
@@ -0,0 +1,89 @@
+import pytest
+from everett.manager import config_override
+
+from pycmor.core.config import (
+    CONFIG_OPTIONS,
+    PycmorConfigManager,
+    _generate_all_options,
+    _get_default_manager,
+    _reset_default_manager,
+    config_injector,
+)
+
+
+def test_default_manager_is_reused_until_reset():
+    manager = _get_default_manager()
+    assert _get_default_manager() is manager
+    _reset_default_manager()
+    assert _get_default_manager() is not manager
+
+
+def test_lookup_cache_follows_environment(monkeypatch):
+    monkeypatch.delenv("PYCMOR_PARALLEL", raising=False)
+    config = PycmorConfigManager.from_pycmor_cfg()
+    assert config("parallel") is True
+    monkeypatch.setenv("PYCMOR_PARALLEL", "False")
+    assert config("parallel") is False
+    monkeypatch.delenv("PYCMOR_PARALLEL")
+    assert config("parallel") is True
+
+
+def test_default_manager_follows_environment(monkeypatch):
+    monkeypatch.setenv("PYCMOR_XARRAY_OPEN_MFDATASET_ENGINE", "h5netcdf")
+    assert _get_default_manager()("xarray_open_mfdataset_engine") == "h5netcdf"
+    monkeypatch.setenv("PYCMOR_XARRAY_OPEN_MFDATASET_ENGINE", "zarr")
+    assert _get_default_manager()("xarray_open_mfdataset_engine") == "zarr"
+
+
+def test_lookup_cache_honours_config_override(monkeypatch):
+    monkeypatch.delenv("PYCMOR_PARALLEL", raising=False)
+    config = PycmorConfigManager.from_pycmor_cfg()
+    assert config("parallel") is True
+    with config_override(PYCMOR_PARALLEL="no"):
+        assert config("parallel") is False
+    assert config("parallel") is True
+
+
+def test_config_injector_follows_environment(monkeypatch):
+    class Engine:
+        pass
+
+    @config_injector(type_to_prefix_map={Engine: "xarray_open_mfdataset"})
+    def open_data(data: Engine, engine: str = None):
+        return engine
+
+    monkeypatch.setenv("PYCMOR_XARRAY_OPEN_MFDATASET_ENGINE", "netcdf4")
+    assert open_data(Engine()) == "netcdf4"
+    monkeypatch.setenv("PYCMOR_XARRAY_OPEN_MFDATASET_ENGINE", "zarr")
+    assert open_data(Engine()) == "zarr"
+    assert open_data(Engine(), engine="h5netcdf") == "h5netcdf"
+
+
+def test_reset_finds_config_file_created_later(monkeypatch, tmp_path):
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
+    monkeypatch.delenv("PYCMOR_XARRAY_OPEN_MFDATASET_ENGINE", raising=False)
+    _reset_default_manager()
+    assert _get_default_manager()("xarray_open_mfdataset_engine") == "netcdf4"
+    (tmp_path / "pycmor.yaml").write_text('pycmor:\n  xarray_open_mfdataset_engine: "zarr"\n')
+    _reset_default_manager()
+    assert _get_default_manager()("xarray_open_mfdataset_engine") == "zarr"
+
+
+def test_config_file_from_environment(monkeypatch, tmp_path):
+    config_file = tmp_path / "custom.yaml"
+    config_file.write_text('pycmor:\n  xarray_open_mfdataset_engine: "h5netcdf"\n')
+    monkeypatch.delenv("PYCMOR_XARRAY_OPEN_MFDATASET_ENGINE", raising=False)
+    monkeypatch.setenv("PYCMOR_CONFIG_FILE", str(config_file))
+    _reset_default_manager()
+    assert _get_default_manager()("xarray_open_mfdataset_engine") == "h5netcdf"
+
+
+def test_generated_option_collision_raises(monkeypatch):
+    monkeypatch.setitem(CONFIG_OPTIONS, "xarray_open_mfdataset_engine", {"default": "netcdf4", "doc": "Duplicate"})
+
+    class Component:
+        class Config:
+            pass
+
+    with pytest.raises(ValueError, match="xarray_open_mfdataset_engine"):
+        _generate_all_options(Component)
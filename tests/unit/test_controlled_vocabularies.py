@@ -1,11 +1,20 @@
+import io
+import json
+import tarfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import pytest
+import requests
 
+from pycmor.core import controlled_vocabularies
 from pycmor.core.controlled_vocabularies import (
     CMIP6ControlledVocabularies,
     CMIP7ControlledVocabularies,
     ControlledVocabularies,
+    _download,
+    _download_cache_dir,
+    _download_tarball_members,
 )
 
 
@@ -33,6 +42,220 @@ def test_can_read_experiment_id_and_source_id_from_directory(CV_dir):
     assert "source_id" in cv
 
 
+def test_from_directory_reads_only_requested_categories(CV_dir):
+    cv = CMIP6ControlledVocabularies.from_directory(CV_dir, categories=["experiment_id"])
+    assert cv["experiment_id"]["highres-future"]["start_year"] == "2015"
+    assert "source_id" not in cv
+
+
+def test_load_returns_cached_object(CV_dir):
+    cv = CMIP6ControlledVocabularies.load(CV_dir)
+    assert CMIP6ControlledVocabularies.load(CV_dir) is cv
+    assert cv["experiment_id"]["highres-future"]["start_year"] == "2015"
+
+
+def test_concurrent_loads_share_one_loaded_object(CV_dir, tmp_path):
+    # A directory no other test loads, so the first load happens in the threads
+    for f in CV_dir.glob("*.json"):
+        (tmp_path / f.name).write_bytes(f.read_bytes())
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda _: CMIP6ControlledVocabularies.load(tmp_path), range(16)))
+    assert all(cv is results[0] for cv in results)
+    assert results[0]["experiment_id"]["highres-future"]["start_year"] == "2015"
+
+
+def test_from_directory_behaves_like_a_plain_dict(CV_dir):
+    cv = CMIP6ControlledVocabularies.from_directory(CV_dir)
+    assert {"experiment_id", "source_id", "license", "version_metadata"} <= set(cv.keys())
+    assert json.loads(json.dumps(cv)) == cv
+    assert (cv | {})["experiment_id"] is cv["experiment_id"]
+    assert cv.pop("source_id", None) is not None
+
+
+# ============================================================================
+# Downloads (no network access, the requests session is replaced)
+# ============================================================================
+
+
+class FakeResponse:
+    """Stand-in for a requests.Response"""
+
+    def __init__(self, content=b"", status_code=200, headers=None):
+        self.content = content
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.raw = io.BytesIO(content)
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} Error")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+class FakeSession:
+    """Stand-in for the shared requests.Session, records every request"""
+
+    def __init__(self, respond):
+        self.respond = respond
+        self.requests = []
+
+    def get(self, url, **kwargs):
+        self.requests.append((url, kwargs))
+        response = self.respond(url, kwargs)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+
+@pytest.fixture
+def fake_session(monkeypatch):
+    """Install a FakeSession answering with ``respond(url, kwargs)``"""
+
+    def install(respond):
+        session = FakeSession(respond)
+        monkeypatch.setattr(controlled_vocabularies, "_download_session", lambda: session)
+        return session
+
+    return install
+
+
+def make_tarball(members):
+    """Build a .tar.gz archive in memory from a mapping of member names to contents"""
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w:gz") as archive:
+        for name, content in members.items():
+            info = tarfile.TarInfo(name)
+            info.size = len(content)
+            archive.addfile(info, io.BytesIO(content))
+    return buffer.getvalue()
+
+
+def cmip6_cv_content(fname):
+    """Contents of a CMIP6 CV file as served by GitHub: CMIP6_<name>.json holds {<name>: ...}"""
+    name = fname[len("CMIP6_") : -len(".json")] if fname.startswith("CMIP6_") else fname[: -len(".json")]
+    return json.dumps({name: f"{name} from {fname}"}).encode()
+
+
+def test_download_tarball_members_strips_top_level_directory(fake_session):
+    archive = make_tarball(
+        {
+            "CMIP6_CVs-6.2.58.64/CMIP6_license.json": b'{"license": []}',
+            "CMIP6_CVs-6.2.58.64/src/CMIP6_license.json": b"nested",
+            "CMIP6_CVs-6.2.58.64/README.md": b"readme",
+        }
+    )
+    session = fake_session(lambda url, kwargs: FakeResponse(archive))
+    contents = _download_tarball_members("https://example.org/a.tar.gz", ["CMIP6_license.json", "mip_era.json"])
+    assert contents == {"CMIP6_license.json": b'{"license": []}'}
+    assert session.requests[0][1]["stream"] is True
+
+
+def test_load_from_git_uses_tarball_and_downloads_missing_files(fake_session, tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    in_archive = ("CMIP6_license.json", "CMIP6_source_id.json", "mip_era.json")
+    archive = make_tarball({f"CMIP6_CVs-1.0/{fname}": cmip6_cv_content(fname) for fname in in_archive})
+
+    def respond(url, kwargs):
+        if url.startswith("https://codeload.github.com/"):
+            return FakeResponse(archive)
+        return FakeResponse(cmip6_cv_content(url.rsplit("/", 1)[-1]))
+
+    session = fake_session(respond)
+    cv = CMIP6ControlledVocabularies.load_from_git("1.0")
+    assert cv["license"] == "license from CMIP6_license.json"
+    assert cv["mip_era"] == "mip_era from mip_era.json"
+    assert cv["experiment_id"] == "experiment_id from CMIP6_experiment_id.json"
+
+    urls = [url for url, _ in session.requests]
+    assert urls[0] == "https://codeload.github.com/WCRP-CMIP/CMIP6_CVs/tar.gz/refs/tags/1.0"
+    # Only the files missing from the archive are downloaded one by one
+    assert not any(url.endswith(in_archive) for url in urls[1:])
+    assert len(urls) == 1 + 15 - len(in_archive)
+    cache_dir = tmp_path / "pycmor" / "cmip6-cvs-raw" / "tags" / "1.0"
+    assert (cache_dir / "CMIP6_license.json").read_bytes() == cmip6_cv_content("CMIP6_license.json")
+    assert (cache_dir / "CMIP6_experiment_id.json").is_file()
+
+
+def test_load_from_git_falls_back_to_single_files(fake_session, tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+
+    def respond(url, kwargs):
+        if url.startswith("https://codeload.github.com/"):
+            return requests.ConnectionError("codeload unreachable")
+        return FakeResponse(cmip6_cv_content(url.rsplit("/", 1)[-1]))
+
+    session = fake_session(respond)
+    cv = CMIP6ControlledVocabularies.load_from_git("1.0")
+    assert cv["license"] == "license from CMIP6_license.json"
+    assert len(session.requests) == 1 + 15
+
+
+def test_download_revalidates_and_stores_etag(fake_session, tmp_path):
+    cache_file = tmp_path / "CMIP6_license.json"
+    fake_session(lambda url, kwargs: FakeResponse(b"v1", headers={"ETag": '"abc"'}))
+    assert _download("https://example.org/CMIP6_license.json", cache_file, revalidate=True) == b"v1"
+    assert cache_file.read_bytes() == b"v1"
+    assert (tmp_path / "CMIP6_license.json.etag").read_text() == '"abc"'
+
+    # The server confirms the cached copy, it is used without downloading it again
+    session = fake_session(lambda url, kwargs: FakeResponse(status_code=304))
+    assert _download("https://example.org/CMIP6_license.json", cache_file, revalidate=True) == b"v1"
+    assert session.requests[0][1]["headers"] == {"If-None-Match": '"abc"'}
+
+    # A changed file replaces the cached copy and its ETag
+    fake_session(lambda url, kwargs: FakeResponse(b"v2", headers={"ETag": '"def"'}))
+    assert _download("https://example.org/CMIP6_license.json", cache_file, revalidate=True) == b"v2"
+    assert cache_file.read_bytes() == b"v2"
+    assert (tmp_path / "CMIP6_license.json.etag").read_text() == '"def"'
+
+
+def test_download_uses_stale_copy_when_offline(fake_session, tmp_path):
+    cache_file = tmp_path / "CMIP6_license.json"
+    fake_session(lambda url, kwargs: requests.ConnectionError("offline"))
+    with pytest.raises(requests.ConnectionError):
+        _download("https://example.org/CMIP6_license.json", cache_file, revalidate=True)
+
+    cache_file.write_bytes(b"stale")
+    assert _download("https://example.org/CMIP6_license.json", cache_file, revalidate=True) == b"stale"
+
+
+def test_download_without_revalidation_writes_no_etag(fake_session, tmp_path):
+    cache_file = tmp_path / "CMIP6_license.json"
+    session = fake_session(lambda url, kwargs: FakeResponse(b"v1", headers={"ETag": '"abc"'}))
+    assert _download("https://example.org/CMIP6_license.json", cache_file) == b"v1"
+    assert session.requests[0][1]["headers"] == {}
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["CMIP6_license.json"]
+
+
+def test_tagged_downloads_are_served_from_disk_cache(fake_session, tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    cache_file = _download_cache_dir("cmip6-cvs-raw", "tags/1.0") / "CMIP6_license.json"
+    assert cache_file == tmp_path / "pycmor" / "cmip6-cvs-raw" / "tags" / "1.0" / "CMIP6_license.json"
+
+    session = fake_session(lambda url, kwargs: FakeResponse(b"v1"))
+    assert _download("https://example.org/CMIP6_license.json", cache_file) == b"v1"
+    assert len(session.requests) == 1
+
+    session = fake_session(lambda url, kwargs: AssertionError("tagged files must not be downloaded again"))
+    assert _download("https://example.org/CMIP6_license.json", cache_file) == b"v1"
+    assert not session.requests
+
+
+def test_load_from_git_second_load_stays_offline(fake_session, tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    fake_session(lambda url, kwargs: FakeResponse(cmip6_cv_content(url.rsplit("/", 1)[-1])))
+    first = CMIP6ControlledVocabularies.load_from_git("1.0")
+
+    session = fake_session(lambda url, kwargs: AssertionError("tagged files must not be downloaded again"))
+    assert CMIP6ControlledVocabularies.load_from_git("1.0") == first
+    assert not session.requests
+
+
 # ============================================================================
 # CMIP7 Controlled Vocabularies Tests
 # ============================================================================
@@ -52,6 +275,45 @@ def cmip7_cv_dir():
     return cv_path
 
 
+def test_load_individual_files_prefers_graph_index(tmp_path):
+    (tmp_path / "picontrol.json").write_text('{"id": "picontrol", "tier": 2}')
+    (tmp_path / "graph.min.jsonld").write_text(
+        '{"@context": "_context_", "@graph": [{"id": "picontrol", "tier": 1}, {"id": "historical", "tier": 1}]}'
+    )
+    entries = CMIP7ControlledVocabularies._load_individual_files(tmp_path)
+    assert set(entries) == {"picontrol", "historical"}
+    assert entries["picontrol"]["tier"] == 1
+    assert entries["picontrol"]["@context"] == "_context_"
+
+
+def test_load_individual_files_gives_every_entry_its_own_context(tmp_path):
+    (tmp_path / "graph.min.jsonld").write_text(
+        '{"@context": {"@vocab": "_vocab_"}, "@graph": [{"id": "picontrol"}, {"id": "historical"}]}'
+    )
+    entries = CMIP7ControlledVocabularies._load_individual_files(tmp_path)
+    entries["picontrol"]["@context"]["@vocab"] = "changed"
+    assert entries["historical"]["@context"] == {"@vocab": "_vocab_"}
+
+
+def test_load_individual_files_keys_entries_by_id(tmp_path):
+    (tmp_path / "picontrol.json").write_text('{"id": "piControl", "tier": 1}')
+    (tmp_path / "historical.json").write_text('{"id": "historical", "tier": 1}')
+    (tmp_path / "noid.json").write_text('{"tier": 3}')
+    (tmp_path / "@context.json").write_text("{}")
+    entries = CMIP7ControlledVocabularies._load_individual_files(tmp_path)
+    assert set(entries) == {"piControl", "historical", "noid"}
+    assert "picontrol" not in entries
+    assert entries["piControl"]["tier"] == 1
+
+
+def test_load_project_files_strips_list_suffix(tmp_path):
+    (tmp_path / "frequency-list.json").write_text('{"frequency": ["mon", "day"]}')
+    (tmp_path / "mip-era-list.json").write_text('{"id": "mip-era", "mip-era": "CMIP7"}')
+    (tmp_path / "README.json").write_text("{}")
+    cv_data = CMIP7ControlledVocabularies._load_project_files(tmp_path)
+    assert cv_data == {"frequency": ["mon", "day"], "mip-era": "CMIP7"}
+
+
 class TestCMIP7ControlledVocabularies:
     """Test suite for CMIP7 Controlled Vocabularies"""
 
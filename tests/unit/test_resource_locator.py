@@ -10,14 +10,22 @@ Tests the 5-level priority chain for resource location:
 """
 
 import json
+import os
 import shutil
 import tempfile
+import time
 from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 
-from pycmor.core.resource_locator import CMIP6CVLocator, CMIP7CVLocator, CMIP7MetadataLocator, ResourceLocator
+from pycmor.core.resource_locator import (
+    CMIP6CVLocator,
+    CMIP7CVLocator,
+    CMIP7MetadataLocator,
+    ResourceLocator,
+    locate_many,
+)
 
 
 class TestResourceLocatorBase:
@@ -104,6 +112,25 @@ class TestResourceLocatorBase:
             finally:
                 tmp_path.unlink()
 
+    def test_needs_refresh_only_for_old_branch_clones(self):
+        """Test that only clones of moving branches are refreshed, once they are old"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmp_path = Path(tmpdir)
+            (tmp_path / ".git").mkdir()
+            fetch_head = tmp_path / ".git" / "FETCH_HEAD"
+            fetch_head.write_text("")
+
+            assert not ResourceLocator("test-resource", version="main")._needs_refresh(tmp_path)
+            assert not ResourceLocator("test-resource", version="v1.0.0")._needs_refresh(tmp_path)
+
+            old = time.time() - 2 * ResourceLocator.REFRESH_INTERVAL
+            os.utime(fetch_head, (old, old))
+            assert ResourceLocator("test-resource", version="main")._needs_refresh(tmp_path)
+            assert not ResourceLocator("test-resource", version="v1.0.0")._needs_refresh(tmp_path)
+
+            # Caches without a clone can not be refreshed
+            assert not ResourceLocator("test-resource", version="main")._needs_refresh(tmp_path / "nothing")
+
     def test_get_packaged_path_not_implemented_in_base(self):
         """Test that _get_packaged_path returns None in base class"""
         locator = ResourceLocator("test-resource")
@@ -228,6 +255,44 @@ class TestResourceLocatorPriorityChain:
                             # Should return None when everything fails
                             assert result is None
 
+    def test_locate_result_is_cached(self):
+        """Test that a found resource is not searched for again"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            user_path = Path(tmpdir) / "user-cvs"
+            user_path.mkdir()
+
+            assert ResourceLocator("test-resource", user_path=user_path).locate() == user_path
+            with patch.object(ResourceLocator, "_locate") as mock_locate:
+                assert ResourceLocator("test-resource", user_path=user_path).locate() == user_path
+                mock_locate.assert_not_called()
+
+            ResourceLocator.clear_cache()
+            with patch.object(ResourceLocator, "_locate", return_value=None) as mock_locate:
+                assert ResourceLocator("test-resource", user_path=user_path).locate() is None
+                mock_locate.assert_called_once()
+
+    def test_locate_many_downloads_once(self):
+        """Test that concurrent locators of the same resource only download it once"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache_base = Path(tmpdir) / "pycmor"
+            cache_base.mkdir(parents=True)
+            downloads = []
+
+            def mock_download(path):
+                downloads.append(path)
+                time.sleep(0.1)
+                path.mkdir(parents=True, exist_ok=True)
+                (path / "test.json").write_text('{"test": "downloaded"}')
+                return True
+
+            with patch.object(ResourceLocator, "_get_cache_directory", return_value=cache_base):
+                with patch.object(ResourceLocator, "_download_from_git", side_effect=mock_download):
+                    locators = [ResourceLocator("test-resource", version="v2.0.0") for _ in range(3)]
+                    results = locate_many(locators)
+
+            assert results == [cache_base / "test-resource" / "v2.0.0"] * 3
+            assert len(downloads) == 1
+
 
 class TestCVLocator:
     """Test the CV locator factory pattern"""
@@ -284,6 +349,21 @@ class TestCVLocator:
         if vendored:  # Only check if submodule exists
             assert vendored.name == "CMIP7-CVs"
 
+    def test_missing_vendored_path_is_remembered(self):
+        """Test that a missing submodule is only looked up once"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with patch.object(ResourceLocator, "_REPO_ROOT", Path(tmpdir)):
+                with patch.object(ResourceLocator, "_vendored_cache", {}):
+                    locator = CMIP7CVLocator()
+                    assert locator._get_vendored_path() is None
+
+                    # Appears later, but the earlier miss is remembered
+                    (Path(tmpdir) / "CMIP7-CVs").mkdir()
+                    assert locator._get_vendored_path() is None
+
+                    ResourceLocator._vendored_cache.clear()
+                    assert locator._get_vendored_path() == Path(tmpdir) / "CMIP7-CVs"
+
     @pytest.mark.skipif(
         not (Path(__file__).parent.parent.parent / "cmip6-cmor-tables" / "CMIP6_CVs").exists(),
         reason="CMIP6 CVs submodule not initialized",
@@ -361,6 +441,20 @@ class TestCMIP7MetadataLocator:
             finally:
                 tmp_path.unlink()
 
+    def test_validate_cache_rejects_truncated_json(self):
+        """Test that cache validation rejects a file which was not completely written"""
+        locator = CMIP7MetadataLocator()
+
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as tmpfile:
+            tmpfile.write(json.dumps({"Header": {}, "Compound Name": {"test": "data"}})[:-5])
+            tmpfile.flush()
+            tmp_path = Path(tmpfile.name)
+
+            try:
+                assert not locator._validate_cache(tmp_path)
+            finally:
+                tmp_path.unlink()
+
     def test_validate_cache_rejects_wrong_structure(self):
         """Test that cache validation rejects JSON with wrong structure"""
         locator = CMIP7MetadataLocator()
@@ -1,6 +1,17 @@
+from unittest.mock import patch
+
 import pytest
 
-from pycmor.core.validate import PIPELINES_SCHEMA, PipelineSectionValidator
+from pycmor.core.validate import (
+    PIPELINES_SCHEMA,
+    PIPELINES_VALIDATOR,
+    DirectoryAwareValidator,
+    PipelineSectionValidator,
+    RuleSectionValidator,
+    _is_qualname,
+    get_config_validator,
+    get_pipelines_validator,
+)
 
 
 @pytest.fixture
@@ -12,6 +23,11 @@ def test_initialize(validator):
     assert validator.schema == PIPELINES_SCHEMA
 
 
+def test_validator_is_reused():
+    assert get_pipelines_validator() is get_pipelines_validator()
+    assert get_pipelines_validator() is PIPELINES_VALIDATOR
+
+
 def test_is_qualname(validator):
     # Test with valid qualname
     validator._validate_is_qualname_or_script(True, "field", "os.path.join")
@@ -23,6 +39,15 @@ def test_is_qualname_error(validator):
         validator._validate_is_qualname_or_script(True, "field", "non.existent.module")
 
 
+def test_is_qualname_remembers_missing_modules():
+    assert _is_qualname("os.path.join")
+    assert not _is_qualname("non.existent.module")
+    assert not _is_qualname("join")
+    with patch("importlib.import_module") as mock_import:
+        assert not _is_qualname("non.existent.module")
+        mock_import.assert_not_called()
+
+
 def test_validate(validator):
     # Test with valid document
     document = {"pipelines": [{"steps": ["os.path.join"]}]}
@@ -47,3 +72,51 @@ def test_validate_error_non_qualname(validator):
     assert valid_document is False
     # with pytest.raises(Exception, match="Must be a valid Python qualname"):
     #     validator.validate(pipelines)
+
+
+def test_validate_script_step(validator, tmp_path):
+    script = tmp_path / "my_step.py"
+    script.write_text("def step(data, rule):\n    return data\n")
+    assert validator.validate({"pipelines": [{"steps": [f"script://{script}:step"]}]})
+    assert not validator.validate({"pipelines": [{"steps": [f"script://{tmp_path}/missing.py:step"]}]})
+
+
+@pytest.mark.parametrize(
+    "value, valid",
+    [
+        ("/path/to/output", True),
+        ("~/output", True),
+        ("/path/to/*/output", False),
+        (["/path/to/output"], False),
+    ],
+)
+def test_validate_is_directory(value, valid):
+    validator = DirectoryAwareValidator({"output_directory": {"is_directory": True}})
+    assert validator.validate({"output_directory": value}) is valid
+
+
+@pytest.mark.parametrize(
+    "value, valid",
+    [
+        ("days since 1850-01-01", True),
+        ("hours since 2000-01-01 00:00:00", True),
+        ("days after 1850-01-01", False),
+    ],
+)
+def test_validate_time_units(value, valid):
+    validator = RuleSectionValidator({"time_units": {"type": "string", "check_with": "time_units"}})
+    assert validator.validate({"time_units": value}) is valid
+
+
+def test_config_validator_checks_all_sections():
+    validator = get_config_validator()
+    document = {
+        "general": {"cmor_version": "CMIP6"},
+        "pipelines": [{"name": "test", "steps": ["os.path.join"]}],
+    }
+    assert validator.validate(document), validator.errors
+
+    document["pipelines"][0]["steps"].append("non.existent.module")
+    document["general"]["cmor_version"] = "CMIP5"
+    assert not validator.validate(document)
+    assert set(validator.errors) == {"general", "pipelines"}
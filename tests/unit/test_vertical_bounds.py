@@ -3,7 +3,7 @@
 import numpy as np
 import xarray as xr
 
-from pycmor.std_lib.bounds import add_vertical_bounds
+from pycmor.std_lib.bounds import add_vertical_bounds, calculate_vertical_bounds
 
 
 def test_add_vertical_bounds_pressure_levels():
@@ -366,3 +366,74 @@ def test_add_vertical_bounds_multiple_vertical_coords():
 
     assert ds_with_bounds["plev_bnds"].shape == (5, 2)
     assert ds_with_bounds["depth_bnds"].shape == (3, 2)
+
+
+def test_add_vertical_bounds_multidimensional_depth():
+    """Test bounds for a depth coordinate that varies in space (e.g. terrain-following levels)."""
+    depth = np.array(
+        [
+            [0.0, 10.0, 30.0, 60.0],
+            [0.0, 5.0, 15.0, 30.0],
+            [0.0, 20.0, 60.0, 120.0],
+        ]
+    )
+
+    ds = xr.Dataset(
+        {
+            "thetao": (["ncells", "lev"], np.random.rand(3, 4)),
+        },
+        coords={
+            "depth": (["ncells", "lev"], depth),
+        },
+    )
+
+    ds_with_bounds = add_vertical_bounds(ds)
+
+    assert "depth_bnds" in ds_with_bounds.data_vars
+    assert ds_with_bounds["depth_bnds"].dims == ("ncells", "lev", "bnds")
+    assert ds_with_bounds["depth"].attrs["bounds"] == "depth_bnds"
+
+    # Each column gets the same bounds as its 1D equivalent
+    for i in range(depth.shape[0]):
+        column = add_vertical_bounds(xr.Dataset(coords={"depth": depth[i]}))
+        np.testing.assert_allclose(ds_with_bounds["depth_bnds"][i].values, column["depth_bnds"].values)
+
+
+def test_vertical_bounds_custom_vertical_dim_name():
+    """Test that custom vertical names are used both by add_vertical_bounds and calculate_vertical_bounds."""
+    depth = np.array([[0.0, 10.0, 30.0], [0.0, 20.0, 60.0]])
+    ds = xr.Dataset(coords={"zdepth": (["ncells", "nz"], depth)})
+
+    ds_with_bounds = add_vertical_bounds(ds, vertical_coord_names=["zdepth", "nz"])
+    assert ds_with_bounds["zdepth_bnds"].dims == ("ncells", "nz", "bnds")
+
+    bounds = calculate_vertical_bounds(ds["zdepth"], vertical_coord_names=["zdepth", "nz"])
+    assert bounds.dims == ("ncells", "nz", "bnds")
+    np.testing.assert_allclose(bounds.values, ds_with_bounds["zdepth_bnds"].values)
+
+
+def test_add_vertical_bounds_multidimensional_dask():
+    """Test that N-D vertical bounds stay lazy for dask-backed coordinates."""
+    depth = np.tile(np.array([0.0, 10.0, 30.0, 60.0]), (2, 5, 1))
+
+    ds = xr.Dataset(coords={"depth": (["time", "ncells", "lev"], depth)}).chunk({"time": 1})
+
+    ds_with_bounds = add_vertical_bounds(ds)
+
+    bounds = ds_with_bounds["depth_bnds"]
+    assert bounds.chunks is not None
+    assert bounds.shape == (2, 5, 4, 2)
+    np.testing.assert_allclose(bounds.values[0, 0, :, 0], [-5.0, 5.0, 20.0, 45.0])
+    np.testing.assert_allclose(bounds.values[0, 0, :, 1], [5.0, 20.0, 45.0, 75.0])
+
+
+def test_add_vertical_bounds_dask_chunked_along_levels():
+    """Test that a vertical dimension split over several dask chunks is supported."""
+    depth = np.tile(np.array([0.0, 10.0, 30.0, 60.0]), (2, 5, 1))
+
+    ds = xr.Dataset(coords={"depth": (["time", "ncells", "lev"], depth)}).chunk({"lev": 2})
+
+    bounds = add_vertical_bounds(ds)["depth_bnds"]
+    assert bounds.chunks is not None
+    np.testing.assert_allclose(bounds.values[1, 4, :, 0], [-5.0, 5.0, 20.0, 45.0])
+    np.testing.assert_allclose(bounds.values[1, 4, :, 1], [5.0, 20.0, 45.0, 75.0])